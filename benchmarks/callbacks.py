@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Trade callback latency: ``dataframe.iloc[-1].squeeze()`` vs helpers/snapshot.py
+
+Usage: python benchmarks/callbacks.py [calls]
+
+Uses a real freqtrade ``DataProvider`` holding an analysed dataframe of ~40
+mixed-dtype columns and measures the per-call latency of the last-candle
+lookup done by ``custom_stoploss``/``custom_exit``:
+
+* live: the same candle is read on every throttle tick
+* backtest: the candle advances on every call, one trade per candle
+"""
+
+import sys
+import time
+
+import numpy as np
+from freqtrade.data.dataprovider import DataProvider
+from freqtrade.enums import CandleType, RunMode
+
+from common import generate_candles
+from helpers.snapshot import LastCandleMixin
+
+PAIR = 'BTC/USDT'
+TIMEFRAME = '5m'
+
+
+class Strategy(LastCandleMixin):
+    timeframe = TIMEFRAME
+
+    def __init__(self, dp):
+        self.dp = dp
+
+    def legacy_last_candle(self, pair):
+        dataframe, _ = self.dp.get_analyzed_dataframe(pair, self.timeframe)
+        return dataframe.iloc[-1].squeeze()
+
+
+def analysed_dataframe(candles):
+    dataframe = generate_candles(candles, timeframe=TIMEFRAME)
+    rng = np.random.default_rng(0)
+    for i in range(24):
+        dataframe[f'indicator_{i}'] = rng.normal(size=candles)
+    for i in range(8):
+        dataframe[f'flag_{i}'] = rng.random(candles) > 0.5
+    dataframe['enter_long'] = 0
+    dataframe['exit_long'] = 0
+    return dataframe
+
+
+def callback(lookup):
+    """What a typical custom_stoploss does: read two columns of the last candle"""
+    def run(pair):
+        candle = lookup(pair)
+        return candle['indicator_3'] < 0 or candle['flag_1']
+    return run
+
+
+def per_call(func, calls, before=None):
+    start = time.perf_counter()
+    for i in range(calls):
+        if before:
+            before(i)
+        func(PAIR)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main(calls=20_000):
+    dataframe = analysed_dataframe(calls + 1000)
+
+    live = DataProvider({'runmode': RunMode.DRY_RUN}, None)
+    live._set_cached_df(PAIR, TIMEFRAME, dataframe, CandleType.SPOT)
+    strategy = Strategy(live)
+    assert strategy.last_candle(PAIR)['indicator_3'] == strategy.legacy_last_candle(PAIR)['indicator_3']
+    print(f'{len(dataframe.columns)} columns, {calls} calls')
+    print(f"live     iloc[-1]   : {per_call(callback(strategy.legacy_last_candle), calls):8.2f} us/call")
+    print(f"live     last_candle: {per_call(callback(strategy.last_candle), calls):8.2f} us/call")
+
+    backtest = DataProvider({'runmode': RunMode.BACKTEST}, None)
+    backtest._set_cached_df(PAIR, TIMEFRAME, dataframe, CandleType.SPOT)
+    strategy = Strategy(backtest)
+
+    def advance(i):
+        backtest._set_dataframe_max_index(PAIR, 1000 + i)
+
+    # A few trades open at once: every candle is read by 3 callbacks
+    def three_trades(pair):
+        for _ in range(3):
+            run(pair)
+
+    for name, lookup in (('iloc[-1]   ', strategy.legacy_last_candle),
+                         ('last_candle', strategy.last_candle)):
+        run = callback(lookup)
+        print(f"backtest {name}: {per_call(three_trades, calls, advance) / 3:8.2f} us/call (3 trades)")
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+OTT regression check: original FOttStrategy.ott() vs helpers/ott.py
+
+Usage: python benchmarks/check_ott.py [candles]
+
+The legacy implementation below is the original code with two pandas
+compatibility fixes: ``DataFrame.iat`` writes for the VAR recursion (chained
+``df[col].iat[i] = ...`` assignments are no-ops under copy-on-write) and a
+float initial short stop. It runs in O(N^2), so the fixture is kept small
+(a few seconds). The fixture contains flat-price runs to exercise the
+ratchet ties. Timings are in benchmarks/ott.py.
+"""
+
+import sys
+
+import numpy as np
+from pandas import DataFrame
+
+from common import generate_candles
+from helpers.ott import ott
+
+
+def legacy_ott(dataframe: DataFrame):
+    df = dataframe.copy()
+
+    pds = 2
+    percent = 1.4
+    alpha = 2 / (pds + 1)
+
+    df["ud1"] = np.where(
+        df["close"] > df["close"].shift(1), (df["close"] - df["close"].shift()), 0
+    )
+    df["dd1"] = np.where(
+        df["close"] < df["close"].shift(1), (df["close"].shift() - df["close"]), 0
+    )
+    df["UD"] = df["ud1"].rolling(9).sum()
+    df["DD"] = df["dd1"].rolling(9).sum()
+    df["CMO"] = ((df["UD"] - df["DD"]) / (df["UD"] + df["DD"])).fillna(0).abs()
+
+    df["Var"] = 0.0
+    var, cmo, close = (df.columns.get_loc(c) for c in ["Var", "CMO", "close"])
+    for i in range(pds, len(df)):
+        df.iat[i, var] = (alpha * df.iat[i, cmo] * df.iat[i, close]) + (
+            1 - alpha * df.iat[i, cmo]
+        ) * df.iat[i - 1, var]
+
+    df["fark"] = df["Var"] * percent * 0.01
+    df["newlongstop"] = df["Var"] - df["fark"]
+    df["newshortstop"] = df["Var"] + df["fark"]
+    df["longstop"] = 0.0
+    df["shortstop"] = float(999999999999999999)
+    for i in df["UD"]:
+
+        def maxlongstop():
+            df.loc[(df["newlongstop"] > df["longstop"].shift(1)), "longstop"] = df[
+                "newlongstop"
+            ]
+            df.loc[(df["longstop"].shift(1) > df["newlongstop"]), "longstop"] = df[
+                "longstop"
+            ].shift(1)
+
+            return df["longstop"]
+
+        def minshortstop():
+            df.loc[
+                (df["newshortstop"] < df["shortstop"].shift(1)), "shortstop"
+            ] = df["newshortstop"]
+            df.loc[
+                (df["shortstop"].shift(1) < df["newshortstop"]), "shortstop"
+            ] = df["shortstop"].shift(1)
+
+            return df["shortstop"]
+
+        df["longstop"] = np.where(
+            ((df["Var"] > df["longstop"].shift(1))),
+            maxlongstop(),
+            df["newlongstop"],
+        )
+
+        df["shortstop"] = np.where(
+            ((df["Var"] < df["shortstop"].shift(1))),
+            minshortstop(),
+            df["newshortstop"],
+        )
+
+    df["xlongstop"] = np.where(
+        (
+            (df["Var"].shift(1) > df["longstop"].shift(1))
+            & (df["Var"] < df["longstop"].shift(1))
+        ),
+        1,
+        0,
+    )
+
+    df["xshortstop"] = np.where(
+        (
+            (df["Var"].shift(1) < df["shortstop"].shift(1))
+            & (df["Var"] > df["shortstop"].shift(1))
+        ),
+        1,
+        0,
+    )
+
+    df["trend"] = 0
+    df["dir"] = 0
+    for i in df["UD"]:
+        df["trend"] = np.where(
+            ((df["xshortstop"] == 1)),
+            1,
+            (np.where((df["xlongstop"] == 1), -1, df["trend"].shift(1))),
+        )
+
+        df["dir"] = np.where(
+            ((df["xshortstop"] == 1)),
+            1,
+            (np.where((df["xlongstop"] == 1), -1, df["dir"].shift(1).fillna(1))),
+        )
+
+    df["MT"] = np.where(df["dir"] == 1, df["longstop"], df["shortstop"])
+    df["OTT"] = np.where(
+        df["Var"] > df["MT"],
+        (df["MT"] * (200 + percent) / 200),
+        (df["MT"] * (200 - percent) / 200),
+    )
+    df["OTT"] = df["OTT"].shift(2)
+
+    return DataFrame(index=df.index, data={"OTT": df["OTT"], "VAR": df["Var"]})
+
+
+def fixture(candles, seed=7):
+    """Random walk with a few flat-price runs"""
+    dataframe = generate_candles(candles, seed=seed)
+    close = dataframe["close"].to_numpy().copy()
+    rng = np.random.default_rng(seed)
+    for start in rng.integers(20, candles - 40, max(1, candles // 100)):
+        close[start:start + rng.integers(5, 30)] = close[start]
+    dataframe["close"] = close
+    return dataframe
+
+
+def check(candles=400):
+    """Assert that ``ott`` reproduces the legacy OTT and VAR bit for bit on ``fixture(candles)``"""
+    dataframe = fixture(candles)
+    expected = legacy_ott(dataframe)
+    result = ott(dataframe)
+    for column in ("OTT", "VAR"):
+        assert np.array_equal(
+            expected[column].to_numpy(), result[column].to_numpy(), equal_nan=True
+        ), f"{column} differs"
+
+
+if __name__ == "__main__":
+    check(*(int(arg) for arg in sys.argv[1:]))
+    print("OTT and VAR bit-identical to the legacy implementation")
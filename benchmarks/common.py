@@ -0,0 +1,45 @@
+"""
+Shared setup for the benchmark scripts.
+
+Puts ``user_data/strategies`` on ``sys.path`` so ``helpers`` can be imported
+and generates reproducible random-walk OHLCV candles.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+STRATEGY_DIR = Path(__file__).resolve().parent.parent / "user_data" / "strategies"
+sys.path.insert(0, str(STRATEGY_DIR))
+
+
+def generate_candles(count=100_000, timeframe="1h", seed=42, start="2020-01-01"):
+    """Generate a freqtrade-style OHLCV dataframe with a random-walk close"""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, count)))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    spread = np.abs(rng.normal(0, 0.005, (2, count)))
+    return pd.DataFrame(
+        {
+            "date": pd.date_range(start, periods=count, freq=pd.Timedelta(timeframe), tz="UTC"),
+            "open": open_,
+            "high": np.maximum(open_, close) * (1 + spread[0]),
+            "low": np.minimum(open_, close) * (1 - spread[1]),
+            "close": close,
+            "volume": rng.uniform(1000, 5000, count),
+        }
+    )
+
+
+def timed(func, *args, repeat=1, **kwargs):
+    """Return (best wall time in seconds, result of the last call)"""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best, result
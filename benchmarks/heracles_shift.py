@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Heracles hyperopt epoch: ``shift().div()`` vs ``Heracles.shift_ratio``
+
+Usage: python benchmarks/heracles_shift.py [epochs] [candles]
+
+Runs Heracles' entry condition once per epoch with random shifts in their hyperopt range (0-20) and
+random buy_div bounds on two years of 5m candles (210240 by default), as
+hyperopt does, once with the original pandas ``shift().div().between()`` and
+once with the ratio of offset views into the padded columns kept per pair.
+Both entry signals are compared for every epoch.
+"""
+
+import sys
+
+import numpy as np
+import ta
+
+from common import generate_candles, timed
+from Heracles import Heracles
+
+PAIR = 'BTC/USDT'
+# Largest shift of the hyperopt space
+PADDING = max(Heracles.buy_indicator_shift.high, Heracles.buy_crossed_indicator_shift.high)
+
+
+def analysed_dataframe(candles):
+    dataframe = generate_candles(candles, timeframe='5m')
+    dataframe['volatility_kcw'] = ta.volatility.keltner_channel_wband(
+        dataframe['high'], dataframe['low'], dataframe['close'],
+        window=20, window_atr=10, fillna=False, original_version=True)
+    dataframe['volatility_dcp'] = ta.volatility.donchian_channel_pband(
+        dataframe['high'], dataframe['low'], dataframe['close'], window=10, offset=0, fillna=False)
+    return dataframe
+
+
+def pandas_entry(dataframe, shift, crossed_shift, low, high):
+    d = dataframe['volatility_dcp'].shift(shift).div(dataframe['volatility_kcw'].shift(crossed_shift))
+    return d.between(low, high).to_numpy()
+
+
+def padded_entry(dataframe, shift, crossed_shift, low, high):
+    d = Heracles.shift_ratio(dataframe, PAIR, 'volatility_dcp', 'volatility_kcw', shift, crossed_shift, PADDING)
+    return (d >= low) & (d <= high)
+
+
+def epochs(dataframe, parameters, entry):
+    return [entry(dataframe, *epoch) for epoch in parameters]
+
+
+def main(count=500, candles=2 * 365 * 288):
+    dataframe = analysed_dataframe(candles)
+    rng = np.random.default_rng(0)
+    bounds = np.sort(np.round(rng.uniform(0, 1, (count, 2)), 2), axis=1)
+    parameters = [(int(a), int(b), low, high)
+                  for a, b, (low, high) in zip(rng.integers(0, PADDING + 1, count), rng.integers(0, PADDING + 1, count), bounds)]
+
+    pandas_time, expected = timed(epochs, dataframe, parameters, pandas_entry)
+    padded_time, result = timed(epochs, dataframe, parameters, padded_entry)
+    for epoch, before, after in zip(parameters, expected, result):
+        assert np.array_equal(before, after), f'entry signal differs for {epoch}'
+
+    print(f'{candles} candles, {count} epochs (shifts 0-20)')
+    print(f'shift().div()  : {pandas_time / count * 1000:8.2f} ms/epoch')
+    print(f'shift_ratio    : {padded_time / count * 1000:8.2f} ms/epoch')
+    print(f'speedup        : {pandas_time / padded_time:8.1f}x (signals identical)')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
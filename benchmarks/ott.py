@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+OTT benchmark: original FOttStrategy.ott() vs helpers/ott.py
+
+Usage: python benchmarks/ott.py [candles] [large]
+
+Times the legacy implementation (O(N^2), see benchmarks/check_ott.py, which
+also holds the fast regression check) against the engine on the same
+fixture, then the engine alone on a large fixture.
+"""
+
+import sys
+
+import numpy as np
+
+from check_ott import fixture, legacy_ott
+from common import timed
+from helpers.ott import ott
+
+
+def main(candles=1000, large=20_000):
+    dataframe = fixture(candles)
+    ott(dataframe.head(50))  # warm up the numba compilation
+
+    legacy_time, expected = timed(legacy_ott, dataframe)
+    engine_time, result = timed(ott, dataframe, repeat=5)
+    for column in ("OTT", "VAR"):
+        assert np.array_equal(
+            expected[column].to_numpy(), result[column].to_numpy(), equal_nan=True
+        ), f"{column} differs"
+
+    print(f"{candles} candles (outputs bit-identical)")
+    print(f"legacy : {legacy_time * 1000:10.1f} ms")
+    print(f"engine : {engine_time * 1000:10.1f} ms")
+
+    large_time, _ = timed(ott, fixture(large), repeat=5)
+    print(f"engine on {large} candles: {large_time * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
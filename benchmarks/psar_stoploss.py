@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+CustomStoplossWithPSAR in a backtest replay: dataprovider last candle vs helpers/asof.py
+
+Usage: python benchmarks/psar_stoploss.py [candles]
+
+Analyses one pair with the strategy, caches it in a backtest-mode
+``DataProvider`` and replays every candle as freqtrade's backtesting does:
+for the candle opened at ``current_time`` the dataprovider serves the
+analysed rows up to the previous (closed) candle. ``custom_stoploss`` is
+compared on every candle with the dataprovider lookup of the previous
+version, once with the pair in ``SAR_STORE`` (backtesting) and once without
+(hyperopt workers, which never run ``populate_indicators``).
+"""
+
+import sys
+import time
+
+import numpy as np
+from freqtrade.data.dataprovider import DataProvider
+from freqtrade.enums import CandleType, RunMode
+
+from common import generate_candles
+from CustomStoplossWithPSAR import SAR_STORE, CustomStoplossWithPSAR
+
+PAIR = 'BTC/USDT'
+CONFIG = {'runmode': RunMode.BACKTEST, 'stake_currency': 'USDT', 'dry_run': True,
+          'trading_mode': 'spot', 'margin_mode': 'isolated'}
+
+
+def legacy_stoploss(strategy, current_rate):
+    """The previous version: SAR of the dataprovider's last analysed candle"""
+    last_candle = strategy.last_candle(PAIR)
+    return (current_rate - last_candle['sar']) / current_rate - 1
+
+
+def replay(strategy, dataframe, stoploss):
+    """Stoploss of a trade on every candle after the startup period, as backtesting slices the dataprovider"""
+    dates = dataframe['date'].dt.to_pydatetime()
+    rates = dataframe['open'].to_numpy()
+    results = []
+    start = time.perf_counter()
+    for position in range(strategy.startup_candle_count + 1, len(dataframe)):
+        strategy.dp._set_dataframe_max_index(PAIR, position)
+        results.append(stoploss(dates[position], rates[position]))
+    return (time.perf_counter() - start) / len(results) * 1e6, np.array(results)
+
+
+def main(candles=6000):
+    strategy = CustomStoplossWithPSAR(CONFIG)
+    strategy.dp = DataProvider(CONFIG, None)
+    dataframe = strategy.populate_indicators(generate_candles(candles, timeframe=strategy.timeframe),
+                                             {'pair': PAIR})
+    strategy.dp._set_cached_df(PAIR, strategy.timeframe, dataframe, CandleType.SPOT)
+
+    trade = object()
+    legacy_time, expected = replay(strategy, dataframe, lambda when, rate: legacy_stoploss(strategy, rate))
+    store_time, stored = replay(strategy, dataframe, lambda when, rate: strategy.custom_stoploss(
+        PAIR, trade, when, rate, 0.0))
+    SAR_STORE._series.pop(PAIR)
+    worker_time, worker = replay(strategy, dataframe, lambda when, rate: strategy.custom_stoploss(
+        PAIR, trade, when, rate, 0.0))
+
+    valid = ~np.isnan(expected)
+    for name, result in (('SAR_STORE', stored), ('dataprovider fallback', worker)):
+        assert np.array_equal(result[valid], expected[valid]), f'{name}: stoploss differs from the previous version'
+        assert (result[~valid] == 1).all(), f'{name}: stoploss set without a SAR'
+
+    print(f'{len(expected)} candles replayed, stoploss identical to the previous version')
+    print(f'dataprovider last candle: {legacy_time:6.2f} us/call')
+    print(f'SAR_STORE.asof          : {store_time:6.2f} us/call')
+    print(f'dataprovider fallback   : {worker_time:6.2f} us/call')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Supertrend benchmark: original per-row implementation vs helpers/supertrend.py
+
+Usage: python benchmarks/supertrend.py [candles]
+
+The legacy implementation is reproduced below with ``DataFrame.iat`` writes
+(the original chained ``df[col].iat[i] = ...`` assignments are no-ops under
+pandas copy-on-write). Both outputs are compared for bit-identity.
+"""
+
+import sys
+
+import numpy as np
+import talib.abstract as ta
+from pandas import DataFrame
+
+from common import generate_candles, timed
+from helpers.supertrend import supertrend, supertrend_grid
+
+
+def legacy_supertrend(dataframe: DataFrame, multiplier, period):
+    df = dataframe.copy()
+
+    df['TR'] = ta.TRANGE(df)
+    df['ATR'] = ta.SMA(df['TR'], period)
+
+    df['basic_ub'] = (df['high'] + df['low']) / 2 + multiplier * df['ATR']
+    df['basic_lb'] = (df['high'] + df['low']) / 2 - multiplier * df['ATR']
+
+    df['final_ub'] = 0.00
+    df['final_lb'] = 0.00
+    df['ST'] = 0.00
+    close, basic_ub, basic_lb, final_ub, final_lb, st = (
+        df.columns.get_loc(c) for c in ['close', 'basic_ub', 'basic_lb', 'final_ub', 'final_lb', 'ST']
+    )
+    for i in range(period, len(df)):
+        df.iat[i, final_ub] = df.iat[i, basic_ub] if df.iat[i, basic_ub] < df.iat[i - 1, final_ub] or df.iat[i - 1, close] > df.iat[i - 1, final_ub] else df.iat[i - 1, final_ub]
+        df.iat[i, final_lb] = df.iat[i, basic_lb] if df.iat[i, basic_lb] > df.iat[i - 1, final_lb] or df.iat[i - 1, close] < df.iat[i - 1, final_lb] else df.iat[i - 1, final_lb]
+
+    for i in range(period, len(df)):
+        df.iat[i, st] = df.iat[i, final_ub] if df.iat[i - 1, st] == df.iat[i - 1, final_ub] and df.iat[i, close] <= df.iat[i, final_ub] else \
+                        df.iat[i, final_lb] if df.iat[i - 1, st] == df.iat[i - 1, final_ub] and df.iat[i, close] >  df.iat[i, final_ub] else \
+                        df.iat[i, final_lb] if df.iat[i - 1, st] == df.iat[i - 1, final_lb] and df.iat[i, close] >= df.iat[i, final_lb] else \
+                        df.iat[i, final_ub] if df.iat[i - 1, st] == df.iat[i - 1, final_lb] and df.iat[i, close] <  df.iat[i, final_lb] else 0.00
+
+    df['STX'] = np.where((df['ST'] > 0.00), np.where((df['close'] < df['ST']), 'down', 'up'), '')
+    df.fillna(0, inplace=True)
+
+    return DataFrame(index=df.index, data={'ST': df['ST'], 'STX': df['STX']})
+
+
+def per_pair(dataframe, combinations):
+    return [supertrend(dataframe, multiplier, period)['STX'] for multiplier, period in combinations]
+
+
+def grid(dataframe, multipliers=range(1, 8), periods=range(7, 22)):
+    """Hyperopt load of the Supertrend strategy: 6 x (7 multipliers x 15 periods) columns"""
+    combinations = [(m, p) for _ in range(6) for m in multipliers for p in periods]
+    loop_time, expected = timed(per_pair, dataframe, combinations)
+    grid_time, (keys, _, stx) = timed(supertrend_grid, dataframe, combinations)
+
+    rows = {key: row for row, key in enumerate(keys)}
+    for (multiplier, period), column in zip(combinations, expected):
+        assert (stx[rows[(multiplier, period)]] == column.to_numpy()).all(), 'grid STX differs'
+
+    print(f'{len(combinations)} columns ({len(keys)} distinct pairs)')
+    print(f'per pair: {loop_time * 1000:10.1f} ms')
+    print(f'grid    : {grid_time * 1000:10.1f} ms')
+
+
+def main(candles=100_000):
+    dataframe = generate_candles(candles)
+    multiplier, period = 3, 10
+
+    # Warm up the numba compilation outside the measurement
+    supertrend(dataframe.head(100), multiplier, period)
+
+    legacy_time, expected = timed(legacy_supertrend, dataframe, multiplier, period)
+    engine_time, result = timed(supertrend, dataframe, multiplier, period, repeat=5)
+
+    assert np.array_equal(expected['ST'].to_numpy(), result['ST'].to_numpy()), 'ST differs'
+    assert (expected['STX'].to_numpy() == result['STX'].to_numpy()).all(), 'STX differs'
+
+    print(f'{candles} candles, multiplier={multiplier}, period={period}')
+    print(f'legacy : {legacy_time * 1000:10.1f} ms')
+    print(f'engine : {engine_time * 1000:10.1f} ms')
+    print(f'speedup: {legacy_time / engine_time:10.0f}x (outputs bit-identical)')
+    grid(dataframe)
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
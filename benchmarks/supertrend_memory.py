@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Supertrend STX memory benchmark: string labels vs int8 direction codes
+
+Usage: python benchmarks/supertrend_memory.py [candles]
+
+Builds the 630 hyperopt columns of the Supertrend strategy in both encodings
+and reports the dataframe footprint per pair, extrapolated to two years of
+5m candles.
+"""
+
+import sys
+
+from pandas import DataFrame
+
+from common import generate_candles
+from helpers.supertrend import DOWN, UP, supertrend_columns
+
+TWO_YEARS_5M = 2 * 365 * 24 * 12
+
+
+def hyperopt_columns(multipliers=range(1, 8), periods=range(7, 22)):
+    return {
+        f'supertrend_{index}_{side}_{multiplier}_{period}': (multiplier, period)
+        for side in ('buy', 'sell')
+        for index in (1, 2, 3)
+        for multiplier in multipliers
+        for period in periods
+    }
+
+
+def frame_bytes(frame: DataFrame):
+    return int(frame.memory_usage(index=False, deep=True).sum())
+
+
+def main(candles=20_000):
+    dataframe = generate_candles(candles, timeframe='5m')
+    columns = hyperopt_columns()
+
+    # Object dtype is what the strategies stored before (pandas < 3 default for strings)
+    labels = supertrend_columns(dataframe, columns).astype(object)
+    codes = supertrend_columns(dataframe, columns, encoding='int8')
+
+    assert ((labels == 'up').to_numpy() == (codes == UP).to_numpy()).all()
+    assert ((labels == 'down').to_numpy() == (codes == DOWN).to_numpy()).all()
+
+    scale = TWO_YEARS_5M / candles
+    for name, frame in (('str labels', labels), ('int8 codes', codes)):
+        size = frame_bytes(frame)
+        print(f'{name}: {size / 2 ** 20:10.1f} MiB for {candles} candles, '
+              f'{size * scale / 2 ** 30:6.2f} GiB per pair for 2 years of 5m')
+    print(f'reduction: {frame_bytes(labels) / frame_bytes(codes):.0f}x ({len(columns)} columns)')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Grid search of entry signals: one ``populate_entry_trend`` per point vs helpers/sweep.py
+
+Usage: python benchmarks/sweep.py [days]
+
+Evaluates the entry signals of PowerTower, Diamond, HourBasedStrategy, mabStra
+and Zeus over a grid of their buy parameters on two years of candles of each
+strategy's timeframe, once point by point as hyperopt epochs do (set the
+parameter values, ``populate_entry_trend`` on a copy of the analysed
+dataframe) and once as a (points x candles) matrix with ``sweep``. Both
+signals are compared for every point.
+"""
+
+import importlib
+import sys
+
+import numpy as np
+from freqtrade.enums import RunMode
+
+from common import generate_candles, timed
+from helpers.sweep import analyse, sweep
+
+CONFIG = {'runmode': RunMode.BACKTEST, 'stake_currency': 'USDT', 'dry_run': True,
+          'trading_mode': 'spot', 'margin_mode': 'isolated'}
+KEYS = ['open', 'high', 'low', 'close', 'volume']
+
+GRIDS = {
+    'PowerTower': {'buy_pow': np.round(np.linspace(0.95, 1.05, 101), 3)},
+    'Diamond': {'buy_fast_key': KEYS, 'buy_slow_key': KEYS, 'buy_horizontal_push': range(11),
+                'buy_vertical_push': [0.98, 0.99, 1.0, 1.01, 1.02]},
+    'HourBasedStrategy': {'buy_hour_min': range(25), 'buy_hour_max': range(25)},
+    'mabStra': {'buy_mojo_ma_timeframe': range(2, 100, 12), 'buy_fast_ma_timeframe': range(2, 100, 12),
+                'buy_slow_ma_timeframe': range(2, 100, 24), 'buy_div_min': [0.95, 0.99],
+                'buy_div_max': [1.01, 1.05]},
+    'lookahead_bias.Zeus': {'buy_cat': ['>R', '=R', '<R'], 'buy_real': np.round(np.linspace(0.001, 0.999, 200), 4)},
+}
+
+
+def strategy(module):
+    cls = getattr(importlib.import_module(module), module.split('.')[-1])
+    instance = cls(CONFIG)
+    for name, value in {**getattr(cls, 'buy_params', {}), **getattr(cls, 'sell_params', {})}.items():
+        getattr(instance, name).value = value
+    return instance
+
+
+def per_point(instance, dataframe, points):
+    """One hyperopt epoch per point: set the values, populate the entry signals"""
+    signals = []
+    for i in range(len(next(iter(points.values())))):
+        for name, values in points.items():
+            getattr(instance, name).value = values[i].item()
+        result = instance.populate_entry_trend(dataframe.copy(), {'pair': 'BTC/USDT'})
+        signals.append((result['enter_long'] == 1).to_numpy() if 'enter_long' in result else
+                       np.zeros(len(result), dtype=bool))
+    return np.array(signals)
+
+
+def main(days=2 * 365):
+    for module, grid in GRIDS.items():
+        instance = strategy(module)
+        candles = days * 1440 // {'5m': 5, '1h': 60, '4h': 240}[instance.timeframe]
+        dataframe = generate_candles(candles, timeframe=instance.timeframe)
+        if module == 'PowerTower':
+            # Prices around 1 so that powers near 1 give signals
+            dataframe[['open', 'high', 'low', 'close']] /= 100
+        dataframe = analyse(instance, dataframe, {'pair': 'BTC/USDT'}, grid)
+
+        sweep_time, (points, signals) = timed(sweep, instance, dataframe, grid)
+        loop_time, expected = timed(per_point, instance, dataframe, points)
+        assert np.array_equal(expected, signals), f'{module}: entry signals differ'
+
+        count = len(signals)
+        print(f'{module.split(".")[-1]:18s} {count:5d} points x {candles:6d} {instance.timeframe:3s} candles: '
+              f'per point {loop_time:7.2f} s, sweep {sweep_time:6.3f} s '
+              f'({loop_time / sweep_time:6.1f}x, {signals.mean():.1%} entries)')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Strategy005 hyperopt epoch: ``volume.rolling(window).mean()`` vs helpers/rolling.py
+
+Usage: python benchmarks/volume_mean.py [epochs] [candles]
+
+Runs the entry condition of Strategy005 once per epoch with a random volume
+window in 50-300 on two years of 5m candles (210240 by default), as hyperopt
+does, once with the original rolling mean and once with ``window_mean`` read
+from the cumulative sum stored by ``populate_indicators``. Both entry signals
+are compared for every epoch.
+"""
+
+import sys
+
+import numpy as np
+import talib.abstract as ta
+from pandas import DataFrame
+
+from common import generate_candles, timed
+from helpers.rolling import cumulative_sum, window_mean
+
+
+def analysed_dataframe(candles):
+    dataframe = generate_candles(candles, timeframe='5m')
+    dataframe['rsi'] = ta.RSI(dataframe)
+    rsi = 0.1 * (dataframe['rsi'] - 50)
+    dataframe['fisher_rsi_norma'] = 50 * ((np.exp(2 * rsi) - 1) / (np.exp(2 * rsi) + 1) + 1)
+    stoch_fast = ta.STOCHF(dataframe)
+    dataframe['fastd'] = stoch_fast['fastd']
+    dataframe['fastk'] = stoch_fast['fastk']
+    dataframe['sma'] = ta.SMA(dataframe, timeperiod=40)
+    dataframe['volume_sum'] = cumulative_sum(dataframe['volume'])
+    return dataframe
+
+
+def entry(dataframe: DataFrame, volume_mean):
+    """Strategy005's entry condition with the hyperopt parameters at their defaults"""
+    return (
+        (dataframe['close'] > 0.00000200) &
+        (dataframe['volume'] > volume_mean * 4) &
+        (dataframe['close'] < dataframe['sma']) &
+        (dataframe['fastd'] > dataframe['fastk']) &
+        (dataframe['rsi'] > 30) &
+        (dataframe['fastd'] > 30) &
+        (dataframe['fisher_rsi_norma'] < 30)
+    ).to_numpy()
+
+
+def epochs(dataframe, windows, mean):
+    return [entry(dataframe, mean(dataframe, window)) for window in windows]
+
+
+def rolling(dataframe, window):
+    return dataframe['volume'].rolling(window).mean()
+
+
+def cumulative(dataframe, window):
+    return window_mean(dataframe['volume_sum'], window)
+
+
+def main(count=200, candles=2 * 365 * 288):
+    dataframe = analysed_dataframe(candles)
+    windows = np.random.default_rng(0).integers(50, 301, count).tolist()
+
+    rolling_time, expected = timed(epochs, dataframe, windows, rolling)
+    cumulative_time, result = timed(epochs, dataframe, windows, cumulative)
+    rolling_mean_time, _ = timed(lambda: [rolling(dataframe, window) for window in windows])
+    cumulative_mean_time, _ = timed(lambda: [cumulative(dataframe, window) for window in windows])
+
+    for window, before, after in zip(windows, expected, result):
+        assert np.array_equal(before, after), f'entry signal differs for window {window}'
+    worst = max(
+        np.nanmax(np.abs(cumulative(dataframe, window) / rolling(dataframe, window).to_numpy() - 1))
+        for window in sorted(set(windows))[:10]
+    )
+
+    print(f'{candles} candles, {count} epochs (window 50-300)')
+    print(f'rolling mean   : {rolling_time / count * 1000:8.2f} ms/epoch '
+          f'({rolling_mean_time / count * 1000:.2f} ms in the volume mean)')
+    print(f'cumulative sum : {cumulative_time / count * 1000:8.2f} ms/epoch '
+          f'({cumulative_mean_time / count * 1000:.2f} ms in the volume mean)')
+    print(f'speedup        : {rolling_time / cumulative_time:8.1f}x (signals identical, '
+          f'means within {worst:.1e} relative)')
+
+
+if __name__ == '__main__':
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -6,7 +6,8 @@
 # freqtrade hyperopt --hyperopt GodStraHo --hyperopt-loss SharpeHyperOptLossDaily --spaces all --strategy GodStra --config config.json -e 100
 
 # --- Do not remove these libs ---
-from functools import reduce
+import sys
+from pathlib import Path
 from typing import Any, Callable, Dict, List
 
 import numpy as np  # noqa
@@ -19,9 +20,10 @@ from freqtrade.optimize.hyperopt_interface import IHyperOpt
 # --------------------------------
 # Add your lib to import here
 # import talib.abstract as ta  # noqa
-from ta import add_all_ta_features
-from ta.utils import dropna
-import freqtrade.vendor.qtpylib.indicators as qtpylib
+
+sys.path.append(str(Path(__file__).resolve().parent.parent / 'strategies'))
+from helpers.conditions import compile_conditions  # noqa: E402
+from helpers.ta_features import ta_features  # noqa: E402
 # this is your trading strategy DNA Size
 # you can change it and see the results...
 DNA_SIZE = 1
@@ -81,45 +83,24 @@ class GodStraHo(IHyperOpt):
             """
             Buy strategy Hyperopt will build and use.
             """
-            conditions = []
-            # GUARDS AND TRENDS
-            for i in range(DNA_SIZE):
-
-                OPR = params[f'buy-oper-{i}']
-                IND = params[f'buy-indicator-{i}']
-                CRS = params[f'buy-cross-{i}']
-                INT = params[f'buy-int-{i}']
-                REAL = params[f'buy-real-{i}']
-                DFIND = dataframe[IND]
-                DFCRS = dataframe[CRS]
-
-                if OPR == ">":
-                    conditions.append(DFIND > DFCRS)
-                elif OPR == "=":
-                    conditions.append(np.isclose(DFIND, DFCRS))
-                elif OPR == "<":
-                    conditions.append(DFIND < DFCRS)
-                elif OPR == "CA":
-                    conditions.append(qtpylib.crossed_above(DFIND, DFCRS))
-                elif OPR == "CB":
-                    conditions.append(qtpylib.crossed_below(DFIND, DFCRS))
-                elif OPR == ">I":
-                    conditions.append(DFIND > INT)
-                elif OPR == "=I":
-                    conditions.append(DFIND == INT)
-                elif OPR == "<I":
-                    conditions.append(DFIND < INT)
-                elif OPR == ">R":
-                    conditions.append(DFIND > REAL)
-                elif OPR == "=R":
-                    conditions.append(np.isclose(DFIND, REAL))
-                elif OPR == "<R":
-                    conditions.append(DFIND < REAL)
-
-            if conditions:
-                dataframe.loc[
-                    reduce(lambda x, y: x & y, conditions),
-                    'enter_long'] = 1
+            # D: Disabled genes add no condition
+            clauses = tuple(
+                (
+                    params[f'buy-oper-{i}'],
+                    params[f'buy-indicator-{i}'],
+                    params[f'buy-cross-{i}'],
+                    params[f'buy-real-{i}'],
+                    params[f'buy-int-{i}'],
+                )
+                for i in range(DNA_SIZE)
+                if params[f'buy-oper-{i}'] != 'D'
+            )
+            # Only the features of this epoch are computed (once per pair),
+            # see helpers/ta_features.py and helpers/conditions.py
+            plan = compile_conditions(clauses)
+            if plan:
+                mask = plan.evaluate(ta_features(dataframe, plan.columns, metadata['pair']))
+                dataframe.loc[mask, 'enter_long'] = 1
 
             return dataframe
 
@@ -153,46 +134,24 @@ class GodStraHo(IHyperOpt):
             """
             Sell strategy Hyperopt will build and use.
             """
-            conditions = []
-
-            # GUARDS AND TRENDS
-            for i in range(DNA_SIZE):
-
-                OPR = params[f'sell-oper-{i}']
-                IND = params[f'sell-indicator-{i}']
-                CRS = params[f'sell-cross-{i}']
-                INT = params[f'sell-int-{i}']
-                REAL = params[f'sell-real-{i}']
-                DFIND = dataframe[IND]
-                DFCRS = dataframe[CRS]
-
-                if OPR == ">":
-                    conditions.append(DFIND > DFCRS)
-                elif OPR == "=":
-                    conditions.append(np.isclose(DFIND, DFCRS))
-                elif OPR == "<":
-                    conditions.append(DFIND < DFCRS)
-                elif OPR == "CA":
-                    conditions.append(qtpylib.crossed_above(DFIND, DFCRS))
-                elif OPR == "CB":
-                    conditions.append(qtpylib.crossed_below(DFIND, DFCRS))
-                elif OPR == ">I":
-                    conditions.append(DFIND > INT)
-                elif OPR == "=I":
-                    conditions.append(DFIND == INT)
-                elif OPR == "<I":
-                    conditions.append(DFIND < INT)
-                elif OPR == ">R":
-                    conditions.append(DFIND > REAL)
-                elif OPR == "=R":
-                    conditions.append(np.isclose(DFIND, REAL))
-                elif OPR == "<R":
-                    conditions.append(DFIND < REAL)
-
-            if conditions:
-                dataframe.loc[
-                    reduce(lambda x, y: x & y, conditions),
-                    'exit_long']=1
+            # D: Disabled genes add no condition
+            clauses = tuple(
+                (
+                    params[f'sell-oper-{i}'],
+                    params[f'sell-indicator-{i}'],
+                    params[f'sell-cross-{i}'],
+                    params[f'sell-real-{i}'],
+                    params[f'sell-int-{i}'],
+                )
+                for i in range(DNA_SIZE)
+                if params[f'sell-oper-{i}'] != 'D'
+            )
+            # Only the features of this epoch are computed (once per pair),
+            # see helpers/ta_features.py and helpers/conditions.py
+            plan = compile_conditions(clauses)
+            if plan:
+                mask = plan.evaluate(ta_features(dataframe, plan.columns, metadata['pair']))
+                dataframe.loc[mask, 'exit_long'] = 1
 
             return dataframe
 
@@ -6,6 +6,8 @@ from pandas import DataFrame
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 from freqtrade.strategy import IStrategy, CategoricalParameter, DecimalParameter, IntParameter, RealParameter
 
+from helpers.ma_bank import MaBlock, ema_block
+
 __author__ = "Robert Roman"
 __copyright__ = "Free For Use"
 __license__ = "MIT"
@@ -90,15 +92,15 @@ class Bandtastic(IStrategy):
         dataframe['bb_middleband4'] = bollinger4['mid']
         dataframe['bb_upperband4'] = bollinger4['upper']
         # Build EMA rows - combine all ranges to a single set to avoid duplicate calculations.
-        for period in set(
-                list(self.buy_fastema.range)
-                + list(self.buy_slowema.range)
-                + list(self.sell_fastema.range)
-                + list(self.sell_slowema.range)
-            ):
-            dataframe[f'EMA_{period}'] = ta.EMA(dataframe, timeperiod=period)
-
-        return dataframe
+        periods = set(
+            list(self.buy_fastema.range)
+            + list(self.buy_slowema.range)
+            + list(self.sell_fastema.range)
+            + list(self.sell_slowema.range)
+        )
+        emas = MaBlock(ema_block, dataframe['close'], {f'EMA_{period}': period for period in sorted(periods)})
+
+        return pd.concat([dataframe, emas.frame(dataframe)], axis=1)
 
     def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         conditions = []
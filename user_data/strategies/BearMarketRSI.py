@@ -17,9 +17,10 @@ import talib.abstract as ta
 import pandas_ta as pta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 from technical.util import resample_to_interval, resampled_merge
+from helpers.snapshot import LastCandleMixin
 
 
-class BearMarketRSI(IStrategy):
+class BearMarketRSI(LastCandleMixin, IStrategy):
     """
     Bear Market RSI Strategy
     
@@ -178,8 +179,7 @@ class BearMarketRSI(IStrategy):
         """
         
         # If we're in a strong bear market, use tighter stops
-        dataframe, _ = self.dp.get_analyzed_dataframe(pair, self.timeframe)
-        last_candle = dataframe.iloc[-1].squeeze()
+        last_candle = self.last_candle(pair)
         
         # Tighter stop in strong bear markets
         if last_candle['rsi'] < 25:
@@ -22,8 +22,14 @@ import talib.abstract as ta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 from freqtrade.strategy import merge_informative_pair
 
+from helpers.breadth import RsiBreadth
+from helpers.snapshot import LastCandleMixin
 
-class CryptoKMLMSwitcherAdvanced(IStrategy):
+# Leader RSIs shared by all pairs, computed once per candle, see helpers/breadth.py
+RSI_BREADTH = RsiBreadth()
+
+
+class CryptoKMLMSwitcherAdvanced(LastCandleMixin, IStrategy):
     """
     Crypto KMLM Switcher Strategy - ADVANCED VERSION
     
@@ -107,20 +113,23 @@ class CryptoKMLMSwitcherAdvanced(IStrategy):
     enable_trade_timeout = False  # Set to False to disable timeout exits
     trade_timeout_hours = 72  # Hours before timeout exit (higher = longer trades)
 
+    # The pairs we monitor (like the original strategy)
+    leader_pairs = [
+        'BTC/USDT',  # Market leader (like SPY in original)
+        'ETH/USDT',  # Tech leader (like QQQE in original)
+        'BNB/USDT',  # Exchange token (like XLK in original)
+        'ADA/USDT',  # Volatile alt (like TECL in original)
+        'DOT/USDT',  # Volatile alt (like SOXL in original)
+        'SOL/USDT',  # Volatile alt (like SPXL in original)
+        #'AVAX/USDT',  # Volatile alt (like LABU in original), binance us does not trade this
+    ]
+
     def informative_pairs(self):
         """
         Define additional, informative pair/interval combinations to be cached from the exchange.
         These represent the "market leaders" that drive switching decisions.
         """
-        return [
-            ("BTC/USDT", "5m"),  # Market leader (like SPY in original)
-            ("ETH/USDT", "5m"),  # Tech leader (like QQQE in original)
-            ("BNB/USDT", "5m"),  # Exchange token (like XLK in original)
-            ("ADA/USDT", "5m"),  # Volatile alt (like TECL in original)
-            ("DOT/USDT", "5m"),  # Volatile alt (like SOXL in original)
-            ("SOL/USDT", "5m"),  # Volatile alt (like SPXL in original)
-            #("AVAX/USDT", "5m"), # Volatile alt (like LABU in original)
-        ]
+        return [(pair, self.timeframe) for pair in self.leader_pairs]
 
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
@@ -161,9 +170,36 @@ class CryptoKMLMSwitcherAdvanced(IStrategy):
         
         # Market regime detection
         dataframe['market_regime'] = self.detect_market_regime(dataframe)
+
+        # Leader RSIs as aligned columns (rsi_btc_leader, ...)
+        dataframe = self.merge_leader_rsis(dataframe, metadata)
         
         return dataframe
 
+    def merge_leader_rsis(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        """
+        Merge the RSI of every leader pair (other than this one) candle by candle.
+        Each leader's RSI is computed once and shared by all traded pairs.
+        """
+        window = self.rsi_window.value
+        leaders = {}
+        for pair in self.leader_pairs:
+            if pair == metadata['pair']:
+                continue
+            informative = self.dp.get_pair_dataframe(pair, self.timeframe)
+            if informative is None or informative.empty:
+                continue
+            rsi = RSI_BREADTH.series(pair, self.timeframe, informative, window)
+            leaders[f"rsi_{pair.split('/')[0].lower()}"] = pd.Series(rsi, index=informative['date'])
+        if not leaders:
+            return dataframe
+
+        # One merge for all leaders: rsi_btc_leader, rsi_eth_leader, ...
+        informative = pd.concat(leaders, axis=1).rename_axis('date').reset_index()
+        dataframe = merge_informative_pair(dataframe, informative, self.timeframe, self.timeframe,
+                                           ffill=True, append_timeframe=False, suffix='leader')
+        return dataframe.drop(columns='date_leader')
+
     def detect_market_regime(self, dataframe: DataFrame) -> pd.Series:
         """
         Detect market regime based on RSI and volatility
@@ -194,20 +230,15 @@ class CryptoKMLMSwitcherAdvanced(IStrategy):
         """
         market_rsis = {}
         
-        # Define the pairs we want to monitor (like the original strategy)
-        pairs_to_monitor = [
-            'BTC/USDT', 'ETH/USDT', 'BNB/USDT', 
-            'ADA/USDT', 'DOT/USDT', 'SOL/USDT'#, 'AVAX/USDT' binance us does not trade this
-        ]
-        
-        for pair in pairs_to_monitor:
+        for pair in self.leader_pairs:
             if pair != metadata['pair']:
                 try:
                     pair_dataframe = self.dp.get_pair_dataframe(pair, self.timeframe)
                     if pair_dataframe is not None and len(pair_dataframe) > 0:
-                        # Calculate RSI for this pair
-                        pair_rsi = ta.RSI(pair_dataframe, timeperiod=self.rsi_window.value)
-                        market_rsis[pair] = pair_rsi.iloc[-1] if not pd.isna(pair_rsi.iloc[-1]) else 50
+                        # RSI of this pair on its last candle
+                        pair_rsi = RSI_BREADTH.get(
+                            pair, self.timeframe, pair_dataframe, self.rsi_window.value)
+                        market_rsis[pair] = pair_rsi if not pd.isna(pair_rsi) else 50
                 except:
                     market_rsis[pair] = 50  # Default if data unavailable
         
@@ -240,18 +271,17 @@ class CryptoKMLMSwitcherAdvanced(IStrategy):
 
     def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
-        Implements the sophisticated nested decision tree from the original strategy
+        Implements the sophisticated nested decision tree from the original strategy,
+        candle by candle over the merged leader RSIs
         """
         
-        # Get market RSI values
-        market_rsis = self.get_market_rsis(metadata)
-        
         # Initialize entry conditions
         long_conditions = []
         
-        # Count overbought/oversold pairs for better decision making
-        overbought_count = sum(1 for rsi in market_rsis.values() if rsi > self.rsi_overbought_high.value)
-        oversold_count = sum(1 for rsi in market_rsis.values() if rsi < self.rsi_oversold.value)
+        # Count overbought/oversold pairs for better decision making (missing RSIs count as neither)
+        leader_rsis = dataframe.filter(like='_leader')
+        overbought_count = (leader_rsis > self.rsi_overbought_high.value).sum(axis=1)
+        oversold_count = (leader_rsis < self.rsi_oversold.value).sum(axis=1)
         
         # Base entry condition - always check for oversold RSI
         base_condition = (
@@ -268,37 +298,33 @@ class CryptoKMLMSwitcherAdvanced(IStrategy):
         # Entry logic with pair-specific conditions
         if metadata['pair'] in ['BTC/USDT', 'ETH/USDT', 'BNB/USDT']:
             # Stable pairs - enter in defensive mode or when oversold
-            if defensive_mode:
-                # Defensive entry for stable pairs
-                defensive_entry = (
-                    base_condition &
-                    (dataframe['volume_ratio'] > 0.8)  # Relaxed from 1.1 to 0.8
-                )
-                long_conditions.append(defensive_entry)
-            else:
-                # Normal entry for stable pairs
-                stable_entry = (
-                    base_condition &
-                    (dataframe['volume_ratio'] > 0.9)  # Relaxed from 1.2 to 0.9
-                )
-                long_conditions.append(stable_entry)
+            # Defensive entry for stable pairs
+            defensive_entry = (
+                base_condition & defensive_mode &
+                (dataframe['volume_ratio'] > 0.8)  # Relaxed from 1.1 to 0.8
+            )
+            long_conditions.append(defensive_entry)
+            # Normal entry for stable pairs
+            stable_entry = (
+                base_condition & ~defensive_mode &
+                (dataframe['volume_ratio'] > 0.9)  # Relaxed from 1.2 to 0.9
+            )
+            long_conditions.append(stable_entry)
         
         elif metadata['pair'] in ['ADA/USDT', 'DOT/USDT', 'SOL/USDT']:
             # Volatile pairs - enter in aggressive mode or when oversold
-            if aggressive_mode:
-                # Aggressive entry for volatile pairs
-                aggressive_entry = (
-                    base_condition &
-                    (dataframe['volume_ratio'] > 1.0)  # Relaxed from volume_multiplier to 1.0
-                )
-                long_conditions.append(aggressive_entry)
-            else:
-                # Normal entry for volatile pairs
-                volatile_entry = (
-                    base_condition &
-                    (dataframe['volume_ratio'] > 1.0)  # Relaxed from 1.3 to 1.0
-                )
-                long_conditions.append(volatile_entry)
+            # Aggressive entry for volatile pairs
+            aggressive_entry = (
+                base_condition & aggressive_mode &
+                (dataframe['volume_ratio'] > 1.0)  # Relaxed from volume_multiplier to 1.0
+            )
+            long_conditions.append(aggressive_entry)
+            # Normal entry for volatile pairs
+            volatile_entry = (
+                base_condition & ~aggressive_mode &
+                (dataframe['volume_ratio'] > 1.0)  # Relaxed from 1.3 to 1.0
+            )
+            long_conditions.append(volatile_entry)
         
         else:
             # Other pairs - balanced approach
@@ -349,12 +375,12 @@ class CryptoKMLMSwitcherAdvanced(IStrategy):
         """
         Custom stoploss logic based on market regime
         """
-        # Get the dataframe for this pair
-        dataframe, _ = self.dp.get_analyzed_dataframe(pair, self.timeframe)
+        # Get the last analyzed candle for this pair
+        last_candle = self.last_candle(pair)
         
-        if len(dataframe) > 0:
+        if last_candle is not None:
             # Get current market regime
-            current_regime = dataframe['market_regime'].iloc[-1]
+            current_regime = last_candle['market_regime']
             
             # Adjust stoploss based on regime
             if current_regime == 0:  # Defensive
@@ -378,12 +404,12 @@ class CryptoKMLMSwitcherAdvanced(IStrategy):
                 return "timeout_exit"
             return None
         
-        # Get the dataframe for this pair
-        dataframe, _ = self.dp.get_analyzed_dataframe(pair, self.timeframe)
+        # Get the last analyzed candle for this pair
+        last_candle = self.last_candle(pair)
         
-        if len(dataframe) > 0:
+        if last_candle is not None:
             # Exit if market regime changes significantly
-            current_regime = dataframe['market_regime'].iloc[-1]
+            current_regime = last_candle['market_regime']
             
             # Exit defensive positions when market becomes aggressive (higher profit threshold)
             if current_regime == 2 and current_profit > self.regime_exit_profit_threshold:
@@ -5,17 +5,23 @@ import numpy as np  # noqa
 import pandas as pd  # noqa
 from pandas import DataFrame
 
+from freqtrade.exchange import timeframe_to_minutes
 from freqtrade.strategy import IStrategy
 
 # --------------------------------
 # Add your lib to import here
 import talib.abstract as ta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
-from datetime import datetime
+from datetime import datetime, timedelta
 from freqtrade.persistence import Trade
+from helpers.asof import AsofStore
+from helpers.snapshot import LastCandleMixin
 
+# Per-pair views of the analysed dates and SAR, see helpers/asof.py
+SAR_STORE = AsofStore('sar')
 
-class CustomStoplossWithPSAR(IStrategy):
+
+class CustomStoplossWithPSAR(LastCandleMixin, IStrategy):
     """
     this is an example class, implementing a PSAR based trailing stop loss
     you are supposed to take the `custom_stoploss()` and `populate_indicators()`
@@ -26,7 +32,6 @@ class CustomStoplossWithPSAR(IStrategy):
     INTERFACE_VERSION: int = 3
     timeframe = '1h'
     stoploss = -0.2
-    custom_info = {}
     use_custom_stoploss = True
 
     startup_candle_count = 199
@@ -35,19 +40,22 @@ class CustomStoplossWithPSAR(IStrategy):
                         current_rate: float, current_profit: float, **kwargs) -> float:
 
         result = 1
-        if self.custom_info and pair in self.custom_info and trade:
-            # using current_time directly (like below) will only work in backtesting/hyperopt.
-            # in live / dry-run, it'll be really the current time
-            relative_sl = None
-            if self.dp:
-                # so we need to get analyzed_dataframe from dp
-                dataframe, _ = self.dp.get_analyzed_dataframe(pair=pair, timeframe=self.timeframe)
-                # only use .iat[-1] in callback methods, never in "populate_*" methods.
+        if trade:
+            relative_sl = np.nan
+            if pair in SAR_STORE:
+                # SAR of the last closed candle before current_time (binary search over the stored dates):
+                # current_time is the open of the simulated candle in backtesting/hyperopt and the current
+                # time in live / dry-run, the last closed candle opened at least one timeframe earlier
+                last_closed = current_time - timedelta(minutes=timeframe_to_minutes(self.timeframe))
+                relative_sl = SAR_STORE.asof(pair, last_closed)
+            elif self.dp:
+                # not analyzed in this process (e.g. hyperopt workers), use the last analyzed candle from dp
+                # only use the last candle in callback methods, never in "populate_*" methods.
                 # see: https://www.freqtrade.io/en/latest/strategy-customization/#common-mistakes-when-developing-strategies
-                last_candle = dataframe.iloc[-1].squeeze()
-                relative_sl = last_candle['sar']
+                last_candle = self.last_candle(pair)
+                relative_sl = last_candle['sar'] if last_candle is not None else np.nan
 
-            if (relative_sl is not None):
+            if not np.isnan(relative_sl):
                 # print("custom_stoploss().relative_sl: {}".format(relative_sl))
                 # calculate new_stoploss relative to current_rate
                 new_stoploss = (current_rate - relative_sl) / current_rate
@@ -59,8 +67,7 @@ class CustomStoplossWithPSAR(IStrategy):
 
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         dataframe['sar'] = ta.SAR(dataframe)
-        if self.dp.runmode.value in ('backtest', 'hyperopt'):
-            self.custom_info[metadata['pair']] = dataframe[['date', 'sar']].copy().set_index('date')
+        SAR_STORE.update(metadata['pair'], dataframe)
 
         # all "normal" indicators:
         # e.g.
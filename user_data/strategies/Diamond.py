@@ -46,8 +46,7 @@ from pandas import DataFrame
 
 # Add your lib to import here
 import talib.abstract as ta
-from functools import reduce
-import freqtrade.vendor.qtpylib.indicators as qtpylib
+from helpers.sweep import columns, crossed_above, crossed_below, on_points, shifted
 
 
 class Diamond(IStrategy):
@@ -123,33 +122,31 @@ class Diamond(IStrategy):
         return dataframe
 
     def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        conditions = []
-        conditions.append(
-            qtpylib.crossed_above
-            (
-                dataframe[self.buy_fast_key.value].shift(self.buy_horizontal_push.value),
-                dataframe[self.buy_slow_key.value] * self.buy_vertical_push.value
-            )
-        )
-
-        if conditions:
-            dataframe.loc[
-                reduce(lambda x, y: x & y, conditions),
-                'enter_long']=1
+        dataframe.loc[
+            self.sweep_entry(dataframe, self.buy_fast_key.value, self.buy_slow_key.value,
+                             self.buy_horizontal_push.value, self.buy_vertical_push.value),
+            'enter_long'] = 1
 
         return dataframe
 
     def populate_exit_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        conditions = []
-        conditions.append(
-            qtpylib.crossed_below
-            (
-                dataframe[self.sell_fast_key.value].shift(self.sell_horizontal_push.value),
-                dataframe[self.sell_slow_key.value] * self.sell_vertical_push.value
-            )
-        )
-        if conditions:
-            dataframe.loc[
-                reduce(lambda x, y: x & y, conditions),
-                'exit_long']=1
+        dataframe.loc[
+            self.sweep_exit(dataframe, self.sell_fast_key.value, self.sell_slow_key.value,
+                            self.sell_horizontal_push.value, self.sell_vertical_push.value),
+            'exit_long'] = 1
         return dataframe
+
+    # Parameters are single values or one value per grid point, see helpers/sweep.py
+    def sweep_entry(self, dataframe: DataFrame, buy_fast_key, buy_slow_key,
+                    buy_horizontal_push, buy_vertical_push):
+        return crossed_above(
+            shifted(columns(dataframe, buy_fast_key), buy_horizontal_push),
+            columns(dataframe, buy_slow_key) * on_points(buy_vertical_push)
+        )
+
+    def sweep_exit(self, dataframe: DataFrame, sell_fast_key, sell_slow_key,
+                   sell_horizontal_push, sell_vertical_push):
+        return crossed_below(
+            shifted(columns(dataframe, sell_fast_key), sell_horizontal_push),
+            columns(dataframe, sell_slow_key) * on_points(sell_vertical_push)
+        )
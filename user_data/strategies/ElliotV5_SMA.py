@@ -2,7 +2,7 @@
 from freqtrade.strategy.interface import IStrategy
 from typing import Dict, List
 from functools import reduce
-from pandas import DataFrame
+from pandas import DataFrame, concat
 
 import talib.abstract as ta
 import numpy as np
@@ -14,6 +14,8 @@ from freqtrade.persistence import Trade
 from freqtrade.strategy import stoploss_from_open, merge_informative_pair, DecimalParameter, IntParameter, CategoricalParameter
 import technical.indicators as ftt
 
+from helpers.ma_bank import MaBlock, ema_block
+
 buy_params = {
       "base_nb_candles_buy": 25,
       "ewo_high": 2.5,
@@ -245,11 +247,9 @@ class ElliotV5_SMA(IStrategy):
 
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
 
-        for val in self.base_nb_candles_buy.range:
-            dataframe[f'ma_buy_{val}'] = ta.EMA(dataframe, timeperiod=val)
-
-        for val in self.base_nb_candles_sell.range:
-            dataframe[f'ma_sell_{val}'] = ta.EMA(dataframe, timeperiod=val)
+        columns = {f'ma_buy_{val}': val for val in self.base_nb_candles_buy.range}
+        columns.update({f'ma_sell_{val}': val for val in self.base_nb_candles_sell.range})
+        dataframe = concat([dataframe, MaBlock(ema_block, dataframe['close'], columns).frame(dataframe)], axis=1)
 
         dataframe['EWO'] = EWO(dataframe, self.fast_ewo, self.slow_ewo)
 
@@ -14,6 +14,8 @@ import freqtrade.vendor.qtpylib.indicators as qtpylib
 from datetime import datetime
 from freqtrade.persistence import Trade
 
+from helpers.asof import AsofSeries
+
 import logging
 logger = logging.getLogger(__name__)
 
@@ -49,15 +51,17 @@ class FixedRiskRewardLoss(IStrategy):
             # using current_time/open_date directly via custom_info_pair[trade.open_daten]
             # would only work in backtesting/hyperopt.
             # in live/dry-run, we have to search for nearest row before it
-            open_date_mask = custom_info_pair.index.unique().get_loc(trade.open_date_utc, method='ffill')
-            open_df = custom_info_pair.iloc[open_date_mask]
+            # (binary search, done once per trade)
+            trade_key = (trade.id, trade.open_date_utc)
+            initial_sl_abs = custom_info_pair.memo.get(trade_key)
+            if initial_sl_abs is None:
+                initial_sl_abs = custom_info_pair.asof(trade.open_date_utc)
+                custom_info_pair.memo[trade_key] = initial_sl_abs
 
             # trade might be open too long for us to find opening candle
-            if(len(open_df) != 1):
+            if np.isnan(initial_sl_abs):
                 return -1 # won't update current stoploss
 
-            initial_sl_abs = open_df['stoploss_rate']
-
             # calculate initial stoploss at open_date
             initial_sl = initial_sl_abs/current_rate-1
 
@@ -90,7 +94,7 @@ class FixedRiskRewardLoss(IStrategy):
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         dataframe['atr'] = ta.ATR(dataframe)
         dataframe['stoploss_rate'] = dataframe['close']-(dataframe['atr']*2)
-        self.custom_info[metadata['pair']] = dataframe[['date', 'stoploss_rate']].copy().set_index('date')
+        self.custom_info[metadata['pair']] = AsofSeries.from_dataframe(dataframe, 'stoploss_rate')
 
         # all "normal" indicators:
         # e.g.
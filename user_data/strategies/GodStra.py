@@ -11,10 +11,7 @@
 
 # --- Do not remove these libs ---
 import logging
-from functools import reduce
 
-import freqtrade.vendor.qtpylib.indicators as qtpylib
-import numpy as np
 # Add your lib to import here
 # import talib.abstract as ta
 import pandas as pd
@@ -22,9 +19,11 @@ from freqtrade.strategy import IStrategy
 from numpy.lib import math
 from pandas import DataFrame
 # import talib.abstract as ta
-from ta import add_all_ta_features
 from ta.utils import dropna
 
+from helpers.conditions import compile_conditions
+from helpers.ta_features import ta_features
+
 # --------------------------------
 
 
@@ -85,94 +84,43 @@ class GodStra(IStrategy):
             return -1  # in case if the parameter somehow doesn't have index
         return len({int_from_str(digit) for digit in dct.keys()})
 
+    def clauses(self, space: str) -> tuple:
+        params = getattr(self, f'{space}_params')
+        # D: Disabled genes add no condition
+        return tuple(
+            (
+                params[f'{space}-oper-{i}'],
+                params[f'{space}-indicator-{i}'],
+                params[f'{space}-cross-{i}'],
+                params[f'{space}-real-{i}'],
+                params[f'{space}-int-{i}'],
+            )
+            for i in range(self.dna_size(params))
+            if params[f'{space}-oper-{i}'] != 'D'
+        )
+
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        # Add all ta features
+        # Only the ta features the genome reads, see helpers/ta_features.py
         dataframe = dropna(dataframe)
-        dataframe = add_all_ta_features(
-            dataframe, open="open", high="high", low="low", close="close", volume="volume",
-            fillna=True)
-        # dataframe.to_csv("df.csv", index=True)
-        return dataframe
+        names = [name for space in ('buy', 'sell')
+                 for clause in self.clauses(space) for name in clause[1:3]]
+        features = ta_features(dataframe, names, metadata['pair'])
+        return dataframe.assign(**features)
 
     def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        conditions = list()
-        # /5: Cuz We have 5 Group of variables inside buy_param
-        for i in range(self.dna_size(self.buy_params)):
-
-            OPR = self.buy_params[f'buy-oper-{i}']
-            IND = self.buy_params[f'buy-indicator-{i}']
-            CRS = self.buy_params[f'buy-cross-{i}']
-            INT = self.buy_params[f'buy-int-{i}']
-            REAL = self.buy_params[f'buy-real-{i}']
-            DFIND = dataframe[IND]
-            DFCRS = dataframe[CRS]
-
-            if OPR == ">":
-                conditions.append(DFIND > DFCRS)
-            elif OPR == "=":
-                conditions.append(np.isclose(DFIND, DFCRS))
-            elif OPR == "<":
-                conditions.append(DFIND < DFCRS)
-            elif OPR == "CA":
-                conditions.append(qtpylib.crossed_above(DFIND, DFCRS))
-            elif OPR == "CB":
-                conditions.append(qtpylib.crossed_below(DFIND, DFCRS))
-            elif OPR == ">I":
-                conditions.append(DFIND > INT)
-            elif OPR == "=I":
-                conditions.append(DFIND == INT)
-            elif OPR == "<I":
-                conditions.append(DFIND < INT)
-            elif OPR == ">R":
-                conditions.append(DFIND > REAL)
-            elif OPR == "=R":
-                conditions.append(np.isclose(DFIND, REAL))
-            elif OPR == "<R":
-                conditions.append(DFIND < REAL)
-
-        print(conditions)
-        dataframe.loc[
-            reduce(lambda x, y: x & y, conditions),
-            'enter_long'] = 1
+        # Compiled once per parameter set, see helpers/conditions.py
+        plan = compile_conditions(self.clauses('buy'))
+        if plan:
+            mask = plan.evaluate(ta_features(dataframe, plan.columns, metadata['pair']))
+            dataframe.loc[mask, 'enter_long'] = 1
 
         return dataframe
 
     def populate_exit_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        conditions = list()
-        for i in range(self.dna_size(self.sell_params)):
-            OPR = self.sell_params[f'sell-oper-{i}']
-            IND = self.sell_params[f'sell-indicator-{i}']
-            CRS = self.sell_params[f'sell-cross-{i}']
-            INT = self.sell_params[f'sell-int-{i}']
-            REAL = self.sell_params[f'sell-real-{i}']
-            DFIND = dataframe[IND]
-            DFCRS = dataframe[CRS]
-
-            if OPR == ">":
-                conditions.append(DFIND > DFCRS)
-            elif OPR == "=":
-                conditions.append(np.isclose(DFIND, DFCRS))
-            elif OPR == "<":
-                conditions.append(DFIND < DFCRS)
-            elif OPR == "CA":
-                conditions.append(qtpylib.crossed_above(DFIND, DFCRS))
-            elif OPR == "CB":
-                conditions.append(qtpylib.crossed_below(DFIND, DFCRS))
-            elif OPR == ">I":
-                conditions.append(DFIND > INT)
-            elif OPR == "=I":
-                conditions.append(DFIND == INT)
-            elif OPR == "<I":
-                conditions.append(DFIND < INT)
-            elif OPR == ">R":
-                conditions.append(DFIND > REAL)
-            elif OPR == "=R":
-                conditions.append(np.isclose(DFIND, REAL))
-            elif OPR == "<R":
-                conditions.append(DFIND < REAL)
-
-        dataframe.loc[
-            reduce(lambda x, y: x & y, conditions),
-            'exit_long'] = 1
+        # Compiled once per parameter set, see helpers/conditions.py
+        plan = compile_conditions(self.clauses('sell'))
+        if plan:
+            mask = plan.evaluate(ta_features(dataframe, plan.columns, metadata['pair']))
+            dataframe.loc[mask, 'exit_long'] = 1
 
         return dataframe
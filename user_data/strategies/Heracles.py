@@ -24,6 +24,11 @@ import freqtrade.vendor.qtpylib.indicators as qtpylib
 from functools import reduce
 import numpy as np
 
+from helpers.fingerprint import fingerprint
+
+# NaN padded copies of the shifted columns, one slot per pair replaced when its candles change
+PADDED_COLUMNS = {}
+
 
 class Heracles(IStrategy):
     ########################################## RESULT PASTE PLACE ##########################################
@@ -96,15 +101,14 @@ class Heracles(IStrategy):
 
         IND = 'volatility_dcp'
         CRS = 'volatility_kcw'
-        DFIND = dataframe[IND]
-        DFCRS = dataframe[CRS]
 
-        d = DFIND.shift(self.buy_indicator_shift.value).div(
-            DFCRS.shift(self.buy_crossed_indicator_shift.value))
+        d = self.shift_ratio(dataframe, metadata['pair'], IND, CRS,
+                             self.buy_indicator_shift.value, self.buy_crossed_indicator_shift.value,
+                             max(self.buy_indicator_shift.high, self.buy_crossed_indicator_shift.high))
 
-        # print(d.min(), "\t", d.max())
+        # print(np.nanmin(d), "\t", np.nanmax(d))
         conditions.append(
-            d.between(self.buy_div_min.value, self.buy_div_max.value))
+            (d >= self.buy_div_min.value) & (d <= self.buy_div_max.value))
 
         if conditions:
             dataframe.loc[
@@ -113,6 +117,26 @@ class Heracles(IStrategy):
 
         return dataframe
 
+    @staticmethod
+    def shift_ratio(dataframe: DataFrame, pair, indicator, crossed, shift, crossed_shift, padding):
+        """
+        ``dataframe[indicator].shift(shift) / dataframe[crossed].shift(crossed_shift)``,
+        divided from offset views into copies of both columns padded with ``padding`` NaNs
+        (the largest shift), made once per pair and candles (identified by ``fingerprint``).
+        """
+        key = (indicator, crossed, padding, fingerprint(dataframe))
+        slot = PADDED_COLUMNS.get(pair)
+        if slot is None or slot[0] != key:
+            slot = PADDED_COLUMNS[pair] = (key, *(
+                np.concatenate((np.full(padding, np.nan), dataframe[column].to_numpy(dtype=np.float64)))
+                for column in (indicator, crossed)))
+        _, padded_indicator, padded_crossed = slot
+
+        n = len(dataframe)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return (padded_indicator[padding - shift:padding - shift + n]
+                    / padded_crossed[padding - crossed_shift:padding - crossed_shift + n])
+
     def populate_exit_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
         Sell strategy Hyperopt will build and use.
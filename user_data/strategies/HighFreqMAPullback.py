@@ -5,8 +5,9 @@ import freqtrade.vendor.qtpylib.indicators as qtpylib
 import pandas as pd
 from datetime import datetime
 from freqtrade.persistence import Trade
+from helpers.snapshot import LastCandleMixin
 
-class HighFreqMAPullback(IStrategy):
+class HighFreqMAPullback(LastCandleMixin, IStrategy):
     INTERFACE_VERSION = 3
 
     timeframe = '1m'
@@ -61,13 +62,11 @@ class HighFreqMAPullback(IStrategy):
         """
         Custom stoploss - set to recent pullback low
         """
-        # Get current dataframe
-        dataframe, _ = self.dp.get_analyzed_dataframe(pair, self.timeframe)
-        if dataframe is None or len(dataframe) == 0:
+        # Get the last analyzed candle
+        last_candle = self.last_candle(pair)
+        if last_candle is None:
             return -1  # Don't change stoploss
 
-        last_candle = dataframe.iloc[-1].squeeze()
-
         # Calculate relative stoploss based on recent low
         if 'recent_low' in last_candle and not pd.isna(last_candle['recent_low']):
             sl_price = last_candle['recent_low']
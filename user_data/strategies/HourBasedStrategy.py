@@ -10,6 +10,8 @@
 from freqtrade.strategy import IntParameter, IStrategy
 from pandas import DataFrame
 
+from helpers.sweep import on_points
+
 # --------------------------------
 # Add your lib to import here
 # No need to These imports. just for who want to add more conditions:
@@ -88,17 +90,23 @@ class HourBasedStrategy(IStrategy):
 
     def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         dataframe.loc[
-            (
-                (dataframe['hour'].between(self.buy_hour_min.value, self.buy_hour_max.value))
-            ),
+            self.sweep_entry(dataframe, self.buy_hour_min.value, self.buy_hour_max.value),
             'enter_long'] = 1
 
         return dataframe
 
     def populate_exit_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         dataframe.loc[
-            (
-                (dataframe['hour'].between(self.sell_hour_min.value, self.sell_hour_max.value))
-            ),
+            self.sweep_exit(dataframe, self.sell_hour_min.value, self.sell_hour_max.value),
             'exit_long'] = 1
         return dataframe
+
+    # Hours are single values or one value per grid point, see helpers/sweep.py
+    def sweep_entry(self, dataframe: DataFrame, buy_hour_min, buy_hour_max):
+        # Series.between, bounds included
+        hour = dataframe['hour'].to_numpy()
+        return (hour >= on_points(buy_hour_min)) & (hour <= on_points(buy_hour_max))
+
+    def sweep_exit(self, dataframe: DataFrame, sell_hour_min, sell_hour_max):
+        hour = dataframe['hour'].to_numpy()
+        return (hour >= on_points(sell_hour_min)) & (hour <= on_points(sell_hour_max))
@@ -13,6 +13,11 @@ import talib.abstract as ta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 from functools import reduce
 
+from helpers.ma_bank import MaBank
+
+# TEMAs are computed on first use per pair, see helpers/ma_bank.py
+TEMA_BANK = MaBank(ta.TEMA)
+
 
 class MultiMa(IStrategy):
     # 111/2000:     18 trades. 12/4/2 Wins/Draws/Losses. Avg profit   9.72%. Median profit   3.01%. Total profit  733.01234143 USDT (  73.30%). Avg duration 2 days, 18:40:00 min. Objective: 1.67048
@@ -59,15 +64,14 @@ class MultiMa(IStrategy):
     sell_ma_count = IntParameter(1, count_max, default=7, space="sell")
     sell_ma_gap = IntParameter(1, gap_max, default=94, space="sell")
 
-    def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        for count in range(self.count_max):
-            for gap in range(self.gap_max):
-                if count*gap > 1 and count*gap not in dataframe.keys():
-                    dataframe[count*gap] = ta.TEMA(
-                        dataframe, timeperiod=int(count*gap)
-                    )
-        print(" ", metadata['pair'], end="\t\r")
+    def ma_available(self, period: int) -> bool:
+        # Periods count*gap with count < count_max and gap < gap_max (the former columns)
+        return period > 1 and any(
+            period % count == 0 and period // count < self.gap_max
+            for count in range(1, self.count_max)
+        )
 
+    def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         return dataframe
 
     def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
@@ -78,8 +82,11 @@ class MultiMa(IStrategy):
         for ma_count in range(self.buy_ma_count.value):
             key = ma_count*self.buy_ma_gap.value
             past_key = (ma_count-1)*self.buy_ma_gap.value
-            if past_key > 1 and key in dataframe.keys() and past_key in dataframe.keys():
-                conditions.append(dataframe[key] < dataframe[past_key])
+            if past_key > 1 and self.ma_available(key) and self.ma_available(past_key):
+                conditions.append(
+                    TEMA_BANK.get(dataframe, key, metadata['pair'])
+                    < TEMA_BANK.get(dataframe, past_key, metadata['pair'])
+                )
 
         if conditions:
             dataframe.loc[reduce(lambda x, y: x & y, conditions), "enter_long"] = 1
@@ -91,8 +98,11 @@ class MultiMa(IStrategy):
         for ma_count in range(self.sell_ma_count.value):
             key = ma_count*self.sell_ma_gap.value
             past_key = (ma_count-1)*self.sell_ma_gap.value
-            if past_key > 1 and key in dataframe.keys() and past_key in dataframe.keys():
-                conditions.append(dataframe[key] > dataframe[past_key])
+            if past_key > 1 and self.ma_available(key) and self.ma_available(past_key):
+                conditions.append(
+                    TEMA_BANK.get(dataframe, key, metadata['pair'])
+                    > TEMA_BANK.get(dataframe, past_key, metadata['pair'])
+                )
 
         if conditions:
             dataframe.loc[reduce(lambda x, y: x | y, conditions), "exit_long"] = 1
@@ -17,8 +17,10 @@ import pandas_ta as pta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 from technical.util import resample_to_interval, resampled_merge
 
+from helpers.patterns import PatternMixin
 
-class PatternRecognition(IStrategy):
+
+class PatternRecognition(PatternMixin, IStrategy):
     # Pattern Recognition Strategy
     # By: @Mablue
     # freqtrade hyperopt -s PatternRecognition --hyperopt-loss SharpeHyperOptLossDaily -e 1000
@@ -62,15 +64,16 @@ class PatternRecognition(IStrategy):
 
 
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        for pr in self.prs:
-            dataframe[pr] = getattr(ta, pr)(dataframe)
+        # Calculate the pattern recognition indicators needed in this run mode
+        self.patterns(dataframe, metadata)
 
         return dataframe
 
     def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         dataframe.loc[
             (
-                (dataframe[self.buy_pr1.value]==self.buy_vol1.value)
+                self.patterns(dataframe, metadata).equals(
+                    self.buy_pr1.value, self.buy_vol1.value, dataframe)
                 # |(dataframe[self.buy_pr2.value]==self.buy_vol2.value)
             ),
             'enter_long'] = 1
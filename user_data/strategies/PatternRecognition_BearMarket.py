@@ -17,8 +17,10 @@ import pandas_ta as pta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 from technical.util import resample_to_interval, resampled_merge
 
+from helpers.patterns import PatternMixin
 
-class PatternRecognition_BearMarket(IStrategy):
+
+class PatternRecognition_BearMarket(PatternMixin, IStrategy):
     # Pattern Recognition Strategy - BEAR MARKET ONLY VERSION
     # By: @Mablue (Modified for bear market only)
     # This strategy only trades in bear markets and stays out during bull markets
@@ -64,9 +66,8 @@ class PatternRecognition_BearMarket(IStrategy):
     bear_market_rsi_threshold = IntParameter(30, 50, default=40, space="buy")
 
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        # Calculate all pattern recognition indicators
-        for pr in self.prs:
-            dataframe[pr] = getattr(ta, pr)(dataframe)
+        # Calculate the pattern recognition indicators needed in this run mode
+        self.patterns(dataframe, metadata)
 
         # Bear market detection indicators
         # 1. Price below long-term moving average (trend is down)
@@ -103,7 +104,8 @@ class PatternRecognition_BearMarket(IStrategy):
         dataframe.loc[
             (
                 # Original pattern recognition signal
-                (dataframe[self.buy_pr1.value]==self.buy_vol1.value) &
+                self.patterns(dataframe, metadata).equals(
+                    self.buy_pr1.value, self.buy_vol1.value, dataframe) &
                 # ONLY trade in bear market conditions
                 (dataframe['bear_market'] == True)
             ),
@@ -17,8 +17,10 @@ import pandas_ta as pta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 from technical.util import resample_to_interval, resampled_merge
 
+from helpers.patterns import PatternMixin
 
-class PatternRecognition_BearMarket_Simple(IStrategy):
+
+class PatternRecognition_BearMarket_Simple(PatternMixin, IStrategy):
     # Pattern Recognition Strategy - SIMPLE BEAR MARKET VERSION
     # By: @Mablue (Modified for bear market only - SIMPLE VERSION)
     # This strategy only trades in bear markets using simple detection
@@ -63,9 +65,8 @@ class PatternRecognition_BearMarket_Simple(IStrategy):
     bear_market_rsi_threshold = IntParameter(30, 60, default=50, space="buy")
 
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        # Calculate all pattern recognition indicators
-        for pr in self.prs:
-            dataframe[pr] = getattr(ta, pr)(dataframe)
+        # Calculate the pattern recognition indicators needed in this run mode
+        self.patterns(dataframe, metadata)
 
         # Simple bear market detection
         # 1. Price below moving average (trend is down)
@@ -88,7 +89,8 @@ class PatternRecognition_BearMarket_Simple(IStrategy):
         dataframe.loc[
             (
                 # Original pattern recognition signal
-                (dataframe[self.buy_pr1.value]==self.buy_vol1.value) &
+                self.patterns(dataframe, metadata).equals(
+                    self.buy_pr1.value, self.buy_vol1.value, dataframe) &
                 # ONLY trade in bear market conditions
                 (dataframe['bear_market'] == True)
             ),
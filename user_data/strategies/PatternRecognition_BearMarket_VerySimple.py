@@ -17,8 +17,10 @@ import pandas_ta as pta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 from technical.util import resample_to_interval, resampled_merge
 
+from helpers.patterns import PatternMixin
 
-class PatternRecognition_BearMarket_VerySimple(IStrategy):
+
+class PatternRecognition_BearMarket_VerySimple(PatternMixin, IStrategy):
     # Pattern Recognition Strategy - VERY SIMPLE BEAR MARKET VERSION
     # By: @Mablue (Modified for bear market only - VERY SIMPLE VERSION)
     # This strategy only trades when price is below moving average
@@ -61,9 +63,8 @@ class PatternRecognition_BearMarket_VerySimple(IStrategy):
     bear_market_sma_period = IntParameter(50, 200, default=100, space="buy")
 
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        # Calculate all pattern recognition indicators
-        for pr in self.prs:
-            dataframe[pr] = getattr(ta, pr)(dataframe)
+        # Calculate the pattern recognition indicators needed in this run mode
+        self.patterns(dataframe, metadata)
 
         # Very simple bear market detection - just price below moving average
         dataframe['sma'] = ta.SMA(dataframe, timeperiod=self.bear_market_sma_period.value)
@@ -75,7 +76,8 @@ class PatternRecognition_BearMarket_VerySimple(IStrategy):
         dataframe.loc[
             (
                 # Original pattern recognition signal
-                (dataframe[self.buy_pr1.value]==self.buy_vol1.value) &
+                self.patterns(dataframe, metadata).equals(
+                    self.buy_pr1.value, self.buy_vol1.value, dataframe) &
                 # ONLY trade when price is below moving average (bear market)
                 (dataframe['bear_market'] == True)
             ),
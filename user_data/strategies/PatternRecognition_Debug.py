@@ -17,8 +17,10 @@ import pandas_ta as pta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 from technical.util import resample_to_interval, resampled_merge
 
+from helpers.patterns import PatternMixin
 
-class PatternRecognition_Debug(IStrategy):
+
+class PatternRecognition_Debug(PatternMixin, IStrategy):
     # Pattern Recognition Strategy - DEBUG VERSION
     # By: @Mablue (Debug version to understand signals)
     # This strategy shows us when conditions are met
@@ -58,16 +60,15 @@ class PatternRecognition_Debug(IStrategy):
     buy_vol1 = CategoricalParameter([-100,100], default=0, space="buy")
 
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        # Calculate all pattern recognition indicators
-        for pr in self.prs:
-            dataframe[pr] = getattr(ta, pr)(dataframe)
+        # Calculate the pattern recognition indicators needed in this run mode
+        patterns = self.patterns(dataframe, metadata)
 
         # Simple bear market detection
         dataframe['sma_100'] = ta.SMA(dataframe, timeperiod=100)
         dataframe['bear_market'] = dataframe['close'] < dataframe['sma_100']
         
         # Count how many times each condition is met
-        dataframe['pattern_signal'] = (dataframe[self.buy_pr1.value]==self.buy_vol1.value)
+        dataframe['pattern_signal'] = patterns.equals(self.buy_pr1.value, self.buy_vol1.value)
         dataframe['both_conditions'] = dataframe['pattern_signal'] & dataframe['bear_market']
 
         return dataframe
@@ -78,7 +79,8 @@ class PatternRecognition_Debug(IStrategy):
         # 1. Original pattern recognition (no bear market filter)
         dataframe.loc[
             (
-                (dataframe[self.buy_pr1.value]==self.buy_vol1.value)
+                self.patterns(dataframe, metadata).equals(
+                    self.buy_pr1.value, self.buy_vol1.value, dataframe)
             ),
             'enter_long'] = 1
 
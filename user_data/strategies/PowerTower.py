@@ -16,6 +16,7 @@ from freqtrade.strategy import (BooleanParameter, CategoricalParameter, DecimalP
 import talib.abstract as ta
 import pandas_ta as pta
 from technical import qtpylib
+from helpers.sweep import on_points, shifted
 
 
 class PowerTower(IStrategy):
@@ -82,23 +83,25 @@ class PowerTower(IStrategy):
         return dataframe
 
     def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        dataframe.loc[
-            (
-                    (dataframe['close'].shift(0) > dataframe['close'].shift(2) ** self.buy_pow.value) &
-                    (dataframe['close'].shift(1) > dataframe['close'].shift(3) ** self.buy_pow.value) &
-                    (dataframe['close'].shift(2) > dataframe['close'].shift(4) ** self.buy_pow.value)
-
-            ),
-            'enter_long'] = 1
+        dataframe.loc[self.sweep_entry(dataframe, self.buy_pow.value), 'enter_long'] = 1
 
         return dataframe
 
     def populate_exit_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        dataframe.loc[(
-                (dataframe['close'].shift(0) < dataframe['close'].shift(2) ** self.sell_pow.value) |
-                (dataframe['close'].shift(1) < dataframe['close'].shift(3) ** self.sell_pow.value) |
-                (dataframe['close'].shift(2) < dataframe['close'].shift(4) ** self.sell_pow.value)
-        ),
-        'exit_long'] = 1
+        dataframe.loc[self.sweep_exit(dataframe, self.sell_pow.value), 'exit_long'] = 1
 
         return dataframe
+
+    # The power is a single value or one value per grid point, see helpers/sweep.py
+    def sweep_entry(self, dataframe: DataFrame, buy_pow):
+        close = dataframe['close'].to_numpy(dtype=np.float64)
+        powered = close ** on_points(buy_pow)
+        # close.shift(k) > close.shift(k + 2) ** pow is the first condition shifted by k
+        rising = close > shifted(powered, 2)
+        return rising & shifted(rising, 1, False) & shifted(rising, 2, False)
+
+    def sweep_exit(self, dataframe: DataFrame, sell_pow):
+        close = dataframe['close'].to_numpy(dtype=np.float64)
+        powered = close ** on_points(sell_pow)
+        falling = close < shifted(powered, 2)
+        return falling | shifted(falling, 1, False) | shifted(falling, 2, False)
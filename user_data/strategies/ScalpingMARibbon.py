@@ -17,9 +17,10 @@ import talib.abstract as ta
 import pandas_ta as pta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 from technical.util import resample_to_interval, resampled_merge
+from helpers.snapshot import LastCandleMixin
 
 
-class ScalpingMARibbon(IStrategy):
+class ScalpingMARibbon(LastCandleMixin, IStrategy):
     """
     Scalping Moving Average Ribbon Strategy
     
@@ -205,8 +206,7 @@ class ScalpingMARibbon(IStrategy):
         """
         
         # If we're in a strong trend, use tighter stops
-        dataframe, _ = self.dp.get_analyzed_dataframe(pair, self.timeframe)
-        last_candle = dataframe.iloc[-1].squeeze()
+        last_candle = self.last_candle(pair)
         
         # Tighter stop if MAs are compressed
         if last_candle['ma_compressed']:
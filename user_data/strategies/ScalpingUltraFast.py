@@ -17,9 +17,10 @@ import talib.abstract as ta
 import pandas_ta as pta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 from technical.util import resample_to_interval, resampled_merge
+from helpers.snapshot import LastCandleMixin
 
 
-class ScalpingUltraFast(IStrategy):
+class ScalpingUltraFast(LastCandleMixin, IStrategy):
     """
     Ultra-Fast Scalping Strategy
     
@@ -229,8 +230,7 @@ class ScalpingUltraFast(IStrategy):
         """
         
         # Get current market conditions
-        dataframe, _ = self.dp.get_analyzed_dataframe(pair, self.timeframe)
-        last_candle = dataframe.iloc[-1].squeeze()
+        last_candle = self.last_candle(pair)
         
         # Tighter stop if BB squeeze (low volatility)
         if last_candle['bb_squeeze']:
@@ -8,9 +8,10 @@ from pandas import DataFrame
 
 import talib.abstract as ta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
+from helpers.snapshot import LastCandleMixin
 
 
-class Strategy001_custom_exit(IStrategy):
+class Strategy001_custom_exit(LastCandleMixin, IStrategy):
 
     """
     Strategy 001_custom_exit
@@ -129,11 +130,8 @@ class Strategy001_custom_exit(IStrategy):
         Sell only when matching some criteria other than those used to generate the sell signal
         :return: str sell_reason, if any, otherwise None
         """
-        # get dataframe
-        dataframe, _ = self.dp.get_analyzed_dataframe(pair=pair, timeframe=self.timeframe)
-
         # get the current candle
-        current_candle = dataframe.iloc[-1].squeeze()
+        current_candle = self.last_candle(pair)
 
         # if RSI greater than 70 and profit is positive, then sell
         if (current_candle['rsi'] > 70) and (current_profit > 0):
@@ -10,6 +10,8 @@ import talib.abstract as ta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 import numpy # noqa
 
+from helpers.rolling import cumulative_sum, window_mean
+
 
 class Strategy005(IStrategy):
     """
@@ -140,6 +142,9 @@ class Strategy005(IStrategy):
         # SMA - Simple Moving Average
         dataframe['sma'] = ta.SMA(dataframe, timeperiod=40)
 
+        # Running volume sum, the hyperopted volume average is read from it
+        dataframe['volume_sum'] = cumulative_sum(dataframe['volume'])
+
         return dataframe
 
     def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
@@ -152,7 +157,7 @@ class Strategy005(IStrategy):
             # Prod
             (
                 (dataframe['close'] > 0.00000200) &
-                (dataframe['volume'] > dataframe['volume'].rolling(self.buy_volumeAVG.value).mean() * 4) &
+                (dataframe['volume'] > window_mean(dataframe['volume_sum'], self.buy_volumeAVG.value) * 4) &
                 (dataframe['close'] < dataframe['sma']) &
                 (dataframe['fastd'] > dataframe['fastk']) &
                 (dataframe['rsi'] > self.buy_rsi.value) &
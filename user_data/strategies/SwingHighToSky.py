@@ -12,12 +12,14 @@ status      = "Live"
 from freqtrade.strategy import IStrategy
 from freqtrade.strategy import IntParameter
 from functools import reduce
-from pandas import DataFrame
+from pandas import DataFrame, concat
 
 import talib.abstract as ta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 import numpy
 
+from helpers.oscillators import cci_block, rsi_block
+
 
 
 # CCI timerperiods and values
@@ -73,19 +75,15 @@ class SwingHighToSky(IStrategy):
 
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
 
-        for val in self.buy_cciTime.range:
-            dataframe[f'cci-{val}'] = ta.CCI(dataframe, timeperiod=val)
-
-        for val in self.sell_cciTime.range:
-            dataframe[f'cci-sell-{val}'] = ta.CCI(dataframe, timeperiod=val)
-
-        for val in self.buy_rsiTime.range:
-            dataframe[f'rsi-{val}'] = ta.RSI(dataframe, timeperiod=val)
+        # One column per period, shared by the buy and sell spaces
+        cci_periods = sorted(set(self.buy_cciTime.range) | set(self.sell_cciTime.range))
+        rsi_periods = sorted(set(self.buy_rsiTime.range) | set(self.sell_rsiTime.range))
+        cci = cci_block(dataframe['high'], dataframe['low'], dataframe['close'], cci_periods)
+        rsi = rsi_block(dataframe['close'], rsi_periods)
 
-        for val in self.sell_rsiTime.range:
-            dataframe[f'rsi-sell-{val}'] = ta.RSI(dataframe, timeperiod=val)
-
-        return dataframe
+        columns = {f'cci-{val}': row for val, row in zip(cci_periods, cci)}
+        columns.update({f'rsi-{val}': row for val, row in zip(rsi_periods, rsi)})
+        return concat([dataframe, DataFrame(columns, index=dataframe.index)], axis=1)
 
     def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
 
@@ -102,8 +100,8 @@ class SwingHighToSky(IStrategy):
 
         dataframe.loc[
             (
-                (dataframe[f'cci-sell-{self.sell_cciTime.value}'] > self.sell_cci.value) &
-                (dataframe[f'rsi-sell-{self.sell_rsiTime.value}'] > self.sell_rsi.value)
+                (dataframe[f'cci-{self.sell_cciTime.value}'] > self.sell_cci.value) &
+                (dataframe[f'rsi-{self.sell_rsiTime.value}'] > self.sell_rsi.value)
             ),
             'exit_long'] = 1
 
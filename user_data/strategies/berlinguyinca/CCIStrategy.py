@@ -2,11 +2,17 @@
 from freqtrade.strategy import IStrategy
 from typing import Dict, List
 from functools import reduce
-from pandas import DataFrame, Series, DatetimeIndex, merge
+from pandas import DataFrame, Series
 # --------------------------------
 
 import talib.abstract as ta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
+from freqtrade.exchange import timeframe_to_minutes
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from helpers.resample import RESAMPLER, interpolate_right  # noqa: E402
 
 
 class CCIStrategy(IStrategy):
@@ -25,7 +31,7 @@ class CCIStrategy(IStrategy):
     timeframe = '1m'
 
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        dataframe = self.resample(dataframe, self.timeframe, 5)
+        dataframe = self.resample(dataframe, self.timeframe, 5, metadata['pair'])
 
         dataframe['cci_one'] = ta.CCI(dataframe, timeperiod=170)
         dataframe['cci_two'] = ta.CCI(dataframe, timeperiod=34)
@@ -95,26 +101,13 @@ class CCIStrategy(IStrategy):
 
         return Series(cmf, name='cmf')
 
-    def resample(self, dataframe, interval, factor):
+    def resample(self, dataframe, interval, factor, pair):
         # defines the reinforcement logic
-        # resampled dataframe to establish if we are in an uptrend, downtrend or sideways trend
-        df = dataframe.copy()
-        df = df.set_index(DatetimeIndex(df['date']))
-        ohlc_dict = {
-            'open': 'first',
-            'high': 'max',
-            'low': 'min',
-            'close': 'last'
-        }
-        df = df.resample(str(int(interval[:-1]) * factor) + 'min', label="right").agg(ohlc_dict)
-        df['resample_sma'] = ta.SMA(df, timeperiod=100, price='close')
-        df['resample_medium'] = ta.SMA(df, timeperiod=50, price='close')
-        df['resample_short'] = ta.SMA(df, timeperiod=25, price='close')
-        df['resample_long'] = ta.SMA(df, timeperiod=200, price='close')
-        df = df.drop(columns=['open', 'high', 'low', 'close'])
-        df = df.resample(interval[:-1] + 'min')
-        df = df.interpolate(method='time')
-        df['date'] = df.index
-        df.index = range(len(df))
-        dataframe = merge(dataframe, df, on='date', how='left')
+        # resampled candles to establish if we are in an uptrend, downtrend or sideways trend
+        # (labelled with their end and interpolated in time onto our candles)
+        candles = RESAMPLER.update(pair, dataframe, interval, timeframe_to_minutes(interval) * factor)
+        for column, period in (('resample_sma', 100), ('resample_medium', 50),
+                               ('resample_short', 25), ('resample_long', 200)):
+            dataframe[column] = interpolate_right(
+                dataframe, candles, ta.SMA(candles.inputs, timeperiod=period, price='close'))
         return dataframe
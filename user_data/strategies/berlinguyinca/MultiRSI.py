@@ -3,7 +3,11 @@ from freqtrade.strategy import IStrategy
 from pandas import DataFrame
 # --------------------------------
 import talib.abstract as ta
-from technical.util import resample_to_interval, resampled_merge
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from helpers.resample import RESAMPLER, merge_closed  # noqa: E402
 
 
 class MultiRSI(IStrategy):
@@ -33,21 +37,16 @@ class MultiRSI(IStrategy):
         dataframe['sma5'] = ta.SMA(dataframe, timeperiod=5)
         dataframe['sma200'] = ta.SMA(dataframe, timeperiod=200)
 
-        # resample our dataframes
-        dataframe_short = resample_to_interval(dataframe, self.get_ticker_indicator() * 2)
-        dataframe_long = resample_to_interval(dataframe, self.get_ticker_indicator() * 8)
-
-        # compute our RSI's
-        dataframe_short['rsi'] = ta.RSI(dataframe_short, timeperiod=14)
-        dataframe_long['rsi'] = ta.RSI(dataframe_long, timeperiod=14)
-
-        # merge dataframe back together
-        dataframe = resampled_merge(dataframe, dataframe_short)
-        dataframe = resampled_merge(dataframe, dataframe_long)
+        # resample our dataframes, compute our RSI's and merge them back together
+        for factor in (2, 8):
+            interval = self.get_ticker_indicator() * factor
+            candles = RESAMPLER.update(metadata['pair'], dataframe, self.timeframe, interval)
+            dataframe[f'resample_{interval}_rsi'] = merge_closed(
+                dataframe, candles, ta.RSI(candles.inputs, timeperiod=14))
 
         dataframe['rsi'] = ta.RSI(dataframe, timeperiod=14)
 
-        dataframe.fillna(method='ffill', inplace=True)
+        dataframe.ffill(inplace=True)
 
         return dataframe
 
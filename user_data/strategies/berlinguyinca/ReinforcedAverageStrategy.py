@@ -7,8 +7,12 @@ from pandas import DataFrame, merge, DatetimeIndex
 
 import talib.abstract as ta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
-from technical.util import resample_to_interval, resampled_merge
 from freqtrade.exchange import timeframe_to_minutes
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from helpers.resample import RESAMPLER, merge_closed  # noqa: E402
 
 
 class ReinforcedAverageStrategy(IStrategy):
@@ -59,9 +63,9 @@ class ReinforcedAverageStrategy(IStrategy):
         dataframe['bb_upperband'] = bollinger['upper']
         dataframe['bb_middleband'] = bollinger['mid']
         self.resample_interval = timeframe_to_minutes(self.timeframe) * 12
-        dataframe_long = resample_to_interval(dataframe, self.resample_interval)
-        dataframe_long['sma'] = ta.SMA(dataframe_long, timeperiod=50, price='close')
-        dataframe = resampled_merge(dataframe, dataframe_long, fill_na=True)
+        candles = RESAMPLER.update(metadata['pair'], dataframe, self.timeframe, self.resample_interval)
+        dataframe[f'resample_{self.resample_interval}_sma'] = merge_closed(
+            dataframe, candles, ta.SMA(candles.inputs, timeperiod=50, price='close'))
 
         return dataframe
 
@@ -9,12 +9,19 @@ import talib.abstract as ta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 from typing import Dict, List
 from functools import reduce
-from pandas import DataFrame, DatetimeIndex, merge
+from pandas import DataFrame
 # --------------------------------
 
 import talib.abstract as ta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 import numpy  # noqa
+from freqtrade.exchange import timeframe_to_minutes
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from helpers.resample import RESAMPLER, interpolate_right  # noqa: E402
+
 
 class ReinforcedQuickie(IStrategy):
     """
@@ -49,7 +56,7 @@ class ReinforcedQuickie(IStrategy):
     EMA_LONG_TERM = 21
 
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        dataframe = self.resample(dataframe, self.timeframe, self.resample_factor)
+        dataframe = self.resample(dataframe, self.timeframe, self.resample_factor, metadata['pair'])
 
         ##################################################################################
         # buy and sell indicators
@@ -172,24 +179,11 @@ class ReinforcedQuickie(IStrategy):
         ] = 1
         return dataframe
 
-    def resample(self, dataframe, interval, factor):
+    def resample(self, dataframe, interval, factor, pair):
         # defines the reinforcement logic
-        # resampled dataframe to establish if we are in an uptrend, downtrend or sideways trend
-        df = dataframe.copy()
-        df = df.set_index(DatetimeIndex(df['date']))
-        ohlc_dict = {
-            'open': 'first',
-            'high': 'max',
-            'low': 'min',
-            'close': 'last'
-        }
-        df = df.resample(str(int(interval[:-1]) * factor) + 'min',
-                         label="right").agg(ohlc_dict).dropna(how='any')
-        df['resample_sma'] = ta.SMA(df, timeperiod=25, price='close')
-        df = df.drop(columns=['open', 'high', 'low', 'close'])
-        df = df.resample(interval[:-1] + 'min')
-        df = df.interpolate(method='time')
-        df['date'] = df.index
-        df.index = range(len(df))
-        dataframe = merge(dataframe, df, on='date', how='left')
+        # resampled candles to establish if we are in an uptrend, downtrend or sideways trend
+        # (labelled with their end and interpolated in time onto our candles)
+        candles = RESAMPLER.update(pair, dataframe, interval, timeframe_to_minutes(interval) * factor)
+        dataframe['resample_sma'] = interpolate_right(
+            dataframe, candles, ta.SMA(candles.inputs, timeperiod=25, price='close'))
         return dataframe
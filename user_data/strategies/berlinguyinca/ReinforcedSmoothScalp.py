@@ -4,11 +4,15 @@ from freqtrade.strategy import IStrategy
 from freqtrade.strategy import timeframe_to_minutes
 from freqtrade.strategy import BooleanParameter, IntParameter
 from pandas import DataFrame
-from technical.util import resample_to_interval, resampled_merge
 import numpy  # noqa
 # --------------------------------
 import talib.abstract as ta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from helpers.resample import RESAMPLER, merge_closed  # noqa: E402
 
 
 class ReinforcedSmoothScalp(IStrategy):
@@ -59,10 +63,8 @@ class ReinforcedSmoothScalp(IStrategy):
 
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         tf_res = timeframe_to_minutes(self.timeframe) * 5
-        df_res = resample_to_interval(dataframe, tf_res)
-        df_res['sma'] = ta.SMA(df_res, 50, price='close')
-        dataframe = resampled_merge(dataframe, df_res, fill_na=True)
-        dataframe['resample_sma'] = dataframe[f'resample_{tf_res}_sma']
+        candles = RESAMPLER.update(metadata['pair'], dataframe, self.timeframe, tf_res)
+        dataframe['resample_sma'] = merge_closed(dataframe, candles, ta.SMA(candles.inputs, 50, price='close'))
 
         dataframe['ema_high'] = ta.EMA(dataframe, timeperiod=5, price='high')
         dataframe['ema_close'] = ta.EMA(dataframe, timeperiod=5, price='close')
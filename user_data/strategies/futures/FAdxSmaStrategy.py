@@ -19,6 +19,11 @@ from freqtrade.strategy import (
 # Add your lib to import here
 import talib.abstract as ta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from helpers.ma_bank import MaBlock, sma_block  # noqa: E402
 
 
 # This class is a sample. Feel free to customize it.
@@ -60,18 +65,16 @@ class FAdxSmaStrategy(IStrategy):
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
 
         # Calculate all adx values
-        for val in self.adx_period.range:
-            dataframe[f"adx_{val}"] = ta.ADX(dataframe, timeperiod=val)
-
-        # Calculate all sma_short values
-        for val in self.sma_short_period.range:
-            dataframe[f"sma_short_{val}"] = ta.SMA(dataframe, timeperiod=val)
+        adx = {f"adx_{val}": ta.ADX(dataframe, timeperiod=val) for val in self.adx_period.range}
 
-        # Calculate all sma_long values
-        for val in self.sma_long_period.range:
-            dataframe[f"sma_long_{val}"] = ta.SMA(dataframe, timeperiod=val)
+        # Calculate all sma_short and sma_long values in one block
+        columns = {f"sma_short_{val}": val for val in self.sma_short_period.range}
+        columns.update({f"sma_long_{val}": val for val in self.sma_long_period.range})
+        smas = MaBlock(sma_block, dataframe["close"], columns)
 
-        return dataframe
+        return pd.concat(
+            [dataframe, DataFrame(adx, index=dataframe.index), smas.frame(dataframe)], axis=1
+        )
 
     def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         conditions_long = []
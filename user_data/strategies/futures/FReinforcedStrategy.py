@@ -20,7 +20,12 @@ from freqtrade.strategy import (
 import talib.abstract as ta
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 from freqtrade.exchange import timeframe_to_minutes
-from technical.util import resample_to_interval, resampled_merge
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from helpers.ma_bank import MaBlock, ema_block  # noqa: E402
+from helpers.resample import RESAMPLER, merge_closed  # noqa: E402
 
 
 # This class is a sample. Feel free to customize it.
@@ -62,16 +67,16 @@ class FReinforcedStrategy(IStrategy):
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
 
         # Calculate all adx values
-        for val in self.adx_period.range:
-            dataframe[f"adx_{val}"] = ta.ADX(dataframe, timeperiod=val)
+        adx = {f"adx_{val}": ta.ADX(dataframe, timeperiod=val) for val in self.adx_period.range}
 
-        # Calculate all ema_short values
-        for val in self.ema_short_period.range:
-            dataframe[f"ema_short_{val}"] = ta.EMA(dataframe, timeperiod=val)
+        # Calculate all ema_short and ema_long values in one block
+        columns = {f"ema_short_{val}": val for val in self.ema_short_period.range}
+        columns.update({f"ema_long_{val}": val for val in self.ema_long_period.range})
+        emas = MaBlock(ema_block, dataframe["close"], columns)
 
-        # Calculate all ema_long values
-        for val in self.ema_long_period.range:
-            dataframe[f"ema_long_{val}"] = ta.EMA(dataframe, timeperiod=val)
+        dataframe = pd.concat(
+            [dataframe, DataFrame(adx, index=dataframe.index), emas.frame(dataframe)], axis=1
+        )
 
         # required for graphing
         bollinger = qtpylib.bollinger_bands(dataframe["close"], window=20, stds=2)
@@ -80,9 +85,10 @@ class FReinforcedStrategy(IStrategy):
         dataframe["bb_middleband"] = bollinger["mid"]
 
         self.resample_interval = timeframe_to_minutes(self.timeframe) * 12
-        dataframe_long = resample_to_interval(dataframe, self.resample_interval)
-        dataframe_long["sma"] = ta.SMA(dataframe_long, timeperiod=50, price="close")
-        dataframe = resampled_merge(dataframe, dataframe_long, fill_na=True)
+        candles = RESAMPLER.update(metadata["pair"], dataframe, self.timeframe, self.resample_interval)
+        dataframe[f"resample_{self.resample_interval}_sma"] = merge_closed(
+            dataframe, candles, ta.SMA(candles.inputs, timeperiod=50, price="close")
+        )
 
         return dataframe
 
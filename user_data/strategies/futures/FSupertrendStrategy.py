@@ -12,11 +12,15 @@ Supertrend strategy:
 """
 
 import logging
+import sys
+from pathlib import Path
 from numpy.lib import math
 from freqtrade.strategy import IStrategy, IntParameter
-from pandas import DataFrame
-import talib.abstract as ta
-import numpy as np
+from pandas import DataFrame, concat
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from helpers.supertrend import supertrend as supertrend_indicator  # noqa: E402
+from helpers.supertrend import supertrend_columns, UP, DOWN  # noqa: E402
 
 
 class FSupertrendStrategy(IStrategy):
@@ -76,58 +80,32 @@ class FSupertrendStrategy(IStrategy):
     sell_p3 = IntParameter(7, 21, default=10)
 
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        for multiplier in self.buy_m1.range:
-            for period in self.buy_p1.range:
-                dataframe[f"supertrend_1_buy_{multiplier}_{period}"] = self.supertrend(
-                    dataframe, multiplier, period
-                )["STX"]
-
-        for multiplier in self.buy_m2.range:
-            for period in self.buy_p2.range:
-                dataframe[f"supertrend_2_buy_{multiplier}_{period}"] = self.supertrend(
-                    dataframe, multiplier, period
-                )["STX"]
-
-        for multiplier in self.buy_m3.range:
-            for period in self.buy_p3.range:
-                dataframe[f"supertrend_3_buy_{multiplier}_{period}"] = self.supertrend(
-                    dataframe, multiplier, period
-                )["STX"]
-
-        for multiplier in self.sell_m1.range:
-            for period in self.sell_p1.range:
-                dataframe[f"supertrend_1_sell_{multiplier}_{period}"] = self.supertrend(
-                    dataframe, multiplier, period
-                )["STX"]
-
-        for multiplier in self.sell_m2.range:
-            for period in self.sell_p2.range:
-                dataframe[f"supertrend_2_sell_{multiplier}_{period}"] = self.supertrend(
-                    dataframe, multiplier, period
-                )["STX"]
-
-        for multiplier in self.sell_m3.range:
-            for period in self.sell_p3.range:
-                dataframe[f"supertrend_3_sell_{multiplier}_{period}"] = self.supertrend(
-                    dataframe, multiplier, period
-                )["STX"]
-
-        return dataframe
+        # Every (multiplier, period) of the six indicator spaces; each distinct pair is computed once
+        columns = {
+            f"supertrend_{index}_{side}_{multiplier}_{period}": (multiplier, period)
+            for side in ("buy", "sell")
+            for index in (1, 2, 3)
+            for multiplier in getattr(self, f"{side}_m{index}").range
+            for period in getattr(self, f"{side}_p{index}").range
+        }
+        return concat(
+            [dataframe, supertrend_columns(dataframe, columns, encoding="int8")], axis=1
+        )
 
     def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
 
         dataframe.loc[
             (
                 dataframe[f"supertrend_1_buy_{self.buy_m1.value}_{self.buy_p1.value}"]
-                == "up"
+                == UP
             )
             & (
                 dataframe[f"supertrend_2_buy_{self.buy_m2.value}_{self.buy_p2.value}"]
-                == "up"
+                == UP
             )
             & (
                 dataframe[f"supertrend_3_buy_{self.buy_m3.value}_{self.buy_p3.value}"]
-                == "up"
+                == UP
             )
             & (  # The three indicators are 'up' for the current candle
                 dataframe["volume"] > 0
@@ -140,19 +118,19 @@ class FSupertrendStrategy(IStrategy):
                 dataframe[
                     f"supertrend_1_sell_{self.sell_m1.value}_{self.sell_p1.value}"
                 ]
-                == "down"
+                == DOWN
             )
             & (
                 dataframe[
                     f"supertrend_2_sell_{self.sell_m2.value}_{self.sell_p2.value}"
                 ]
-                == "down"
+                == DOWN
             )
             & (
                 dataframe[
                     f"supertrend_3_sell_{self.sell_m3.value}_{self.sell_p3.value}"
                 ]
-                == "down"
+                == DOWN
             )
             & (  # The three indicators are 'down' for the current candle
                 dataframe["volume"] > 0
@@ -168,7 +146,7 @@ class FSupertrendStrategy(IStrategy):
                 dataframe[
                     f"supertrend_2_sell_{self.sell_m2.value}_{self.sell_p2.value}"
                 ]
-                == "down"
+                == DOWN
             ),
             "exit_long",
         ] = 1
@@ -176,7 +154,7 @@ class FSupertrendStrategy(IStrategy):
         dataframe.loc[
             (
                 dataframe[f"supertrend_2_buy_{self.buy_m2.value}_{self.buy_p2.value}"]
-                == "up"
+                == UP
             ),
             "exit_short",
         ] = 1
@@ -186,64 +164,9 @@ class FSupertrendStrategy(IStrategy):
     """
         Supertrend Indicator; adapted for freqtrade
         from: https://github.com/freqtrade/freqtrade-strategies/issues/30
+        The band recursion runs in helpers/supertrend.py
     """
 
     def supertrend(self, dataframe: DataFrame, multiplier, period):
-        df = dataframe.copy()
-
-        df["TR"] = ta.TRANGE(df)
-        df["ATR"] = ta.SMA(df["TR"], period)
-
-        st = "ST_" + str(period) + "_" + str(multiplier)
-        stx = "STX_" + str(period) + "_" + str(multiplier)
-
-        # Compute basic upper and lower bands
-        df["basic_ub"] = (df["high"] + df["low"]) / 2 + multiplier * df["ATR"]
-        df["basic_lb"] = (df["high"] + df["low"]) / 2 - multiplier * df["ATR"]
-
-        # Compute final upper and lower bands
-        df["final_ub"] = 0.00
-        df["final_lb"] = 0.00
-        for i in range(period, len(df)):
-            df["final_ub"].iat[i] = (
-                df["basic_ub"].iat[i]
-                if df["basic_ub"].iat[i] < df["final_ub"].iat[i - 1]
-                or df["close"].iat[i - 1] > df["final_ub"].iat[i - 1]
-                else df["final_ub"].iat[i - 1]
-            )
-            df["final_lb"].iat[i] = (
-                df["basic_lb"].iat[i]
-                if df["basic_lb"].iat[i] > df["final_lb"].iat[i - 1]
-                or df["close"].iat[i - 1] < df["final_lb"].iat[i - 1]
-                else df["final_lb"].iat[i - 1]
-            )
-
-        # Set the Supertrend value
-        df[st] = 0.00
-        for i in range(period, len(df)):
-            df[st].iat[i] = (
-                df["final_ub"].iat[i]
-                if df[st].iat[i - 1] == df["final_ub"].iat[i - 1]
-                and df["close"].iat[i] <= df["final_ub"].iat[i]
-                else df["final_lb"].iat[i]
-                if df[st].iat[i - 1] == df["final_ub"].iat[i - 1]
-                and df["close"].iat[i] > df["final_ub"].iat[i]
-                else df["final_lb"].iat[i]
-                if df[st].iat[i - 1] == df["final_lb"].iat[i - 1]
-                and df["close"].iat[i] >= df["final_lb"].iat[i]
-                else df["final_ub"].iat[i]
-                if df[st].iat[i - 1] == df["final_lb"].iat[i - 1]
-                and df["close"].iat[i] < df["final_lb"].iat[i]
-                else 0.00
-            )
-        # Mark the trend direction up/down
-        df[stx] = np.where(
-            (df[st] > 0.00), np.where((df["close"] < df[st]), "down", "up"), np.NaN
-        )
-
-        # Remove basic and final bands from the columns
-        df.drop(["basic_ub", "basic_lb", "final_ub", "final_lb"], inplace=True, axis=1)
-
-        df.fillna(0, inplace=True)
-
-        return DataFrame(index=df.index, data={"ST": df[st], "STX": df[stx]})
+        # Undefined candles keep the "nan" label the original np.where produced
+        return supertrend_indicator(dataframe, multiplier, period, empty="nan")
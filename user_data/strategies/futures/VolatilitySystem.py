@@ -15,7 +15,11 @@ from freqtrade.strategy import (CategoricalParameter, DecimalParameter,
 from freqtrade.exchange import date_minus_candles
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 
-from technical.util import resample_to_interval, resampled_merge
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from helpers.resample import RESAMPLER, merge_closed  # noqa: E402
 
 
 class VolatilitySystem(IStrategy):
@@ -57,17 +61,15 @@ class VolatilitySystem(IStrategy):
         are worth adding.
         """
         resample_int = 60 * 3
-        resampled = resample_to_interval(dataframe, resample_int)
+        candles = RESAMPLER.update(metadata['pair'], dataframe, self.timeframe, resample_int)
         # Average True Range (ATR)
-        resampled['atr'] = ta.ATR(resampled, timeperiod=14) * 2.0
+        atr = ta.ATR(candles.inputs, timeperiod=14) * 2.0
         # Absolute close change
-        resampled['close_change'] = resampled['close'].diff()
-        resampled['abs_close_change'] = resampled['close_change'].abs()
+        close_change = np.r_[np.nan, np.diff(candles.close)]
 
-        dataframe = resampled_merge(dataframe, resampled, fill_na=True)
-        dataframe['atr'] = dataframe[f'resample_{resample_int}_atr']
-        dataframe['close_change'] = dataframe[f'resample_{resample_int}_close_change']
-        dataframe['abs_close_change'] = dataframe[f'resample_{resample_int}_abs_close_change']
+        dataframe['atr'] = merge_closed(dataframe, candles, atr)
+        dataframe['close_change'] = merge_closed(dataframe, candles, close_change)
+        dataframe['abs_close_change'] = merge_closed(dataframe, candles, np.abs(close_change))
 
         # Average True Range (ATR)
         # dataframe['atr'] = ta.ATR(dataframe, timeperiod=14) * 2.0
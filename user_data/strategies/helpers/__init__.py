@@ -0,0 +1,9 @@
+"""
+Shared indicator engines and utilities for the strategies in this directory.
+
+Freqtrade puts the strategy's own directory on ``sys.path`` while loading it,
+so strategies living directly in ``user_data/strategies`` can simply
+``from helpers.<module> import ...``.  Strategies in sub-directories
+(``futures/``, ``berlinguyinca/``, ``lookahead_bias/``) append the parent
+directory to ``sys.path`` before importing.
+"""
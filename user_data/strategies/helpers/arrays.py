@@ -0,0 +1,11 @@
+"""
+Small NumPy utilities shared by the block kernels.
+"""
+
+import numpy as np
+
+
+def first_valid(values: np.ndarray) -> int:
+    """Position of the first non-NaN value, ``len(values)`` if there is none (TA-Lib skips leading NaNs)"""
+    valid = np.flatnonzero(~np.isnan(values))
+    return int(valid[0]) if len(valid) else len(values)
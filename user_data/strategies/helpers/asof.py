@@ -0,0 +1,95 @@
+"""
+As-of lookups of a candle column for trade callbacks.
+
+Stoploss callbacks such as FixedRiskRewardLoss look up the value of an
+indicator on the candle a trade was opened in (the last candle at or before
+``trade.open_date_utc``). They used to keep a date-indexed DataFrame per pair
+and call ``index.unique().get_loc(date, method='ffill')`` on every callback,
+which rebuilds the index each time and no longer exists in current pandas.
+``AsofSeries`` holds the sorted candle dates as int64 ticks and the column as
+float64 (views of the dataframe's arrays where the dtypes allow) and answers
+with a binary search.
+
+``AsofStore`` keeps the series of several pairs for strategies that look up a
+column at ``current_time`` (e.g. CustomStoplossWithPSAR). The series of a
+pair is replaced whenever its dataframe is analysed again (new candles), and
+the least recently updated pairs are dropped beyond ``max_pairs``.
+"""
+
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+from pandas import DataFrame
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_TICKS = {
+    's': timedelta(seconds=1),
+    'ms': timedelta(milliseconds=1),
+    'us': timedelta(microseconds=1),
+}
+
+
+def ticks(when: datetime, unit: str = 'ns') -> int:
+    """Exact int64 ticks of a (naive = UTC) datetime since the epoch, floored, without a Timestamp"""
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    if unit == 'ns':
+        return (when - _EPOCH) // _TICKS['us'] * 1000
+    return (when - _EPOCH) // _TICKS[unit]
+
+
+class AsofSeries:
+    __slots__ = ('dates', 'unit', 'values', 'memo')
+
+    def __init__(self, dates: np.ndarray, values: np.ndarray, unit: str = 'ns'):
+        """
+        :param dates: Sorted candle dates as int64 ticks of ``unit``
+        :param values: float64 values, one per date
+        :param unit: 's', 'ms', 'us' or 'ns'
+        """
+        self.dates = dates
+        self.unit = unit
+        self.values = values
+        # Results of the callers (e.g. per trade), dropped together with the arrays
+        self.memo = {}
+
+    @classmethod
+    def from_dataframe(cls, dataframe: DataFrame, column: str) -> 'AsofSeries':
+        dates = dataframe['date'].array
+        return cls(dates.asi8, dataframe[column].to_numpy(dtype=np.float64), dates.unit)
+
+    @property
+    def nbytes(self) -> int:
+        return self.dates.nbytes + self.values.nbytes
+
+    def asof(self, when: datetime) -> float:
+        """Value of the last candle at or before ``when``, NaN if ``when`` is before the first"""
+        position = int(np.searchsorted(self.dates, ticks(when, self.unit), side='right')) - 1
+        return float(self.values[position]) if position >= 0 else np.nan
+
+
+class AsofStore:
+    def __init__(self, column: str, max_pairs=256):
+        """
+        :param column: Dataframe column served by ``asof``
+        :param max_pairs: Number of pairs kept, least recently updated are dropped
+        """
+        self.column = column
+        self.max_pairs = max_pairs
+        self._series = OrderedDict()
+
+    def update(self, pair, dataframe: DataFrame):
+        """Replace the pair's series with the candles of ``dataframe``"""
+        self._series[pair] = AsofSeries.from_dataframe(dataframe, self.column)
+        self._series.move_to_end(pair)
+        while len(self._series) > self.max_pairs:
+            self._series.popitem(last=False)
+
+    def __contains__(self, pair) -> bool:
+        return pair in self._series
+
+    def asof(self, pair, when: datetime) -> float:
+        """Value of ``pair`` at ``when``, NaN if unknown"""
+        series = self._series.get(pair)
+        return series.asof(when) if series is not None else np.nan
@@ -0,0 +1,123 @@
+"""
+Market-breadth RSI shared across pairs.
+
+CryptoKMLMSwitcherAdvanced merges the RSI of a handful of leader pairs into
+every whitelisted pair (and reads their last value in
+``determine_position_size``), and used to recompute a full-history ``ta.RSI``
+of each leader on every call. ``RsiBreadth`` keeps the RSI series of every
+(pair, timeframe, window) together with the dates it was computed for, so it
+is computed once per candle for all pairs. The first dataframe of a leader is
+computed with ``ta.RSI``; when a later dataframe continues it, ``WilderRsi``
+(Wilder's average gain/loss) only advances over the new candles instead of
+recomputing the whole history.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+import talib
+from pandas import DataFrame, Series
+
+
+def _wilder(values, window) -> float:
+    """Last value of Wilder's smoothing, seeded with the mean of the first ``window`` values"""
+    seeded = np.concatenate(([values[:window].mean()], values[window:]))
+    return float(Series(seeded).ewm(alpha=1 / window, adjust=False).mean().iloc[-1])
+
+
+class WilderRsi:
+    def __init__(self, window: int):
+        self.window = window
+        self.close = np.nan
+        self.gain = np.nan
+        self.loss = np.nan
+
+    @property
+    def ready(self) -> bool:
+        return not np.isnan(self.gain)
+
+    @property
+    def value(self) -> float:
+        """Current RSI, same as the last value of ``ta.RSI``"""
+        if not self.ready:
+            return np.nan
+        total = self.gain + self.loss
+        return 100 * self.gain / total if total else 0.0
+
+    def fit(self, closes) -> float:
+        """Reset the state from a full history of closes and return the last RSI"""
+        closes = np.asarray(closes, dtype=np.float64)
+        self.close = closes[-1] if len(closes) else np.nan
+        if len(closes) <= self.window:
+            self.gain = self.loss = np.nan
+            return np.nan
+        change = np.diff(closes)
+        self.gain = _wilder(np.clip(change, 0, None), self.window)
+        self.loss = _wilder(np.clip(-change, 0, None), self.window)
+        return self.value
+
+    def update(self, close) -> float:
+        """Advance the state by one close and return the new RSI"""
+        change = close - self.close
+        self.close = close
+        self.gain = (self.gain * (self.window - 1) + max(change, 0)) / self.window
+        self.loss = (self.loss * (self.window - 1) + max(-change, 0)) / self.window
+        return self.value
+
+
+class RsiBreadth:
+    def __init__(self, max_keys=256):
+        """
+        :param max_keys: Number of (pair, timeframe, window) series kept, least recently used are dropped
+        """
+        self.max_keys = max_keys
+        # (WilderRsi at the last date, dates, RSI values) per (pair, timeframe, window)
+        self._series = OrderedDict()
+
+    def get(self, pair, timeframe, dataframe: DataFrame, window: int) -> float:
+        """Last RSI of ``dataframe``, NaN while there are not enough candles"""
+        values = self.series(pair, timeframe, dataframe, window)
+        return float(values[-1]) if len(values) else np.nan
+
+    def series(self, pair, timeframe, dataframe: DataFrame, window: int) -> np.ndarray:
+        """RSI of every candle of ``dataframe`` as a read-only array, as ``ta.RSI``"""
+        key = (pair, timeframe, window)
+        dates = dataframe['date'].to_numpy()
+        closes = dataframe['close'].to_numpy(dtype=np.float64)
+
+        state = self._series.get(key)
+        values = self._continue(state, dates, closes) if state is not None else None
+        if values is None:
+            rsi = WilderRsi(window)
+            rsi.fit(closes)
+            values = talib.RSI(closes, timeperiod=window) if len(closes) else np.empty(0)
+            state = (rsi, dates, values)
+        else:
+            state = (state[0], dates, values)
+        values.flags.writeable = False
+        self._series[key] = state
+        self._series.move_to_end(key)
+        while len(self._series) > self.max_keys:
+            self._series.popitem(last=False)
+        return values
+
+    @staticmethod
+    def _continue(state, dates, closes):
+        """RSI of ``dates`` from the stored series if they continue its dates by a few candles, else None"""
+        rsi, known, values = state
+        if not len(dates) or not len(known):
+            return None
+        start = int(np.searchsorted(known, dates[0]))
+        overlap = len(known) - start
+        if (
+            start == len(known) or overlap > len(dates) or known[start] != dates[0]
+            or dates[overlap - 1] != known[-1]
+        ):
+            return None
+        if overlap == len(dates) and start == 0:
+            return values
+        # Continue Wilder's state over the new candles, if there are few of them
+        if len(dates) - overlap > len(dates) // 2 or (len(dates) > overlap and not rsi.ready):
+            return None
+        new = [rsi.update(close) for close in closes[overlap:]]
+        return np.concatenate((values[start:], new))
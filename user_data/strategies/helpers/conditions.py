@@ -0,0 +1,143 @@
+"""
+Compiled entry/exit conditions for GodStra-style operator strings.
+
+GodStra, GodStraNew and DevilStra describe their signals as clauses
+``(operator, indicator, crossed_indicator, real_num[, int_num])`` and used to
+interpret the operator codes with if/elif chains on every call, allocating a
+few intermediate Series per clause. ``compile_conditions`` turns a tuple of
+clauses into a ``ConditionPlan`` once (cached by the clause tuple, so repeated
+hyperopt genomes are not compiled again). The plan lists the columns it needs
+and evaluates all clauses on NumPy arrays into a single boolean mask.
+
+Operators (``indicator`` against):
+    ``>``, ``=``, ``<``       the crossed indicator
+    ``C``, ``CA``, ``CB``     crossing the crossed indicator (any/above/below)
+    ``>I``, ``=I``, ``<I``    the integer number
+    ``>R``, ``=R``, ``<R``    the real number
+    ``/>R``, ``/=R``, ``/<R`` indicator divided by the crossed indicator, against the real number
+    ``UT``, ``DT``, ``OT``    its SMA over ``trend_candles`` (up/down/off trend)
+    ``CUT``, ``CDT``, ``COT`` entering up/down/off trend
+    ``D``                     disabled clause, only requires ``volume > 10``
+Unknown operators are skipped.
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+
+def crossed_above(a, b) -> np.ndarray:
+    """Same as ``qtpylib.crossed_above`` on arrays"""
+    result = a > b
+    result[1:] &= a[:-1] <= b[:-1]
+    result[:1] = False
+    return result
+
+
+def crossed_below(a, b) -> np.ndarray:
+    """Same as ``qtpylib.crossed_below`` on arrays"""
+    result = a < b
+    result[1:] &= a[:-1] >= b[:-1]
+    result[:1] = False
+    return result
+
+
+def crossed(a, b) -> np.ndarray:
+    return crossed_above(a, b) | crossed_below(a, b)
+
+
+def _entered_off_trend(a, b):
+    return crossed(a, b) & np.isclose(a, b)
+
+
+# operator -> (right operand, comparison)
+OPERATORS = {
+    ">": ("crossed", np.greater),
+    "=": ("crossed", np.isclose),
+    "<": ("crossed", np.less),
+    "C": ("crossed", crossed),
+    "CA": ("crossed", crossed_above),
+    "CB": ("crossed", crossed_below),
+    ">I": ("int", np.greater),
+    "=I": ("int", np.equal),
+    "<I": ("int", np.less),
+    ">R": ("real", np.greater),
+    "=R": ("real", np.isclose),
+    "<R": ("real", np.less),
+    "/>R": ("ratio", np.greater),
+    "/=R": ("ratio", np.isclose),
+    "/<R": ("ratio", np.less),
+    "UT": ("trend", np.greater),
+    "DT": ("trend", np.less),
+    "OT": ("trend", np.isclose),
+    # Crossing above/below already implies being above/below
+    "CUT": ("trend", crossed_above),
+    "CDT": ("trend", crossed_below),
+    "COT": ("trend", _entered_off_trend),
+}
+
+
+def _clause(operator, indicator, crossed_indicator, real_num, int_num, trend_candles):
+    """Return (required columns, evaluation function) of one clause"""
+    if operator == "D":
+        return ("volume",), lambda arrays: arrays["volume"] > 10
+
+    operand, compare = OPERATORS[operator]
+    if operand == "crossed":
+        return (indicator, crossed_indicator), \
+            lambda arrays: compare(arrays[indicator], arrays[crossed_indicator])
+    if operand == "int":
+        return (indicator,), lambda arrays: compare(arrays[indicator], int_num)
+    if operand == "real":
+        return (indicator,), lambda arrays: compare(arrays[indicator], real_num)
+    if operand == "ratio":
+        def ratio(arrays):
+            with np.errstate(divide="ignore", invalid="ignore"):
+                return compare(arrays[indicator] / arrays[crossed_indicator], real_num)
+        return (indicator, crossed_indicator), ratio
+
+    trend = f"{indicator}-SMA-{trend_candles}"
+    return (indicator, trend), lambda arrays: compare(arrays[indicator], arrays[trend])
+
+
+class ConditionPlan:
+    def __init__(self, steps, columns):
+        self.steps = steps
+        self.columns = columns
+
+    def __bool__(self):
+        return bool(self.steps)
+
+    def evaluate(self, arrays) -> np.ndarray:
+        """
+        :param arrays: Mapping of every name in ``columns`` to a float array
+        :return: Boolean mask, True where all clauses hold
+        """
+        mask = None
+        for step in self.steps:
+            condition = step(arrays)
+            if mask is None:
+                mask = np.array(condition, dtype=bool)
+            else:
+                mask &= condition
+        return mask
+
+
+@lru_cache(maxsize=4096)
+def compile_conditions(clauses: tuple, trend_candles=4) -> ConditionPlan:
+    """
+    :param clauses: Tuple of (operator, indicator, crossed_indicator, real_num[, int_num])
+    :param trend_candles: SMA length of the trend operators' reference column
+    """
+    steps = []
+    columns = []
+    for clause in clauses:
+        operator, indicator, crossed_indicator, real_num, *rest = clause
+        if operator != "D" and operator not in OPERATORS:
+            continue
+        int_num = rest[0] if rest else None
+        needed, step = _clause(
+            operator, indicator, crossed_indicator, real_num, int_num, trend_candles)
+        steps.append(step)
+        columns.extend(name for name in needed if name not in columns)
+    return ConditionPlan(tuple(steps), tuple(columns))
@@ -0,0 +1,30 @@
+"""
+Cheap identity of the candles of a dataframe.
+
+Caches of arrays computed from a pair's candles (``GeneCache``, Heracles'
+padded columns) are keyed by ``fingerprint(dataframe)``: the length, the
+first/last date and the sums of close and volume, which change whenever
+candles are added, dropped or replaced, without hashing whole columns.
+"""
+
+import numpy as np
+from pandas import DataFrame
+
+
+def _nansum(values: np.ndarray) -> float:
+    """``np.nansum`` without its NaN-free copy when there is no NaN to skip"""
+    total = float(np.sum(values))
+    return total if not np.isnan(total) else float(np.nansum(values))
+
+
+def fingerprint(dataframe: DataFrame) -> tuple:
+    """Length, first/last date and the sums of close and volume of ``dataframe``"""
+    if dataframe.empty:
+        return (0,)
+    return (
+        len(dataframe),
+        dataframe["date"].iloc[0],
+        dataframe["date"].iloc[-1],
+        _nansum(dataframe["close"].to_numpy()),
+        _nansum(dataframe["volume"].to_numpy()),
+    )
@@ -0,0 +1,68 @@
+"""
+Per-pair cache of arrays computed from a dataframe's candles.
+
+``GeneCache`` keeps computed arrays keyed by pair, a fingerprint of the
+candles (length, first/last date, sums of close and volume, see
+helpers/fingerprint.py) and a key chosen by the caller, so each array is
+computed once per pair for a given set of candles and recomputed when new
+candles arrive. Entries are read-only and
+evicted least-recently-used once the configured memory budget is exceeded.
+
+It was written for the GodStra family (GodStraNew, DevilStra), whose gene
+strings such as ``MACD-0-50`` used to be recomputed with TA-Lib once per
+hyperopt epoch, and also backs ``MaBank`` and ``ta_features``.
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+from pandas import DataFrame
+
+from .fingerprint import fingerprint
+
+
+class GeneCache:
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        """
+        :param max_bytes: Memory budget for the cached arrays
+        """
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, pair, dataframe: DataFrame, gene: str, compute) -> np.ndarray:
+        """
+        Return the cached array for ``gene``, calling ``compute()`` on a miss.
+        Returned arrays are read-only as they are shared between calls.
+        """
+        key = (pair, fingerprint(dataframe), gene)
+        values = self._entries.get(key)
+        if values is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return values
+
+        self.misses += 1
+        values = np.array(compute(), dtype=np.float64)
+        values.setflags(write=False)
+        if values.nbytes <= self.max_bytes:
+            self._entries[key] = values
+            self.nbytes += values.nbytes
+            while self.nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+        return values
+
+    def clear(self):
+        self._entries.clear()
+        self.nbytes = 0
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "bytes": self.nbytes,
+        }
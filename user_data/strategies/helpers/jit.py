@@ -0,0 +1,20 @@
+"""
+Optional numba support for the helper kernels.
+
+Kernels are written as plain loops over NumPy arrays. When numba is installed
+they are compiled with ``njit``; otherwise they run as ordinary Python, which
+is still far cheaper than per-row ``DataFrame.iat`` access.
+"""
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
@@ -0,0 +1,172 @@
+"""
+Moving averages of many periods, computed lazily or as one block.
+
+Strategies like MultiMa used to insert one column per period they might ever
+read (hundreds of TEMAs with periods up to ~1900) while a parameter set only
+reads a few of them. ``MaBank`` computes a period the first time it is
+requested and keeps it per pair and candles in a bounded ``GeneCache``, so
+backtests only pay for the referenced periods and hyperopt fills the bank on
+demand.
+
+Strategies that hyperopt a period (FAdxSmaStrategy, Bandtastic, ...) instead
+need a column for every value of an ``IntParameter`` range. ``MaBlock`` holds
+the SMAs or EMAs of all those periods as rows of one contiguous
+(periods x candles) array, computed in one call by a compiled kernel running
+TA-Lib's running sum (SMA) or recursion (EMA) for every row. Column names map
+to rows, and the block is added to the dataframe with a single ``concat``
+instead of one insert per period.
+"""
+
+import types
+
+import numpy as np
+from pandas import DataFrame
+
+from .arrays import first_valid
+from .gene_cache import GeneCache
+from .jit import njit
+
+
+class MaBank:
+    def __init__(self, function, max_bytes=256 * 1024 * 1024):
+        """
+        :param function: Called as ``function(dataframe, timeperiod=period)``, e.g. ``ta.TEMA``
+        :param max_bytes: Memory budget of the cached arrays
+        """
+        self.function = function
+        self.cache = GeneCache(max_bytes=max_bytes)
+
+    def get(self, dataframe: DataFrame, period: int, pair=None) -> np.ndarray:
+        """Moving average over ``period`` candles as a read-only float array"""
+        return self.cache.get(
+            pair, dataframe, period,
+            lambda: self.function(dataframe, timeperiod=period)
+        )
+
+
+@njit(cache=True)
+def _sma_rows(values, periods, start, block):
+    # TA-Lib's running sum: add the newest price, divide, subtract the oldest (rows longer than the prices are skipped)
+    for row in range(len(periods)):
+        period = periods[row]
+        if period > len(values) - start:
+            continue
+        total = 0.0
+        for i in range(start, start + period - 1):
+            total += values[i]
+        for i in range(start + period - 1, len(values)):
+            total += values[i]
+            block[row, i] = total / period
+            total -= values[i - period + 1]
+
+
+def sma_block(values, periods) -> np.ndarray:
+    """
+    Simple moving averages of ``values`` for every period, one row per period.
+    Same running sum as ``ta.SMA``, so rows equal ``ta.SMA`` bit for bit.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    block = np.full((len(periods), len(values)), np.nan)
+    _sma_rows(values, np.asarray(periods, dtype=np.int64), first_valid(values), block)
+    return block
+
+
+def _ema_recursion(values, alphas, first, block):
+    # block[row, first[row]] holds the seed, the recursion fills the rest of the row (rows with first < 0 are skipped)
+    for row in range(len(alphas)):
+        if first[row] < 0:
+            continue
+        alpha = alphas[row]
+        ema = block[row, first[row]]
+        for i in range(first[row] + 1, len(values)):
+            ema = (values[i] - ema) * alpha + ema
+            block[row, i] = ema
+
+
+def _renamed(function, name):
+    """Copy of ``function`` under ``name``: numba caches by qualified name, whatever the compile options"""
+    copy = types.FunctionType(function.__code__, function.__globals__, name)
+    copy.__qualname__ = name
+    return copy
+
+
+_ema_rows = njit(cache=True)(_ema_recursion)
+# The update compiled to a fused multiply-add where the CPU has one
+_ema_rows_fused = njit(cache=True, fastmath={'contract'})(_renamed(_ema_recursion, '_ema_rows_fused'))
+
+
+_EMA_KERNEL = []
+
+
+def _ema_kernel():
+    """
+    The recursion kernel reproducing the installed ``ta.EMA`` bit for bit: TA-Lib
+    builds differ in whether the compiler fused the update's multiply-add.
+    """
+    if not _EMA_KERNEL:
+        kernel = _ema_rows
+        try:
+            import talib
+            probe = 100 + np.cumsum(np.random.default_rng(0).normal(0, 1, 256))
+            fused = _ema_block(probe, [5], _ema_rows_fused)[0]
+            if np.array_equal(fused, talib.EMA(probe, 5), equal_nan=True):
+                kernel = _ema_rows_fused
+        except ImportError:
+            pass
+        _EMA_KERNEL.append(kernel)
+    return _EMA_KERNEL[0]
+
+
+def _ema_block(values: np.ndarray, periods, kernel) -> np.ndarray:
+    periods = np.asarray(periods, dtype=np.int64)
+    block = np.full((len(periods), len(values)), np.nan)
+    start = first_valid(values)
+    rows = np.flatnonzero(periods <= len(values) - start)
+    if not len(rows):
+        return block
+    # Seeded with the SMA of the first ``period`` values, summed in order like TA-Lib
+    sums = np.cumsum(values[start:])
+    first = np.full(len(periods), -1, dtype=np.int64)
+    first[rows] = start + periods[rows] - 1
+    block[rows, first[rows]] = sums[periods[rows] - 1] / periods[rows]
+    copies = rows[periods[rows] == 1]
+    block[copies, start:] = values[start:]
+    first[copies] = -1
+    kernel(values, 2.0 / (periods + 1), first, block)
+    return block
+
+
+def ema_block(values, periods) -> np.ndarray:
+    """
+    Exponential moving averages of ``values`` for every period, one row per
+    period. Same seed, summation order and recursion as ``ta.EMA`` and, with
+    numba, the same (fused or not) multiply-add as the installed TA-Lib build,
+    so rows equal ``ta.EMA`` bit for bit. Without numba they can differ from
+    a fused TA-Lib build by floating point rounding (~1e-15 relative).
+    """
+    return _ema_block(np.asarray(values, dtype=np.float64), periods, _ema_kernel())
+
+
+class MaBlock:
+    def __init__(self, block_function, values, columns: dict):
+        """
+        :param block_function: ``sma_block`` or ``ema_block``
+        :param values: Prices, e.g. ``dataframe['close']``
+        :param columns: Mapping of column name -> period, periods shared by several names are computed once
+        """
+        periods = sorted(set(int(period) for period in columns.values()))
+        position = {period: row for row, period in enumerate(periods)}
+        self.periods = periods
+        self.values = block_function(values, periods)
+        self.rows = {name: position[int(period)] for name, period in columns.items()}
+
+    def __getitem__(self, name) -> np.ndarray:
+        return self.values[self.rows[name]]
+
+    def __contains__(self, name) -> bool:
+        return name in self.rows
+
+    def frame(self, dataframe: DataFrame) -> DataFrame:
+        """The named rows as columns indexed like ``dataframe``, ready to be concatenated to it"""
+        return DataFrame(self.values[list(self.rows.values())].T,
+                         index=dataframe.index, columns=list(self.rows))
@@ -0,0 +1,134 @@
+"""
+Causal min/max normalisation.
+
+``(x - x.min()) / (x.max() - x.min())`` over a whole series uses the extremes
+of candles that are still in the future for most rows (a lookahead bias).
+``RollingMinMax`` scales every value with the min/max of the values seen so
+far, either since the start (expanding) or over the last ``window`` values.
+Its state is a pair of monotonic deques, so appending a candle costs O(1)
+amortised.
+
+``CausalNormalizer`` keeps one ``RollingMinMax`` per key (pair and column) and,
+when called again with a dataframe that continues the previous one, only
+processes the new candles. In live mode that means a single update per candle
+instead of renormalising the whole history.
+"""
+
+from collections import OrderedDict, deque
+
+import numpy as np
+from pandas import DatetimeIndex, Series
+
+
+def _scale(values, low, high):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scaled = np.subtract(values, low) / np.subtract(high, low)
+    return np.where(high == low, np.nan, scaled)
+
+
+class RollingMinMax:
+    def __init__(self, window=None):
+        """
+        :param window: Number of candles the min/max is taken over, None for expanding
+        """
+        self.window = window
+        self.count = 0
+        self._max = deque()
+        self._min = deque()
+
+    def _push(self, position, value):
+        if self.window:
+            while self._max and self._max[0][0] <= position - self.window:
+                self._max.popleft()
+            while self._min and self._min[0][0] <= position - self.window:
+                self._min.popleft()
+        if value != value:  # NaN does not take part in the min/max
+            return
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((position, value))
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((position, value))
+
+    def update(self, value) -> float:
+        """Add the next value and return it normalised"""
+        value = float(value)
+        self._push(self.count, value)
+        self.count += 1
+        if not self._max:
+            return np.nan
+        return float(_scale(value, self._min[0][1], self._max[0][1]))
+
+    def transform(self, values) -> np.ndarray:
+        """Add a batch of values and return them normalised"""
+        values = np.asarray(values, dtype=np.float64)
+        if self.count:
+            return np.array([self.update(value) for value in values])
+
+        # Fresh state: vectorised pass, then rebuild the deques from the tail
+        series = Series(values)
+        if self.window:
+            rolling = series.rolling(self.window, min_periods=1)
+        else:
+            rolling = series.expanding(min_periods=1)
+        normalised = _scale(values, rolling.min().to_numpy(), rolling.max().to_numpy())
+
+        if self.window:
+            start = max(0, len(values) - self.window)
+            for position in range(start, len(values)):
+                self._push(position, values[position])
+        elif len(values) and not np.isnan(values).all():
+            self._push(int(np.nanargmin(values)), values[np.nanargmin(values)])
+            self._push(int(np.nanargmax(values)), values[np.nanargmax(values)])
+        self.count = len(values)
+        return normalised
+
+
+class CausalNormalizer:
+    def __init__(self, window=None, max_keys=1024):
+        """
+        :param window: See ``RollingMinMax``
+        :param max_keys: Number of series states kept, least recently used are dropped
+        """
+        self.window = window
+        self.max_keys = max_keys
+        self._states = OrderedDict()
+
+    def normalize(self, key, dates, values) -> np.ndarray:
+        """
+        Normalise ``values`` causally.
+        :param key: Identity of the series, e.g. (pair, column). None keeps no state
+        :param dates: Candle dates of ``values``, used to detect already processed candles
+        :return: Normalised values aligned with ``values``
+        """
+        dates = DatetimeIndex(dates).as_unit("ns").asi8
+        values = np.asarray(values, dtype=np.float64)
+
+        if key is None:
+            return RollingMinMax(self.window).transform(values)
+
+        state = self._states.get(key)
+        if state is not None and len(dates):
+            scaler, old_dates, old_output = state
+            start = int(np.searchsorted(old_dates, dates[0]))
+            overlap = len(old_dates) - start
+            if (
+                start < len(old_dates)
+                and overlap <= len(dates)
+                and np.array_equal(old_dates[start:], dates[:overlap])
+            ):
+                output = np.concatenate((old_output[start:], scaler.transform(values[overlap:])))
+                self._store(key, scaler, dates, output)
+                return output
+
+        scaler = RollingMinMax(self.window)
+        output = scaler.transform(values)
+        self._store(key, scaler, dates, output)
+        return output
+
+    def _store(self, key, scaler, dates, output):
+        self._states[key] = (scaler, dates, output)
+        self._states.move_to_end(key)
+        while len(self._states) > self.max_keys:
+            self._states.popitem(last=False)
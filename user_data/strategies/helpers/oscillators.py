@@ -0,0 +1,93 @@
+"""
+RSI and CCI for many periods at once.
+
+SwingHighToSky hyperopts the periods of its RSI and CCI and used to call
+``ta.RSI``/``ta.CCI`` once per period and space, ~280 passes per pair with
+the buy and sell ranges duplicating each other. ``rsi_block`` and
+``cci_block`` compute a set of distinct periods in one compiled call and
+return one row per period: the close-to-close gains/losses and the typical
+price are computed once and shared by every period. Both follow TA-Lib's
+loops: the RSI matches up to floating point rounding, the CCI exactly (its
+window is summed in TA-Lib's circular buffer order and a window flat up to
+rounding is 0 rather than noise divided by noise).
+"""
+
+import numpy as np
+
+from .arrays import first_valid
+from .jit import njit
+
+
+@njit(cache=True)
+def _rsi_rows(gains, losses, periods, start, block):
+    # gains[i]/losses[i] are the change from candle i - 1 to i
+    n = len(gains)
+    for row in range(len(periods)):
+        period = periods[row]
+        if start + period >= n:
+            continue
+        gain = 0.0
+        loss = 0.0
+        for i in range(start + 1, start + period + 1):
+            gain += gains[i]
+            loss += losses[i]
+        gain /= period
+        loss /= period
+        for i in range(start + period, n):
+            if i > start + period:
+                gain = (gain * (period - 1) + gains[i]) / period
+                loss = (loss * (period - 1) + losses[i]) / period
+            total = gain + loss
+            block[row, i] = 100 * (gain / total) if total != 0.0 else 0.0
+
+
+@njit(cache=True)
+def _cci_rows(typical, periods, start, block):
+    n = len(typical)
+    for row in range(len(periods)):
+        period = periods[row]
+        for i in range(start + period - 1, n):
+            first = i - period + 1
+            # TA-Lib keeps the window in a circular buffer starting at ``start`` and
+            # sums it in buffer order: the candles from ``split`` on, then the older ones
+            split = i + 1 - (first - start) % period
+            average = 0.0
+            for j in range(split, i + 1):
+                average += typical[j]
+            for j in range(first, split):
+                average += typical[j]
+            average /= period
+            deviation = 0.0
+            for j in range(split, i + 1):
+                deviation += abs(typical[j] - average)
+            for j in range(first, split):
+                deviation += abs(typical[j] - average)
+            change = typical[i] - average
+            deviation /= period
+            # A window flat up to rounding is 0, as in TA-Lib
+            if change != 0.0 and deviation > 1e-14 * abs(average):
+                block[row, i] = change / (0.015 * deviation)
+            else:
+                block[row, i] = 0.0
+
+
+def rsi_block(close, periods) -> np.ndarray:
+    """RSI of ``close`` for every period (as ``ta.RSI``), one row per period"""
+    close = np.asarray(close, dtype=np.float64)
+    block = np.full((len(periods), len(close)), np.nan)
+    if len(periods) and len(close):
+        change = np.concatenate(([0.0], np.diff(close)))
+        gains = np.where(change > 0, change, 0.0)
+        losses = np.where(change < 0, -change, 0.0)
+        _rsi_rows(gains, losses, np.asarray(periods, dtype=np.int64), first_valid(close), block)
+    return block
+
+
+def cci_block(high, low, close, periods) -> np.ndarray:
+    """CCI for every period (as ``ta.CCI``), one row per period"""
+    high, low, close = (np.asarray(values, dtype=np.float64) for values in (high, low, close))
+    typical = (high + low + close) / 3
+    block = np.full((len(periods), len(close)), np.nan)
+    if len(periods):
+        _cci_rows(typical, np.asarray(periods, dtype=np.int64), first_valid(typical), block)
+    return block
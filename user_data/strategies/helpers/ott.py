@@ -0,0 +1,76 @@
+"""
+Optimized Trend Tracker (OTT) engine used by FOttStrategy.
+
+The original port ran whole-column passes inside ``for i in df["UD"]`` loops
+until the long-stop/short-stop ratchets and the dir state settled, which costs
+O(N^2) in the candle count. Those loops converge to the row-by-row recursion
+of the Pine script, so this module computes VAR, both stops, dir and OTT in a
+single O(N) pass over NumPy arrays instead.
+"""
+
+import numpy as np
+from pandas import DataFrame, Series
+
+from .jit import njit
+
+
+@njit(cache=True)
+def _ott_kernel(close, cmo, pds, percent):
+    n = len(close)
+    alpha = 2 / (pds + 1)
+    var = np.zeros(n)
+    ott = np.full(n, np.nan)
+
+    longstop = np.nan
+    shortstop = np.nan
+    direction = 1
+    for i in range(n):
+        # Variable index dynamic average, weighted by the Chande momentum oscillator
+        if i >= pds:
+            var[i] = (alpha * cmo[i] * close[i]) + (1 - alpha * cmo[i]) * var[i - 1]
+
+        # Crossings are evaluated against the previous candle's stops
+        if i > 0:
+            if var[i - 1] < shortstop and var[i] > shortstop:
+                direction = 1
+            elif var[i - 1] > longstop and var[i] < longstop:
+                direction = -1
+
+        fark = var[i] * percent * 0.01
+        newlongstop = var[i] - fark
+        newshortstop = var[i] + fark
+        # Ratchet the stops while VAR stays on their side
+        longstop = max(newlongstop, longstop) if var[i] > longstop else newlongstop
+        shortstop = min(newshortstop, shortstop) if var[i] < shortstop else newshortstop
+
+        mt = longstop if direction == 1 else shortstop
+        if i + 2 < n:
+            if var[i] > mt:
+                ott[i + 2] = mt * (200 + percent) / 200
+            else:
+                ott[i + 2] = mt * (200 - percent) / 200
+    return var, ott
+
+
+def chande_momentum(close: Series, length=9) -> np.ndarray:
+    """Absolute Chande momentum over ``length`` candles, 0 where undefined"""
+    prev = close.shift(1)
+    ud1 = Series(np.where(close > prev, (close - prev), 0), index=close.index)
+    dd1 = Series(np.where(close < prev, (prev - close), 0), index=close.index)
+    ud = ud1.rolling(length).sum()
+    dd = dd1.rolling(length).sum()
+    return ((ud - dd) / (ud + dd)).fillna(0).abs().to_numpy(dtype=np.float64)
+
+
+def ott(dataframe: DataFrame, pds=2, percent=1.4) -> DataFrame:
+    """
+    Optimized Trend Tracker
+    :param pds: Length of the variable moving average
+    :param percent: Distance of the trailing stops, in percent
+    :return: DataFrame with the 'OTT' line and the 'VAR' moving average
+    """
+    close = dataframe["close"]
+    var, ott_line = _ott_kernel(
+        close.to_numpy(dtype=np.float64), chande_momentum(close), pds, percent
+    )
+    return DataFrame(index=dataframe.index, data={"OTT": ott_line, "VAR": var})
@@ -0,0 +1,141 @@
+"""
+Candlestick patterns as one int8 matrix.
+
+The PatternRecognition strategies stored the output of every TA-Lib CDL
+function as its own int64 column, although a pattern only ever returns
+0, ±80, ±100 or ±200. ``PatternMatrix`` keeps all patterns of a pair in a
+single (patterns x candles) int8 array of codes (value / ``SCALE``) with a
+name -> row index, and answers the queries the strategies need: the values
+of a pattern, rows where a pattern has a given value, and the patterns that
+fired on a given candle.
+
+``PatternStore`` keeps the latest matrix per pair and only recomputes it
+when asked for candles or patterns it does not cover. Queries take the
+dataframe they are evaluated on and align on its dates, so a matrix computed
+in ``populate_indicators`` can be used on the startup-trimmed dataframes of
+hyperopt epochs. ``required_patterns`` picks what to compute: the whole
+parameter space when hyperopting, only the active patterns otherwise.
+``PatternMixin`` gives a strategy ``self.patterns(dataframe, metadata)``
+built on both.
+"""
+
+import numpy as np
+import talib
+from freqtrade.enums import RunMode
+from pandas import DataFrame, DatetimeIndex
+
+PATTERNS = talib.get_function_groups()['Pattern Recognition']
+
+# TA-Lib pattern values are multiples of 20 within [-200, 200]
+SCALE = 20
+
+
+def _dates(dataframe: DataFrame) -> np.ndarray:
+    return DatetimeIndex(dataframe['date']).as_unit('ns').asi8
+
+
+class PatternMatrix:
+    def __init__(self, dates, names, codes):
+        """
+        :param dates: Candle dates as int64 nanoseconds
+        :param names: Pattern names, one per row of ``codes``
+        :param codes: (patterns x candles) int8 array of pattern values / SCALE
+        """
+        self.dates = dates
+        self.names = tuple(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.codes = codes
+
+    @classmethod
+    def compute(cls, dataframe: DataFrame, names=PATTERNS) -> 'PatternMatrix':
+        prices = [dataframe[column].to_numpy(dtype=np.float64)
+                  for column in ('open', 'high', 'low', 'close')]
+        codes = np.empty((len(names), len(dataframe)), dtype=np.int8)
+        for i, name in enumerate(names):
+            codes[i] = getattr(talib, name)(*prices) // SCALE
+        return cls(_dates(dataframe), names, codes)
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + self.dates.nbytes
+
+    def _columns(self, dataframe: DataFrame):
+        """Columns of ``codes`` matching the rows of ``dataframe``, None if not covered"""
+        if dataframe is None:
+            return slice(None)
+        dates = _dates(dataframe)
+        start = int(np.searchsorted(self.dates, dates[0])) if len(dates) else 0
+        stop = start + len(dates)
+        if stop <= len(self.dates) and np.array_equal(self.dates[start:stop], dates):
+            return slice(start, stop)
+        columns = np.searchsorted(self.dates, dates)
+        if (columns < len(self.dates)).all() and np.array_equal(self.dates[columns], dates):
+            return columns
+        return None
+
+    def covers(self, dataframe: DataFrame, names) -> bool:
+        return all(name in self.index for name in names) and \
+            self._columns(dataframe) is not None
+
+    def values(self, name: str, dataframe: DataFrame = None) -> np.ndarray:
+        """Pattern values (e.g. -100/0/100) as int16"""
+        return self.codes[self.index[name], self._columns(dataframe)].astype(np.int16) * SCALE
+
+    def equals(self, name: str, value, dataframe: DataFrame = None) -> np.ndarray:
+        """Boolean mask of the candles where pattern ``name`` has ``value``"""
+        codes = self.codes[self.index[name], self._columns(dataframe)]
+        if value % SCALE:
+            return np.zeros(len(codes), dtype=bool)
+        return codes == value // SCALE
+
+    def rows(self, name: str, value) -> np.ndarray:
+        """Row numbers where pattern ``name`` has ``value``"""
+        return np.flatnonzero(self.equals(name, value))
+
+    def fired(self, row: int) -> dict:
+        """Patterns with a non-zero value on candle ``row``, as name -> value"""
+        codes = self.codes[:, row]
+        return {self.names[i]: int(codes[i]) * SCALE for i in np.flatnonzero(codes)}
+
+
+class PatternStore:
+    def __init__(self):
+        self._matrices = {}
+
+    def get(self, pair, dataframe: DataFrame, names=PATTERNS) -> PatternMatrix:
+        """Pattern matrix of ``pair`` covering ``dataframe`` and ``names``, computed if needed"""
+        matrix = self._matrices.get(pair)
+        if matrix is None or not matrix.covers(dataframe, names):
+            matrix = PatternMatrix.compute(dataframe, names)
+            self._matrices[pair] = matrix
+        return matrix
+
+
+def required_patterns(config: dict, names, active) -> list:
+    """
+    Patterns to compute for the run mode: all ``names`` (the hyperopt space)
+    when hyperopting, so they are computed once per pair and reused by every
+    epoch, and only the ``active`` ones in backtesting, dry-run and live.
+    """
+    if config.get('runmode') == RunMode.HYPEROPT:
+        return list(names)
+    return [name for name in names if name in active]
+
+
+class PatternMixin:
+    """
+    Mix into an ``IStrategy`` (before it) to get ``self.patterns(dataframe, metadata)``.
+    The strategy defines ``prs``, the pattern names of its hyperopt space, and
+    ``buy_pr1``, the active pattern (override ``active_patterns`` for more).
+    """
+
+    def active_patterns(self) -> list:
+        """Patterns the current parameter values read"""
+        return [self.buy_pr1.value]
+
+    def patterns(self, dataframe: DataFrame, metadata: dict) -> PatternMatrix:
+        """Pattern matrix of the pair covering ``dataframe``, computed once per pair and candles"""
+        # Hyperopt computes every pattern once per pair, other run modes only the active ones
+        names = required_patterns(self.config, self.prs, self.active_patterns())
+        store = self.__dict__.setdefault('_pattern_store', PatternStore())
+        return store.get(metadata['pair'], dataframe, names)
@@ -0,0 +1,238 @@
+"""
+Incremental OHLCV resampling to a higher timeframe.
+
+Strategies such as ReinforcedQuickie, MultiRSI or VolatilitySystem resample
+every dataframe to a multiple of their timeframe with pandas (directly or via
+``technical.util.resample_to_interval``), compute an indicator on the
+resampled candles and merge it back, on every ``populate_indicators``. In
+live mode only the newest higher-timeframe bucket changes between two calls.
+
+``Resampler`` keeps the resampled candles of every (pair, timeframe, target
+minutes) in growable arrays and, when called with a dataframe that continues
+the previous one, only folds the new base candles into the open bucket or
+appends new buckets. Buckets follow pandas' ``resample`` (left closed, aligned on the
+midnight of the first candle, empty buckets dropped), so the candles equal
+``resample_to_interval``'s, and every ``Candles`` carries the bucket of each
+base candle (``index``). The result is cached per dataframe span, so strategies
+sharing ``RESAMPLER`` (one per process) and asking for the same pair, timeframe
+and target minutes reuse one set of arrays. Two merge functions map values of
+the resampled candles back onto the base candles as arrays:
+
+* ``merge_closed``: like ``technical.util.resampled_merge`` with ``fill_na``,
+  a bucket becomes visible on its last base candle and is forward filled.
+* ``interpolate_right``: like resampling with ``label="right"``, upsampling
+  and ``interpolate(method='time')`` (ReinforcedQuickie, CCIStrategy).
+"""
+
+from collections import OrderedDict
+
+import numpy as np
+from freqtrade.exchange import timeframe_to_minutes
+from pandas import DataFrame
+
+_TICKS_PER_MINUTE = {'s': 60, 'ms': 60_000, 'us': 60_000_000, 'ns': 60_000_000_000}
+
+
+def _dates(dataframe: DataFrame):
+    """Candle dates as int64 ticks and their unit"""
+    dates = dataframe['date'].array
+    return dates.asi8, dates.unit
+
+
+class Candles:
+    """
+    Resampled candles: bucket start dates as int64 ticks and float64 OHLCV
+    arrays, plus ``index``, the bucket of every base candle of the dataframe.
+    """
+
+    __slots__ = ('dates', 'open', 'high', 'low', 'close', 'volume', 'index', 'unit', 'minutes', 'timeframe')
+
+    def __init__(self, dates, open_, high, low, close, volume, index, unit, minutes, timeframe):
+        self.dates = dates
+        self.open = open_
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self.index = index
+        self.unit = unit
+        self.minutes = minutes
+        self.timeframe = timeframe
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @property
+    def inputs(self) -> dict:
+        """Price arrays as accepted by ``talib.abstract`` functions"""
+        return {'open': self.open, 'high': self.high, 'low': self.low,
+                'close': self.close, 'volume': self.volume}
+
+
+class _Buckets:
+    """Growable arrays of the resampled candles of one pair"""
+
+    def __init__(self, origin: int, size: int, capacity=1024):
+        self.origin = origin
+        self.size = size
+        self.count = 0
+        self.last = None
+        self.dates = np.empty(capacity, dtype=np.int64)
+        self.prices = np.empty((5, capacity), dtype=np.float64)
+
+    def starts(self, dates: np.ndarray) -> np.ndarray:
+        return self.origin + (dates - self.origin) // self.size * self.size
+
+    def append(self, dates, prices):
+        """Fold new base candles (dates ascending, after ``last``) into the buckets"""
+        if not len(dates):
+            return
+        starts = self.starts(dates)
+        offsets = np.flatnonzero(np.r_[True, starts[1:] != starts[:-1]])
+        ends = np.r_[offsets[1:], len(dates)] - 1
+        grouped = np.stack((
+            prices[0][offsets],
+            np.fmax.reduceat(prices[1], offsets),
+            np.fmin.reduceat(prices[2], offsets),
+            prices[3][ends],
+            np.add.reduceat(prices[4], offsets),
+        ))
+        starts = starts[offsets]
+
+        if self.count and starts[0] == self.dates[self.count - 1]:
+            # The first new candles belong to the open bucket
+            bucket = self.prices[:, self.count - 1]
+            bucket[1] = max(bucket[1], grouped[1, 0])
+            bucket[2] = min(bucket[2], grouped[2, 0])
+            bucket[3] = grouped[3, 0]
+            bucket[4] += grouped[4, 0]
+            starts, grouped = starts[1:], grouped[:, 1:]
+
+        needed = self.count + len(starts)
+        if needed > len(self.dates):
+            capacity = max(needed, 2 * len(self.dates))
+            self.dates = np.resize(self.dates, capacity)
+            prices_ = np.empty((5, capacity), dtype=np.float64)
+            prices_[:, :self.count] = self.prices[:, :self.count]
+            self.prices = prices_
+        self.dates[self.count:needed] = starts
+        self.prices[:, self.count:needed] = grouped
+        self.count = needed
+        self.last = dates[-1]
+
+
+class Resampler:
+    def __init__(self, max_pairs=256):
+        """
+        :param max_pairs: Number of (pair, timeframe, minutes) states kept, least recently used are dropped
+        """
+        self.max_pairs = max_pairs
+        self._states = OrderedDict()
+        # Last result per key with the span (length, first and last date) it was built for
+        self._candles = OrderedDict()
+
+    def update(self, pair, dataframe: DataFrame, timeframe: str, minutes: int) -> Candles:
+        """Candles of ``dataframe`` (of ``timeframe``) resampled to ``minutes``"""
+        dates, unit = _dates(dataframe)
+        key = (pair, timeframe, minutes, unit)
+        span = (len(dates), dates[0], dates[-1]) if len(dates) else (0,)
+        cached = self._candles.get(key)
+        if cached is not None and cached[0] == span:
+            self._candles.move_to_end(key)
+            return cached[1]
+
+        candles = self._update(key, dataframe, dates)
+        self._candles[key] = (span, candles)
+        self._candles.move_to_end(key)
+        while len(self._candles) > self.max_pairs:
+            self._candles.popitem(last=False)
+        return candles
+
+    def _update(self, key, dataframe: DataFrame, dates: np.ndarray) -> Candles:
+        _, timeframe, minutes, unit = key
+        prices = np.stack([dataframe[column].to_numpy(dtype=np.float64)
+                           for column in ('open', 'high', 'low', 'close', 'volume')])
+        size = minutes * _TICKS_PER_MINUTE[unit]
+        day = 1440 * _TICKS_PER_MINUTE[unit]
+        origin = dates[0] - dates[0] % day if len(dates) else 0
+
+        state = self._states.get(key)
+        start = self._continues(state, dates, origin)
+        if start is None:
+            state = _Buckets(origin, size)
+            start = 0
+        state.append(dates[start:], prices[:, start:])
+        self._states[key] = state
+        self._states.move_to_end(key)
+        while len(self._states) > self.max_pairs:
+            self._states.popitem(last=False)
+
+        if not len(dates):
+            return Candles(*(np.empty(0),) * 6, np.empty(0, dtype=np.int64), unit, minutes, timeframe)
+
+        # Buckets covering the dataframe. The first one is aggregated again from the
+        # dataframe's candles only, as older candles of that bucket may have been seen
+        starts = state.starts(dates)
+        index = np.r_[0, np.cumsum(starts[1:] != starts[:-1])]
+        first = int(np.searchsorted(state.dates[:state.count], starts[0]))
+        bucket_dates = state.dates[first:state.count].copy()
+        bucket_prices = state.prices[:, first:state.count].copy()
+        head = prices[:, :int(np.searchsorted(index, 1))]
+        bucket_prices[:, 0] = (head[0, 0], np.nanmax(head[1]), np.nanmin(head[2]),
+                               head[3, -1], head[4].sum())
+        # Shared with every caller asking for the same span
+        for array in (bucket_dates, bucket_prices, index):
+            array.flags.writeable = False
+        return Candles(bucket_dates, *bucket_prices, index, unit, minutes, timeframe)
+
+    @staticmethod
+    def _continues(state, dates, origin):
+        """Position of the first new candle if ``dates`` continue ``state``, else None"""
+        if state is None or not state.count or not len(dates):
+            return None
+        if (origin - state.origin) % state.size or dates[0] < state.dates[0]:
+            return None
+        position = int(np.searchsorted(dates, state.last))
+        if position == len(dates) or dates[position] != state.last:
+            return None
+        return position + 1
+
+
+def merge_closed(dataframe: DataFrame, candles: Candles, values) -> np.ndarray:
+    """
+    Values of the resampled candles on the base candles: a bucket's value is
+    set on its last base candle (bucket start + size - timeframe) and forward
+    filled, NaN values are skipped.
+    """
+    dates, unit = _dates(dataframe)
+    ticks = _TICKS_PER_MINUTE[unit]
+    values = np.asarray(values, dtype=np.float64)
+    merge_dates = candles.dates + (candles.minutes - timeframe_to_minutes(candles.timeframe)) * ticks
+    index = candles.index
+    closing = (dates == merge_dates[index]) & ~np.isnan(values[index])
+
+    filled = np.where(closing, index, -1)
+    filled = np.maximum.accumulate(filled) if len(filled) else filled
+    return np.where(filled >= 0, values[filled], np.nan)
+
+
+def interpolate_right(dataframe: DataFrame, candles: Candles, values) -> np.ndarray:
+    """
+    Values of the resampled candles labelled with their bucket end, linearly
+    interpolated in time onto the base candles. NaN before the first valid
+    value and outside the labelled range.
+    """
+    dates, unit = _dates(dataframe)
+    values = np.asarray(values, dtype=np.float64)
+    labels = candles.dates + candles.minutes * _TICKS_PER_MINUTE[unit]
+    valid = ~np.isnan(values)
+    if not valid.any():
+        return np.full(len(dates), np.nan)
+    result = np.interp(dates, labels[valid], values[valid])
+    outside = (dates < labels[valid][0]) | (dates > labels[-1])
+    result[outside] = np.nan
+    return result
+
+
+# Shared by all strategies of the process
+RESAMPLER = Resampler()
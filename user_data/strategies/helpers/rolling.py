@@ -0,0 +1,29 @@
+"""
+Rolling means over any window from one cumulative sum.
+
+Strategy005 hyperopts the window of a volume mean it reads in
+``populate_entry_trend``, so every epoch built a new ``rolling(window).mean()``
+over the whole history. ``cumulative_sum`` is computed once per pair in
+``populate_indicators`` (and stored as a column, so it travels with the
+analysed dataframe to the hyperopt workers); ``window_mean`` then reads the
+mean over any window with one subtraction and one division per candle.
+Results equal ``Series.rolling(window).mean()`` up to floating point
+rounding, NaN values are counted as 0.
+"""
+
+import numpy as np
+
+
+def cumulative_sum(values) -> np.ndarray:
+    """Running sum of ``values`` as float64, NaN counted as 0"""
+    return np.cumsum(np.nan_to_num(np.asarray(values, dtype=np.float64)))
+
+
+def window_mean(sums, window: int) -> np.ndarray:
+    """Mean over the last ``window`` values from their ``cumulative_sum``, NaN for the first ``window - 1``"""
+    sums = np.asarray(sums, dtype=np.float64)
+    means = np.full(len(sums), np.nan)
+    if 0 < window <= len(sums):
+        means[window - 1] = sums[window - 1] / window
+        means[window:] = (sums[window:] - sums[:-window]) / window
+    return means
@@ -0,0 +1,58 @@
+"""
+Last analysed candle snapshots for trade callbacks.
+
+``custom_stoploss``, ``custom_exit`` and friends are called per open trade on
+every throttle tick (and per candle per trade in backtesting), and typically
+do ``dataframe.iloc[-1].squeeze()``, building a pandas Series of the whole
+row each time. ``LastCandleMixin.last_candle`` returns a ``Candle`` record of
+the last analysed row, created once per pair and new candle, which reads only
+the columns a callback asks for and remembers them for the following calls.
+"""
+
+from pandas import DataFrame
+
+
+class Candle:
+    """
+    Last row of an analysed dataframe, indexed by column name. Values are read
+    from the column arrays on first access, so no row Series is ever built.
+    """
+
+    __slots__ = ('_dataframe', '_values')
+
+    def __init__(self, dataframe: DataFrame):
+        self._dataframe = dataframe
+        self._values = {}
+
+    def __getitem__(self, name):
+        try:
+            return self._values[name]
+        except KeyError:
+            value = self._values[name] = self._dataframe[name].iat[-1]
+            return value
+
+    def __contains__(self, name) -> bool:
+        return name in self._dataframe.columns
+
+    def get(self, name, default=None):
+        return self[name] if name in self else default
+
+
+class LastCandleMixin:
+    """Mix into an ``IStrategy`` (before it) to get ``self.last_candle(pair)``"""
+
+    def last_candle(self, pair: str, timeframe: str = None):
+        """Last analysed candle of ``pair``, None if there is no analysed dataframe"""
+        timeframe = timeframe or self.timeframe
+        dataframe, analyzed = self.dp.get_analyzed_dataframe(pair, timeframe)
+        if dataframe is None or not len(dataframe.index):
+            return None
+
+        # Live re-analysis changes the analysed date, backtesting moves the last index
+        key = (analyzed, dataframe.index[-1])
+        snapshots = self.__dict__.setdefault('_last_candles', {})
+        snapshot = snapshots.get((pair, timeframe))
+        if snapshot is None or snapshot[0] != key:
+            snapshot = (key, Candle(dataframe))
+            snapshots[(pair, timeframe)] = snapshot
+        return snapshot[1]
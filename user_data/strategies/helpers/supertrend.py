@@ -0,0 +1,152 @@
+"""
+Supertrend engine shared by Supertrend and FSupertrendStrategy.
+
+The band recursion of the original implementation
+(https://github.com/freqtrade/freqtrade-strategies/issues/30) is run in a single
+pass over NumPy arrays instead of per-row ``DataFrame.iat`` access on a copy of
+the whole dataframe. The results are bit-identical to the original code.
+
+``supertrend_grid``/``supertrend_columns`` evaluate a whole multiplier x period
+space at once: the true range is computed once, the ATR once per period and
+every distinct (multiplier, period) pair once.
+
+The STX direction is either the original 'up'/'down' string label or, with
+``encoding="int8"``, a compact UP (+1) / DOWN (-1) / NO_TREND (0) code that
+takes one byte per candle instead of a Python string object.
+"""
+
+import numpy as np
+import talib.abstract as ta
+from pandas import DataFrame
+
+from .jit import njit
+
+
+UP = np.int8(1)
+DOWN = np.int8(-1)
+NO_TREND = np.int8(0)
+
+
+@njit(cache=True)
+def _supertrend_line(close, basic_ub, basic_lb, period):
+    n = len(close)
+    final_ub = np.zeros(n)
+    final_lb = np.zeros(n)
+    st = np.zeros(n)
+    for i in range(period, n):
+        # Compute final upper and lower bands
+        if basic_ub[i] < final_ub[i - 1] or close[i - 1] > final_ub[i - 1]:
+            final_ub[i] = basic_ub[i]
+        else:
+            final_ub[i] = final_ub[i - 1]
+        if basic_lb[i] > final_lb[i - 1] or close[i - 1] < final_lb[i - 1]:
+            final_lb[i] = basic_lb[i]
+        else:
+            final_lb[i] = final_lb[i - 1]
+
+        # Set the Supertrend value
+        if st[i - 1] == final_ub[i - 1] and close[i] <= final_ub[i]:
+            st[i] = final_ub[i]
+        elif st[i - 1] == final_ub[i - 1] and close[i] > final_ub[i]:
+            st[i] = final_lb[i]
+        elif st[i - 1] == final_lb[i - 1] and close[i] >= final_lb[i]:
+            st[i] = final_lb[i]
+        elif st[i - 1] == final_lb[i - 1] and close[i] < final_lb[i]:
+            st[i] = final_ub[i]
+        else:
+            st[i] = 0.00
+    return st
+
+
+def trend_direction(st, close, empty="", encoding="str"):
+    """
+    Mark the trend direction up/down
+    :param empty: Direction label used where no trend is defined yet
+    :param encoding: "str" for 'up'/'down' labels, "int8" for UP/DOWN/NO_TREND codes
+    """
+    if encoding == "int8":
+        return np.where((st > 0.00), np.where((close < st), DOWN, UP), NO_TREND).astype(np.int8, copy=False)
+    if encoding != "str":
+        raise ValueError(f"Unknown Supertrend direction encoding '{encoding}'")
+    return np.where((st > 0.00), np.where((close < st), "down", "up"), empty)
+
+
+def supertrend_arrays(high, low, close, atr, multiplier, period, empty="", encoding="str"):
+    """
+    Compute Supertrend from plain float64 arrays.
+    :param atr: Average true range for ``period``
+    :return: Tuple of (ST, STX) arrays, see ``trend_direction`` for the STX encoding
+    """
+    close = np.asarray(close, dtype=np.float64)
+    hl2 = (np.asarray(high, dtype=np.float64) + np.asarray(low, dtype=np.float64)) / 2
+    basic_ub = hl2 + multiplier * atr
+    basic_lb = hl2 - multiplier * atr
+
+    st = _supertrend_line(close, basic_ub, basic_lb, period)
+
+    stx = trend_direction(st, close, empty, encoding)
+    st[np.isnan(st)] = 0.00
+    return st, stx
+
+
+def supertrend(dataframe: DataFrame, multiplier, period, empty="", encoding="str") -> DataFrame:
+    """
+    Supertrend Indicator; adapted for freqtrade
+    from: https://github.com/freqtrade/freqtrade-strategies/issues/30
+    :return: DataFrame with the 'ST' line and the 'STX' up/down direction
+    """
+    atr = ta.SMA(ta.TRANGE(dataframe), period)
+    st, stx = supertrend_arrays(
+        dataframe["high"].to_numpy(),
+        dataframe["low"].to_numpy(),
+        dataframe["close"].to_numpy(),
+        np.asarray(atr, dtype=np.float64),
+        multiplier,
+        period,
+        empty,
+        encoding,
+    )
+    return DataFrame(index=dataframe.index, data={"ST": st, "STX": stx})
+
+
+def supertrend_grid(dataframe: DataFrame, combinations, empty="", encoding="str"):
+    """
+    Compute Supertrend for many (multiplier, period) pairs in one go.
+    :param combinations: Iterable of (multiplier, period); duplicates are computed once
+    :param empty: Direction label used where no trend is defined yet
+    :param encoding: "str" or "int8", see ``trend_direction``
+    :return: Tuple of (keys, ST, STX) where row ``i`` of the 2-D ST/STX arrays
+             belongs to ``keys[i]``
+    """
+    keys = list(dict.fromkeys((int(m), int(p)) for m, p in combinations))
+    high = dataframe["high"].to_numpy()
+    low = dataframe["low"].to_numpy()
+    close = dataframe["close"].to_numpy()
+
+    st = np.empty((len(keys), len(dataframe)))
+    stx = np.empty(
+        (len(keys), len(dataframe)),
+        dtype=np.int8 if encoding == "int8" else np.array(["down", "up", empty]).dtype,
+    )
+
+    tr = ta.TRANGE(dataframe)
+    atrs = {}
+    for row, (multiplier, period) in enumerate(keys):
+        if period not in atrs:
+            atrs[period] = np.asarray(ta.SMA(tr, period), dtype=np.float64)
+        st[row], stx[row] = supertrend_arrays(
+            high, low, close, atrs[period], multiplier, period, empty, encoding
+        )
+    return keys, st, stx
+
+
+def supertrend_columns(dataframe: DataFrame, columns: dict, empty="", encoding="str") -> DataFrame:
+    """
+    Build the STX direction columns for a strategy in a single block.
+    :param columns: Mapping of column name -> (multiplier, period)
+    :return: DataFrame indexed like ``dataframe``, ready to be concatenated to it
+    """
+    keys, _, stx = supertrend_grid(dataframe, columns.values(), empty, encoding)
+    rows = {key: row for row, key in enumerate(keys)}
+    block = stx[[rows[(int(m), int(p))] for m, p in columns.values()]]
+    return DataFrame(block.T, index=dataframe.index, columns=list(columns))
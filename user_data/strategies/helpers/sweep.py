@@ -0,0 +1,134 @@
+"""
+Batched parameter sweeps for strategies with tiny parameter spaces.
+
+The signals of PowerTower, Diamond, HourBasedStrategy, mabStra and Zeus are
+cheap functions of a few parameters, yet hyperopt evaluates one parameter set
+per epoch. These strategies implement ``sweep_entry(dataframe, **params)`` and
+``sweep_exit(dataframe, **params)``: every parameter is either a single value
+or an array with one value per grid point, and the result is a boolean array
+of candles, or a (points x candles) matrix, computed by broadcasting over the
+parameter axis. ``populate_entry_trend``/``populate_exit_trend`` call the same
+functions with the current values, so a sweep evaluates exactly the signals
+a backtest would produce.
+
+``sweep(strategy, dataframe, grid)`` expands a grid (parameter name ->
+values, unspecified parameters keep their current value) into its cartesian
+product and evaluates it in chunks of points small enough to stay in cache. ``dataframe`` must be analysed
+with the grid's periods available: ``analyse`` runs ``populate_indicators``
+with the grid's parameters in the hyperopt space, as hyperopt does, for
+strategies that build one column per value of a range (mabStra).
+
+The building blocks below (``on_points``, ``shifted``, ``columns``,
+``crossed_above``/``crossed_below``) reproduce the pandas/qtpylib semantics
+the strategies use (NaN padding, NaN comparing False) along the last axis.
+"""
+
+import inspect
+
+import numpy as np
+from freqtrade.enums import HyperoptState
+from freqtrade.optimize.hyperopt_tools import HyperoptStateContainer
+from pandas import DataFrame
+
+
+def on_points(values) -> np.ndarray:
+    """A parameter as a column over the grid points (shape (points, 1)), a single value stays a scalar"""
+    values = np.asarray(values)
+    return values[:, None] if values.ndim else values
+
+
+def shifted(values, periods, fill=np.nan) -> np.ndarray:
+    """``Series.shift(periods)`` along the candles for one period or one (>= 0) per point"""
+    values = np.asarray(values)
+    periods = np.asarray(periods, dtype=np.int64)
+    count = values.shape[-1]
+    if not periods.ndim:
+        period = int(periods)
+        result = np.full(values.shape, fill, dtype=np.result_type(values, fill))
+        result[..., period:] = values[..., :max(count - period, 0)]
+        return result
+    values = np.broadcast_to(values, (len(periods), count))
+    result = np.full(values.shape, fill, dtype=np.result_type(values, fill))
+    # One slice copy per distinct period rather than a gather per candle
+    for period in np.unique(periods):
+        rows = periods == period
+        result[rows, period:] = values[rows, :max(count - period, 0)]
+    return result
+
+
+def columns(dataframe: DataFrame, keys, name='{}') -> np.ndarray:
+    """Column ``name.format(key)`` for one key, or one row per point for an array of keys"""
+    keys = np.asarray(keys)
+    if not keys.ndim:
+        return dataframe[name.format(keys)].to_numpy(dtype=np.float64)
+    unique, index = np.unique(keys.ravel(), return_inverse=True)
+    block = np.stack([dataframe[name.format(key)].to_numpy(dtype=np.float64) for key in unique])
+    return block[index.reshape(keys.shape)]
+
+
+def crossed_above(series1, series2) -> np.ndarray:
+    """``qtpylib.crossed_above`` along the last axis"""
+    series1, series2 = np.broadcast_arrays(series1, series2)
+    crossed = series1 > series2
+    crossed[..., 0] = False
+    crossed[..., 1:] &= series1[..., :-1] <= series2[..., :-1]
+    return crossed
+
+
+def crossed_below(series1, series2) -> np.ndarray:
+    """``qtpylib.crossed_below`` along the last axis"""
+    series1, series2 = np.broadcast_arrays(series1, series2)
+    crossed = series1 < series2
+    crossed[..., 0] = False
+    crossed[..., 1:] &= series1[..., :-1] >= series2[..., :-1]
+    return crossed
+
+
+def grid_points(grid: dict) -> dict:
+    """Cartesian product of ``grid`` (name -> values) as one array per name"""
+    values = [np.asarray(list(value)) for value in grid.values()]
+    index = np.indices([len(value) for value in values]).reshape(len(values), -1)
+    return {name: value[row] for name, value, row in zip(grid, values, index)}
+
+
+def analyse(strategy, dataframe: DataFrame, metadata: dict, grid: dict) -> DataFrame:
+    """``populate_indicators`` with the parameters of ``grid`` in the hyperopt space (full ``.range``)"""
+    state = HyperoptStateContainer.state
+    spaces = {name: getattr(strategy, name).in_space for name in grid}
+    try:
+        HyperoptStateContainer.set_state(HyperoptState.INDICATORS)
+        for name in grid:
+            getattr(strategy, name).in_space = True
+        return strategy.populate_indicators(dataframe.copy(), metadata)
+    finally:
+        HyperoptStateContainer.set_state(state)
+        for name, in_space in spaces.items():
+            getattr(strategy, name).in_space = in_space
+
+
+def sweep(strategy, dataframe: DataFrame, grid: dict, side='entry', cells=1 << 18):
+    """
+    Signals of every point of ``grid``.
+    :param side: 'entry' (``sweep_entry``) or 'exit' (``sweep_exit``)
+    :param cells: Points x candles evaluated at once, keeps the temporary arrays in cache
+    :return: (points as name -> array, boolean (points x candles) signal matrix)
+    """
+    function = strategy.sweep_entry if side == 'entry' else strategy.sweep_exit
+    unknown = set(grid) - set(inspect.signature(function).parameters)
+    if unknown:
+        raise ValueError(f"{type(strategy).__name__}.{function.__name__} has no parameters {sorted(unknown)}")
+
+    points = grid_points(grid)
+    count = len(next(iter(points.values()))) if points else 1
+    # Parameters missing from the grid keep their current value
+    fixed = {
+        name: getattr(strategy, name).value
+        for name in inspect.signature(function).parameters
+        if name != 'dataframe' and name not in points
+    }
+    signals = np.zeros((count, len(dataframe)), dtype=bool)
+    chunk = max(1, cells // max(len(dataframe), 1))
+    for start in range(0, count, chunk):
+        part = {name: values[start:start + chunk] for name, values in points.items()}
+        signals[start:start + chunk] = function(dataframe, **part, **fixed)
+    return points, signals
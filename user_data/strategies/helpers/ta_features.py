@@ -0,0 +1,280 @@
+"""
+Lazy replacement for ``ta.add_all_ta_features``.
+
+``add_all_ta_features`` computes ~90 columns (PSAR, STC and the Ulcer index
+among the slow ones) although a GodStra genome only reads a handful of them.
+``FEATURES`` maps every column name produced by ``add_all_ta_features`` to the
+``ta`` indicator and method producing it, with the same windows, so
+``ta_features`` can compute only the requested names. Results are memoised
+per pair and candles in a ``GeneCache``; indicators shared by several columns
+(Bollinger bands, Ichimoku, ...) are built once per call.
+"""
+
+import numpy as np
+from pandas import DataFrame
+from ta.momentum import (
+    AwesomeOscillatorIndicator,
+    KAMAIndicator,
+    PercentagePriceOscillator,
+    PercentageVolumeOscillator,
+    ROCIndicator,
+    RSIIndicator,
+    StochasticOscillator,
+    StochRSIIndicator,
+    TSIIndicator,
+    UltimateOscillator,
+    WilliamsRIndicator,
+)
+from ta.others import (
+    CumulativeReturnIndicator,
+    DailyLogReturnIndicator,
+    DailyReturnIndicator,
+)
+from ta.trend import (
+    MACD,
+    ADXIndicator,
+    AroonIndicator,
+    CCIIndicator,
+    DPOIndicator,
+    EMAIndicator,
+    IchimokuIndicator,
+    KSTIndicator,
+    MassIndex,
+    PSARIndicator,
+    SMAIndicator,
+    STCIndicator,
+    TRIXIndicator,
+    VortexIndicator,
+)
+from ta.volatility import (
+    AverageTrueRange,
+    BollingerBands,
+    DonchianChannel,
+    KeltnerChannel,
+    UlcerIndex,
+)
+from ta.volume import (
+    AccDistIndexIndicator,
+    ChaikinMoneyFlowIndicator,
+    EaseOfMovementIndicator,
+    ForceIndexIndicator,
+    MFIIndicator,
+    NegativeVolumeIndexIndicator,
+    OnBalanceVolumeIndicator,
+    VolumePriceTrendIndicator,
+    VolumeWeightedAveragePrice,
+)
+
+from .gene_cache import GeneCache
+
+# Same parameters as ta.wrapper.add_all_ta_features
+INDICATORS = {
+    # Volume
+    "adi": lambda df, fillna: AccDistIndexIndicator(
+        high=df["high"], low=df["low"], close=df["close"], volume=df["volume"], fillna=fillna),
+    "obv": lambda df, fillna: OnBalanceVolumeIndicator(
+        close=df["close"], volume=df["volume"], fillna=fillna),
+    "cmf": lambda df, fillna: ChaikinMoneyFlowIndicator(
+        high=df["high"], low=df["low"], close=df["close"], volume=df["volume"], fillna=fillna),
+    "fi": lambda df, fillna: ForceIndexIndicator(
+        close=df["close"], volume=df["volume"], window=13, fillna=fillna),
+    "eom": lambda df, fillna: EaseOfMovementIndicator(
+        high=df["high"], low=df["low"], volume=df["volume"], window=14, fillna=fillna),
+    "vpt": lambda df, fillna: VolumePriceTrendIndicator(
+        close=df["close"], volume=df["volume"], fillna=fillna),
+    "vwap": lambda df, fillna: VolumeWeightedAveragePrice(
+        high=df["high"], low=df["low"], close=df["close"], volume=df["volume"], window=14,
+        fillna=fillna),
+    "mfi": lambda df, fillna: MFIIndicator(
+        high=df["high"], low=df["low"], close=df["close"], volume=df["volume"], window=14,
+        fillna=fillna),
+    "nvi": lambda df, fillna: NegativeVolumeIndexIndicator(
+        close=df["close"], volume=df["volume"], fillna=fillna),
+    # Volatility
+    "bb": lambda df, fillna: BollingerBands(
+        close=df["close"], window=20, window_dev=2, fillna=fillna),
+    "kc": lambda df, fillna: KeltnerChannel(
+        close=df["close"], high=df["high"], low=df["low"], window=10, fillna=fillna),
+    "dc": lambda df, fillna: DonchianChannel(
+        high=df["high"], low=df["low"], close=df["close"], window=20, offset=0, fillna=fillna),
+    "atr": lambda df, fillna: AverageTrueRange(
+        close=df["close"], high=df["high"], low=df["low"], window=10, fillna=fillna),
+    "ui": lambda df, fillna: UlcerIndex(close=df["close"], window=14, fillna=fillna),
+    # Trend
+    "macd": lambda df, fillna: MACD(
+        close=df["close"], window_slow=26, window_fast=12, window_sign=9, fillna=fillna),
+    "sma_fast": lambda df, fillna: SMAIndicator(close=df["close"], window=12, fillna=fillna),
+    "sma_slow": lambda df, fillna: SMAIndicator(close=df["close"], window=26, fillna=fillna),
+    "ema_fast": lambda df, fillna: EMAIndicator(close=df["close"], window=12, fillna=fillna),
+    "ema_slow": lambda df, fillna: EMAIndicator(close=df["close"], window=26, fillna=fillna),
+    "vortex": lambda df, fillna: VortexIndicator(
+        high=df["high"], low=df["low"], close=df["close"], window=14, fillna=fillna),
+    "trix": lambda df, fillna: TRIXIndicator(close=df["close"], window=15, fillna=fillna),
+    "mass_index": lambda df, fillna: MassIndex(
+        high=df["high"], low=df["low"], window_fast=9, window_slow=25, fillna=fillna),
+    "dpo": lambda df, fillna: DPOIndicator(close=df["close"], window=20, fillna=fillna),
+    "kst": lambda df, fillna: KSTIndicator(
+        close=df["close"], roc1=10, roc2=15, roc3=20, roc4=30,
+        window1=10, window2=10, window3=10, window4=15, nsig=9, fillna=fillna),
+    "ichimoku": lambda df, fillna: IchimokuIndicator(
+        high=df["high"], low=df["low"], window1=9, window2=26, window3=52, visual=False,
+        fillna=fillna),
+    "stc": lambda df, fillna: STCIndicator(
+        close=df["close"], window_slow=50, window_fast=23, cycle=10, smooth1=3, smooth2=3,
+        fillna=fillna),
+    "adx": lambda df, fillna: ADXIndicator(
+        high=df["high"], low=df["low"], close=df["close"], window=14, fillna=fillna),
+    "cci": lambda df, fillna: CCIIndicator(
+        high=df["high"], low=df["low"], close=df["close"], window=20, constant=0.015,
+        fillna=fillna),
+    "visual_ichimoku": lambda df, fillna: IchimokuIndicator(
+        high=df["high"], low=df["low"], window1=9, window2=26, window3=52, visual=True,
+        fillna=fillna),
+    "aroon": lambda df, fillna: AroonIndicator(
+        high=df["high"], low=df["low"], window=25, fillna=fillna),
+    "psar": lambda df, fillna: PSARIndicator(
+        high=df["high"], low=df["low"], close=df["close"], step=0.02, max_step=0.20,
+        fillna=fillna),
+    # Momentum
+    "rsi": lambda df, fillna: RSIIndicator(close=df["close"], window=14, fillna=fillna),
+    "stoch_rsi": lambda df, fillna: StochRSIIndicator(
+        close=df["close"], window=14, smooth1=3, smooth2=3, fillna=fillna),
+    "tsi": lambda df, fillna: TSIIndicator(
+        close=df["close"], window_slow=25, window_fast=13, fillna=fillna),
+    "uo": lambda df, fillna: UltimateOscillator(
+        high=df["high"], low=df["low"], close=df["close"], window1=7, window2=14, window3=28,
+        weight1=4.0, weight2=2.0, weight3=1.0, fillna=fillna),
+    "stoch": lambda df, fillna: StochasticOscillator(
+        high=df["high"], low=df["low"], close=df["close"], window=14, smooth_window=3,
+        fillna=fillna),
+    "wr": lambda df, fillna: WilliamsRIndicator(
+        high=df["high"], low=df["low"], close=df["close"], lbp=14, fillna=fillna),
+    "ao": lambda df, fillna: AwesomeOscillatorIndicator(
+        high=df["high"], low=df["low"], window1=5, window2=34, fillna=fillna),
+    "roc": lambda df, fillna: ROCIndicator(close=df["close"], window=12, fillna=fillna),
+    "ppo": lambda df, fillna: PercentagePriceOscillator(
+        close=df["close"], window_slow=26, window_fast=12, window_sign=9, fillna=fillna),
+    "pvo": lambda df, fillna: PercentageVolumeOscillator(
+        volume=df["volume"], window_slow=26, window_fast=12, window_sign=9, fillna=fillna),
+    "kama": lambda df, fillna: KAMAIndicator(
+        close=df["close"], window=10, pow1=2, pow2=30, fillna=fillna),
+    # Others
+    "dr": lambda df, fillna: DailyReturnIndicator(close=df["close"], fillna=fillna),
+    "dlr": lambda df, fillna: DailyLogReturnIndicator(close=df["close"], fillna=fillna),
+    "cr": lambda df, fillna: CumulativeReturnIndicator(close=df["close"], fillna=fillna),
+}
+
+# column name -> (indicator, method)
+FEATURES = {
+    "volume_adi": ("adi", "acc_dist_index"),
+    "volume_obv": ("obv", "on_balance_volume"),
+    "volume_cmf": ("cmf", "chaikin_money_flow"),
+    "volume_fi": ("fi", "force_index"),
+    "volume_em": ("eom", "ease_of_movement"),
+    "volume_sma_em": ("eom", "sma_ease_of_movement"),
+    "volume_vpt": ("vpt", "volume_price_trend"),
+    "volume_vwap": ("vwap", "volume_weighted_average_price"),
+    "volume_mfi": ("mfi", "money_flow_index"),
+    "volume_nvi": ("nvi", "negative_volume_index"),
+    "volatility_bbm": ("bb", "bollinger_mavg"),
+    "volatility_bbh": ("bb", "bollinger_hband"),
+    "volatility_bbl": ("bb", "bollinger_lband"),
+    "volatility_bbw": ("bb", "bollinger_wband"),
+    "volatility_bbp": ("bb", "bollinger_pband"),
+    "volatility_bbhi": ("bb", "bollinger_hband_indicator"),
+    "volatility_bbli": ("bb", "bollinger_lband_indicator"),
+    "volatility_kcc": ("kc", "keltner_channel_mband"),
+    "volatility_kch": ("kc", "keltner_channel_hband"),
+    "volatility_kcl": ("kc", "keltner_channel_lband"),
+    "volatility_kcw": ("kc", "keltner_channel_wband"),
+    "volatility_kcp": ("kc", "keltner_channel_pband"),
+    "volatility_kchi": ("kc", "keltner_channel_hband_indicator"),
+    "volatility_kcli": ("kc", "keltner_channel_lband_indicator"),
+    "volatility_dcl": ("dc", "donchian_channel_lband"),
+    "volatility_dch": ("dc", "donchian_channel_hband"),
+    "volatility_dcm": ("dc", "donchian_channel_mband"),
+    "volatility_dcw": ("dc", "donchian_channel_wband"),
+    "volatility_dcp": ("dc", "donchian_channel_pband"),
+    "volatility_atr": ("atr", "average_true_range"),
+    "volatility_ui": ("ui", "ulcer_index"),
+    "trend_macd": ("macd", "macd"),
+    "trend_macd_signal": ("macd", "macd_signal"),
+    "trend_macd_diff": ("macd", "macd_diff"),
+    "trend_sma_fast": ("sma_fast", "sma_indicator"),
+    "trend_sma_slow": ("sma_slow", "sma_indicator"),
+    "trend_ema_fast": ("ema_fast", "ema_indicator"),
+    "trend_ema_slow": ("ema_slow", "ema_indicator"),
+    "trend_vortex_ind_pos": ("vortex", "vortex_indicator_pos"),
+    "trend_vortex_ind_neg": ("vortex", "vortex_indicator_neg"),
+    "trend_vortex_ind_diff": ("vortex", "vortex_indicator_diff"),
+    "trend_trix": ("trix", "trix"),
+    "trend_mass_index": ("mass_index", "mass_index"),
+    "trend_dpo": ("dpo", "dpo"),
+    "trend_kst": ("kst", "kst"),
+    "trend_kst_sig": ("kst", "kst_sig"),
+    "trend_kst_diff": ("kst", "kst_diff"),
+    "trend_ichimoku_conv": ("ichimoku", "ichimoku_conversion_line"),
+    "trend_ichimoku_base": ("ichimoku", "ichimoku_base_line"),
+    "trend_ichimoku_a": ("ichimoku", "ichimoku_a"),
+    "trend_ichimoku_b": ("ichimoku", "ichimoku_b"),
+    "trend_stc": ("stc", "stc"),
+    "trend_adx": ("adx", "adx"),
+    "trend_adx_pos": ("adx", "adx_pos"),
+    "trend_adx_neg": ("adx", "adx_neg"),
+    "trend_cci": ("cci", "cci"),
+    "trend_visual_ichimoku_a": ("visual_ichimoku", "ichimoku_a"),
+    "trend_visual_ichimoku_b": ("visual_ichimoku", "ichimoku_b"),
+    "trend_aroon_up": ("aroon", "aroon_up"),
+    "trend_aroon_down": ("aroon", "aroon_down"),
+    "trend_aroon_ind": ("aroon", "aroon_indicator"),
+    "trend_psar_up": ("psar", "psar_up"),
+    "trend_psar_down": ("psar", "psar_down"),
+    "trend_psar_up_indicator": ("psar", "psar_up_indicator"),
+    "trend_psar_down_indicator": ("psar", "psar_down_indicator"),
+    "momentum_rsi": ("rsi", "rsi"),
+    "momentum_stoch_rsi": ("stoch_rsi", "stochrsi"),
+    "momentum_stoch_rsi_k": ("stoch_rsi", "stochrsi_k"),
+    "momentum_stoch_rsi_d": ("stoch_rsi", "stochrsi_d"),
+    "momentum_tsi": ("tsi", "tsi"),
+    "momentum_uo": ("uo", "ultimate_oscillator"),
+    "momentum_stoch": ("stoch", "stoch"),
+    "momentum_stoch_signal": ("stoch", "stoch_signal"),
+    "momentum_wr": ("wr", "williams_r"),
+    "momentum_ao": ("ao", "awesome_oscillator"),
+    "momentum_roc": ("roc", "roc"),
+    "momentum_ppo": ("ppo", "ppo"),
+    "momentum_ppo_signal": ("ppo", "ppo_signal"),
+    "momentum_ppo_hist": ("ppo", "ppo_hist"),
+    "momentum_pvo": ("pvo", "pvo"),
+    "momentum_pvo_signal": ("pvo", "pvo_signal"),
+    "momentum_pvo_hist": ("pvo", "pvo_hist"),
+    "momentum_kama": ("kama", "kama"),
+    "others_dr": ("dr", "daily_return"),
+    "others_dlr": ("dlr", "daily_log_return"),
+    "others_cr": ("cr", "cumulative_return"),
+}
+
+CACHE = GeneCache(max_bytes=256 * 1024 * 1024)
+
+
+def ta_features(dataframe: DataFrame, names, pair=None, fillna=True, cache=CACHE) -> dict:
+    """
+    Compute the given ``add_all_ta_features`` columns.
+    Names that already are dataframe columns (e.g. 'close') are returned as they are.
+    :return: dict of name -> float array
+    """
+    indicators = {}
+
+    def compute(name):
+        indicator, method = FEATURES[name]
+        if indicator not in indicators:
+            indicators[indicator] = INDICATORS[indicator](dataframe, fillna)
+        return getattr(indicators[indicator], method)()
+
+    features = {}
+    for name in names:
+        if name in dataframe.columns:
+            features[name] = dataframe[name].to_numpy(dtype=np.float64)
+        elif name not in features:
+            features[name] = cache.get(pair, dataframe, (name, fillna), lambda: compute(name))
+    return features
@@ -0,0 +1,66 @@
+"""
+TD Sequential setup counts and perfection checks.
+
+Source:
+https://hackernoon.com/how-to-buy-sell-cryptocurrency-with-number-indicator-td-sequential-5af46f0ebce1
+
+Everything is computed with whole-array operations, so any strategy can use
+TD counts without walking the dataframe row by row.
+"""
+
+import numpy as np
+
+
+def consecutive_count(condition) -> np.ndarray:
+    """
+    Number of consecutive candles (including the current one) for which
+    ``condition`` holds, 0 where it does not.
+    """
+    condition = np.asarray(condition, dtype=bool)
+    index = np.arange(len(condition))
+    last_break = np.maximum.accumulate(np.where(condition, -1, index))
+    return np.where(condition, index - last_break, 0)
+
+
+def td_buy_setup(close, lookback=4) -> np.ndarray:
+    """Count consecutive closes "lower" than the close ``lookback`` bars prior"""
+    close = np.asarray(close, dtype=np.float64)
+    lower = np.zeros(len(close), dtype=bool)
+    lower[lookback:] = close[lookback:] < close[:-lookback]
+    return consecutive_count(lower)
+
+
+def td_sell_setup(close, lookback=4) -> np.ndarray:
+    """Count consecutive closes "higher" than the close ``lookback`` bars prior"""
+    close = np.asarray(close, dtype=np.float64)
+    higher = np.zeros(len(close), dtype=bool)
+    higher[lookback:] = close[lookback:] > close[:-lookback]
+    return consecutive_count(higher)
+
+
+def td_perfection(count, prices, below=True) -> np.ndarray:
+    """
+    Check if the prices of bars 6 and 7 in the count are exceeded by bars 8 or 9.
+    Bars past 9 keep comparing against bars 6 and 7 of their own setup.
+    :param count: Setup count, see ``td_buy_setup``/``td_sell_setup``
+    :param prices: Lows for a buy setup, highs for a sell setup
+    :param below: True to check for lower prices (buy), False for higher (sell)
+    :return: Boolean array, True on perfected bars
+    """
+    count = np.asarray(count)
+    prices = np.asarray(prices, dtype=np.float64)
+    active = count >= 8
+    index = np.arange(len(prices))
+    bar_6 = np.where(active, index - count + 6, 0)
+    bar_7 = np.where(active, index - count + 7, 0)
+
+    if below:
+        exceed = (prices < prices[bar_6]) | (prices < prices[bar_7])
+    else:
+        exceed = (prices > prices[bar_6]) | (prices > prices[bar_7])
+    exceed &= active
+
+    # Bar 9 is perfected as well if bar 8 already was
+    exceed_8 = np.zeros(len(prices), dtype=bool)
+    exceed_8[1:] = exceed[:-1]
+    return exceed | ((count == 9) & exceed_8)
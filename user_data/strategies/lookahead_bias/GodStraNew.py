@@ -6,6 +6,8 @@
 from freqtrade import data
 from freqtrade.strategy import CategoricalParameter, DecimalParameter
 
+import sys
+from pathlib import Path
 from numpy.lib import math
 from freqtrade.strategy import IStrategy
 from pandas import DataFrame
@@ -15,10 +17,12 @@ from pandas import DataFrame
 # Add your lib to import here
 # TODO: talib is fast but have not more indicators
 import talib.abstract as ta
-import freqtrade.vendor.qtpylib.indicators as qtpylib
-from functools import reduce
-import numpy as np
 from random import shuffle
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from helpers.conditions import compile_conditions  # noqa: E402
+from helpers.gene_cache import GeneCache  # noqa: E402
+from helpers.normalize import CausalNormalizer  # noqa: E402
 #  TODO: this gene is removed 'MAVP' cuz or error on periods
 all_god_genes = {
     'Overlap Studies': {
@@ -230,6 +234,10 @@ operators = [
 # number of candles to check up,don,off trend.
 TREND_CHECK_CANDLES = 4
 DECIMALS = 1
+# memory budget of the computed genes cache (per process)
+GENE_CACHE_MB = 512
+# candles the genes are normalized over (None: all past candles)
+NORMALIZE_WINDOW = None
 ########################### END SETTINGS ##########################
 # DATAFRAME = DataFrame()
 
@@ -252,12 +260,17 @@ if len(operators) == 1:
     operators = operators*2
 
 
-def normalize(df):
-    df = (df-df.min())/(df.max()-df.min())
-    return df
+GENE_CACHE = GeneCache(max_bytes=GENE_CACHE_MB * 1024 * 1024)
+NORMALIZER = CausalNormalizer(window=NORMALIZE_WINDOW)
+
 
+def normalize(df, dates, pair=None, indicator=None):
+    # Only past candles are used, per pair new candles extend the previous state
+    key = (pair, indicator) if pair is not None else None
+    return NORMALIZER.normalize(key, dates, df)
 
-def gene_calculator(dataframe, indicator):
+
+def gene_calculator(dataframe, indicator, pair=None):
     # Cuz Timeperiods not effect calculating CDL patterns recognations
     if 'CDL' in indicator:
         splited_indicator = indicator.split('-')
@@ -266,195 +279,83 @@ def gene_calculator(dataframe, indicator):
         # print(indicator, new_indicator)
         indicator = new_indicator
 
+    # Every gene is computed once per pair and candles, see helpers/gene_cache.py
+    return GENE_CACHE.get(
+        pair, dataframe, indicator,
+        lambda: calculate_gene(dataframe, indicator, pair)
+    )
+
+
+def calculate_gene(dataframe, indicator, pair=None):
     gene = indicator.split("-")
 
     gene_name = gene[0]
     gene_len = len(gene)
 
-    if indicator in dataframe.keys():
-        # print(f"{indicator}, calculated befoure")
-        # print(len(dataframe.keys()))
-        return dataframe[indicator]
-    else:
-        result = None
-        # For Pattern Recognations
-        if gene_len == 1:
-            # print('gene_len == 1\t', indicator)
-            result = getattr(ta, gene_name)(
-                dataframe
-            )
-            return normalize(result)
-        elif gene_len == 2:
-            # print('gene_len == 2\t', indicator)
-            gene_timeperiod = int(gene[1])
-            result = getattr(ta, gene_name)(
-                dataframe,
-                timeperiod=gene_timeperiod,
-            )
-            return normalize(result)
-        # For
-        elif gene_len == 3:
-            # print('gene_len == 3\t', indicator)
-            gene_timeperiod = int(gene[2])
-            gene_index = int(gene[1])
-            result = getattr(ta, gene_name)(
-                dataframe,
-                timeperiod=gene_timeperiod,
-            ).iloc[:, gene_index]
-            return normalize(result)
-        # For trend operators(MA-5-SMA-4)
-        elif gene_len == 4:
-            # print('gene_len == 4\t', indicator)
-            gene_timeperiod = int(gene[1])
-            sharp_indicator = f'{gene_name}-{gene_timeperiod}'
-            dataframe[sharp_indicator] = getattr(ta, gene_name)(
-                dataframe,
-                timeperiod=gene_timeperiod,
-            )
-            return normalize(ta.SMA(dataframe[sharp_indicator].fillna(0), TREND_CHECK_CANDLES))
-        # For trend operators(STOCH-0-4-SMA-4)
-        elif gene_len == 5:
-            # print('gene_len == 5\t', indicator)
-            gene_timeperiod = int(gene[2])
-            gene_index = int(gene[1])
-            sharp_indicator = f'{gene_name}-{gene_index}-{gene_timeperiod}'
-            dataframe[sharp_indicator] = getattr(ta, gene_name)(
-                dataframe,
-                timeperiod=gene_timeperiod,
-            ).iloc[:, gene_index]
-            return normalize(ta.SMA(dataframe[sharp_indicator].fillna(0), TREND_CHECK_CANDLES))
-
-
-def condition_generator(dataframe, operator, indicator, crossed_indicator, real_num):
-
-    condition = (dataframe['volume'] > 10)
-
-    # TODO : it ill callculated in populate indicators.
-
-    dataframe[indicator] = gene_calculator(dataframe, indicator)
-    dataframe[crossed_indicator] = gene_calculator(
-        dataframe, crossed_indicator)
-
-    indicator_trend_sma = f"{indicator}-SMA-{TREND_CHECK_CANDLES}"
-    if operator in ["UT", "DT", "OT", "CUT", "CDT", "COT"]:
-        dataframe[indicator_trend_sma] = gene_calculator(
-            dataframe, indicator_trend_sma)
-
-    if operator == ">":
-        condition = (
-            dataframe[indicator] > dataframe[crossed_indicator]
-        )
-    elif operator == "=":
-        condition = (
-            np.isclose(dataframe[indicator], dataframe[crossed_indicator])
-        )
-    elif operator == "<":
-        condition = (
-            dataframe[indicator] < dataframe[crossed_indicator]
-        )
-    elif operator == "C":
-        condition = (
-            (qtpylib.crossed_below(dataframe[indicator], dataframe[crossed_indicator])) |
-            (qtpylib.crossed_above(
-                dataframe[indicator], dataframe[crossed_indicator]))
-        )
-    elif operator == "CA":
-        condition = (
-            qtpylib.crossed_above(
-                dataframe[indicator], dataframe[crossed_indicator])
-        )
-    elif operator == "CB":
-        condition = (
-            qtpylib.crossed_below(
-                dataframe[indicator], dataframe[crossed_indicator])
-        )
-    elif operator == ">R":
-        condition = (
-            dataframe[indicator] > real_num
+    result = None
+    # For Pattern Recognations
+    if gene_len == 1:
+        # print('gene_len == 1\t', indicator)
+        result = getattr(ta, gene_name)(
+            dataframe
         )
-    elif operator == "=R":
-        condition = (
-            np.isclose(dataframe[indicator], real_num)
-        )
-    elif operator == "<R":
-        condition = (
-            dataframe[indicator] < real_num
-        )
-    elif operator == "/>R":
-        condition = (
-            dataframe[indicator].div(dataframe[crossed_indicator]) > real_num
-        )
-    elif operator == "/=R":
-        condition = (
-            np.isclose(dataframe[indicator].div(
-                dataframe[crossed_indicator]), real_num)
+        return normalize(result, dataframe['date'], pair, indicator)
+    elif gene_len == 2:
+        # print('gene_len == 2\t', indicator)
+        gene_timeperiod = int(gene[1])
+        result = getattr(ta, gene_name)(
+            dataframe,
+            timeperiod=gene_timeperiod,
         )
-    elif operator == "/<R":
-        condition = (
-            dataframe[indicator].div(dataframe[crossed_indicator]) < real_num
+        return normalize(result, dataframe['date'], pair, indicator)
+    # For
+    elif gene_len == 3:
+        # print('gene_len == 3\t', indicator)
+        gene_timeperiod = int(gene[2])
+        gene_index = int(gene[1])
+        result = getattr(ta, gene_name)(
+            dataframe,
+            timeperiod=gene_timeperiod,
+        ).iloc[:, gene_index]
+        return normalize(result, dataframe['date'], pair, indicator)
+    # For trend operators(MA-5-SMA-4)
+    elif gene_len == 4:
+        # print('gene_len == 4\t', indicator)
+        gene_timeperiod = int(gene[1])
+        sharp_indicator = getattr(ta, gene_name)(
+            dataframe,
+            timeperiod=gene_timeperiod,
         )
-    elif operator == "UT":
-        condition = (
-            dataframe[indicator] > dataframe[indicator_trend_sma]
+        return normalize(
+            ta.SMA(sharp_indicator.fillna(0), TREND_CHECK_CANDLES),
+            dataframe['date'], pair, indicator
         )
-    elif operator == "DT":
-        condition = (
-            dataframe[indicator] < dataframe[indicator_trend_sma]
+    # For trend operators(STOCH-0-4-SMA-4)
+    elif gene_len == 5:
+        # print('gene_len == 5\t', indicator)
+        gene_timeperiod = int(gene[2])
+        gene_index = int(gene[1])
+        sharp_indicator = getattr(ta, gene_name)(
+            dataframe,
+            timeperiod=gene_timeperiod,
+        ).iloc[:, gene_index]
+        return normalize(
+            ta.SMA(sharp_indicator.fillna(0), TREND_CHECK_CANDLES),
+            dataframe['date'], pair, indicator
         )
-    elif operator == "OT":
-        condition = (
 
-            np.isclose(dataframe[indicator], dataframe[indicator_trend_sma])
-        )
-    elif operator == "CUT":
-        condition = (
-            (
-                qtpylib.crossed_above(
-                    dataframe[indicator],
-                    dataframe[indicator_trend_sma]
-                )
-            ) &
-            (
-                dataframe[indicator] > dataframe[indicator_trend_sma]
-            )
-        )
-    elif operator == "CDT":
-        condition = (
-            (
-                qtpylib.crossed_below(
-                    dataframe[indicator],
-                    dataframe[indicator_trend_sma]
-                )
-            ) &
-            (
-                dataframe[indicator] < dataframe[indicator_trend_sma]
-            )
-        )
-    elif operator == "COT":
-        condition = (
-            (
-                (
-                    qtpylib.crossed_below(
-                        dataframe[indicator],
-                        dataframe[indicator_trend_sma]
-                    )
-                ) |
-                (
-                    qtpylib.crossed_above(
-                        dataframe[indicator],
-                        dataframe[indicator_trend_sma]
-                    )
-                )
-            ) &
-            (
-                np.isclose(
-                    dataframe[indicator],
-                    dataframe[indicator_trend_sma]
-                )
-            )
-        )
 
-    return condition, dataframe
+def conditions_mask(dataframe, clauses, pair=None):
+    # Clauses are compiled once per genome, see helpers/conditions.py
+    plan = compile_conditions(clauses, TREND_CHECK_CANDLES)
+    if not plan:
+        return None
+    arrays = {
+        name: dataframe['volume'].to_numpy() if name == 'volume'
+        else gene_calculator(dataframe, name, pair)
+        for name in plan.columns
+    }
+    return plan.evaluate(arrays)
 
 
 class GodStraNew(IStrategy):
@@ -542,103 +443,34 @@ class GodStraNew(IStrategy):
 
     def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
 
-        conditions = list()
-
-        # TODO: Its not dry code!
-        buy_indicator = self.buy_indicator0.value
-        buy_crossed_indicator = self.buy_crossed_indicator0.value
-        buy_operator = self.buy_operator0.value
-        buy_real_num = self.buy_real_num0.value
-        condition, dataframe = condition_generator(
-            dataframe,
-            buy_operator,
-            buy_indicator,
-            buy_crossed_indicator,
-            buy_real_num
-        )
-        conditions.append(condition)
-        # backup
-        buy_indicator = self.buy_indicator1.value
-        buy_crossed_indicator = self.buy_crossed_indicator1.value
-        buy_operator = self.buy_operator1.value
-        buy_real_num = self.buy_real_num1.value
-
-        condition, dataframe = condition_generator(
-            dataframe,
-            buy_operator,
-            buy_indicator,
-            buy_crossed_indicator,
-            buy_real_num
-        )
-        conditions.append(condition)
-
-        buy_indicator = self.buy_indicator2.value
-        buy_crossed_indicator = self.buy_crossed_indicator2.value
-        buy_operator = self.buy_operator2.value
-        buy_real_num = self.buy_real_num2.value
-        condition, dataframe = condition_generator(
-            dataframe,
-            buy_operator,
-            buy_indicator,
-            buy_crossed_indicator,
-            buy_real_num
+        clauses = tuple(
+            (
+                getattr(self, f'buy_operator{i}').value,
+                getattr(self, f'buy_indicator{i}').value,
+                getattr(self, f'buy_crossed_indicator{i}').value,
+                getattr(self, f'buy_real_num{i}').value,
+            )
+            for i in range(3)
         )
-        conditions.append(condition)
+        mask = conditions_mask(dataframe, clauses, metadata['pair'])
+        if mask is not None:
+            dataframe.loc[mask, 'enter_long'] = 1
 
-        if conditions:
-            dataframe.loc[
-                reduce(lambda x, y: x & y, conditions),
-                'enter_long']=1
-
-        # print(len(dataframe.keys()))
 
         return dataframe
 
     def populate_exit_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
 
-        conditions = list()
-        # TODO: Its not dry code!
-        sell_indicator = self.sell_indicator0.value
-        sell_crossed_indicator = self.sell_crossed_indicator0.value
-        sell_operator = self.sell_operator0.value
-        sell_real_num = self.sell_real_num0.value
-        condition, dataframe = condition_generator(
-            dataframe,
-            sell_operator,
-            sell_indicator,
-            sell_crossed_indicator,
-            sell_real_num
-        )
-        conditions.append(condition)
-
-        sell_indicator = self.sell_indicator1.value
-        sell_crossed_indicator = self.sell_crossed_indicator1.value
-        sell_operator = self.sell_operator1.value
-        sell_real_num = self.sell_real_num1.value
-        condition, dataframe = condition_generator(
-            dataframe,
-            sell_operator,
-            sell_indicator,
-            sell_crossed_indicator,
-            sell_real_num
-        )
-        conditions.append(condition)
-
-        sell_indicator = self.sell_indicator2.value
-        sell_crossed_indicator = self.sell_crossed_indicator2.value
-        sell_operator = self.sell_operator2.value
-        sell_real_num = self.sell_real_num2.value
-        condition, dataframe = condition_generator(
-            dataframe,
-            sell_operator,
-            sell_indicator,
-            sell_crossed_indicator,
-            sell_real_num
+        clauses = tuple(
+            (
+                getattr(self, f'sell_operator{i}').value,
+                getattr(self, f'sell_indicator{i}').value,
+                getattr(self, f'sell_crossed_indicator{i}').value,
+                getattr(self, f'sell_real_num{i}').value,
+            )
+            for i in range(3)
         )
-        conditions.append(condition)
-
-        if conditions:
-            dataframe.loc[
-                reduce(lambda x, y: x & y, conditions),
-                'exit_long']=1
+        mask = conditions_mask(dataframe, clauses, metadata['pair'])
+        if mask is not None:
+            dataframe.loc[mask, 'exit_long'] = 1
         return dataframe
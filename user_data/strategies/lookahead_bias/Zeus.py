@@ -19,8 +19,16 @@ import pandas as pd
 import ta
 from ta.utils import dropna
 import freqtrade.vendor.qtpylib.indicators as qtpylib
-from functools import reduce
 import numpy as np
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from helpers.normalize import CausalNormalizer  # noqa: E402
+from helpers.sweep import on_points  # noqa: E402
+
+# Min/max of past candles only, new candles extend the state of their pair
+NORMALIZER = CausalNormalizer()
 
 
 class Zeus(IStrategy):
@@ -97,52 +105,38 @@ class Zeus(IStrategy):
         dataframe['trend_kst_diff'] = KST.kst_diff()
 
         # Normalization
-        tib = dataframe['trend_ichimoku_base']
-        dataframe['trend_ichimoku_base'] = (
-            tib-tib.min())/(tib.max()-tib.min())
-        tkd = dataframe['trend_kst_diff']
-        dataframe['trend_kst_diff'] = (tkd-tkd.min())/(tkd.max()-tkd.min())
+        for column in ('trend_ichimoku_base', 'trend_kst_diff'):
+            dataframe[column] = NORMALIZER.normalize(
+                (metadata['pair'], column), dataframe['date'], dataframe[column])
         return dataframe
 
     def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        conditions = []
-        IND = 'trend_ichimoku_base'
-        REAL = self.buy_real.value
-        OPR = self.buy_cat.value
-        DFIND = dataframe[IND]
-        # print(DFIND.mean())
-        if OPR == ">R":
-            conditions.append(DFIND > REAL)
-        elif OPR == "=R":
-            conditions.append(np.isclose(DFIND, REAL))
-        elif OPR == "<R":
-            conditions.append(DFIND < REAL)
-
-        if conditions:
-            dataframe.loc[
-                reduce(lambda x, y: x & y, conditions),
-                'enter_long'] = 1
+        dataframe.loc[
+            self.sweep_entry(dataframe, self.buy_cat.value, self.buy_real.value),
+            'enter_long'] = 1
 
         return dataframe
 
     def populate_exit_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        conditions = []
-        IND = 'trend_kst_diff'
-        REAL = self.sell_real.value
-        OPR = self.sell_cat.value
-        DFIND = dataframe[IND]
-        # print(DFIND.mean())
-
-        if OPR == ">R":
-            conditions.append(DFIND > REAL)
-        elif OPR == "=R":
-            conditions.append(np.isclose(DFIND, REAL))
-        elif OPR == "<R":
-            conditions.append(DFIND < REAL)
-
-        if conditions:
-            dataframe.loc[
-                reduce(lambda x, y: x & y, conditions),
-                'exit_long'] = 1
+        dataframe.loc[
+            self.sweep_exit(dataframe, self.sell_cat.value, self.sell_real.value),
+            'exit_long'] = 1
 
         return dataframe
+
+    @staticmethod
+    def compare(indicator, category, real):
+        """``indicator`` against ``real`` with the operator of ``category`` (">R", "=R" or "<R")"""
+        category, real = on_points(category), on_points(real)
+        return (
+            ((category == ">R") & (indicator > real)) |
+            ((category == "=R") & np.isclose(indicator, real)) |
+            ((category == "<R") & (indicator < real))
+        )
+
+    # Parameters are single values or one value per grid point, see helpers/sweep.py
+    def sweep_entry(self, dataframe: DataFrame, buy_cat, buy_real):
+        return self.compare(dataframe['trend_ichimoku_base'].to_numpy(dtype=np.float64), buy_cat, buy_real)
+
+    def sweep_exit(self, dataframe: DataFrame, sell_cat, sell_real):
+        return self.compare(dataframe['trend_kst_diff'].to_numpy(dtype=np.float64), sell_cat, sell_real)
@@ -8,8 +8,6 @@
 # request to making this strategy.
 # hope you enjoy and get profit
 # Author: @Mablue (Masoud Azizi)
-# IMPORTANT: install sklearn befoure you run this strategy:
-# pip install sklearn
 # github: https://github.com/mablue/
 # freqtrade hyperopt --hyperopt-loss SharpeHyperOptLoss --spaces buy sell --strategy wtc
 
@@ -22,10 +20,17 @@ from pandas import DataFrame
 # --- Do not remove these libs ---
 import numpy as np  # noqa
 import pandas as pd  # noqa
-from sklearn import preprocessing
 
 # --------------------------------
 # Add your lib to import here
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from helpers.normalize import CausalNormalizer  # noqa: E402
+
+# Min/max of past candles only, new candles extend the state of their pair
+NORMALIZER = CausalNormalizer()
 
 
 class wtc(IStrategy):
@@ -116,11 +121,9 @@ class wtc(IStrategy):
             stoch = ta.STOCH(dataframe, 14)
             slowk = stoch['slowk']
             dataframe['slowk'] = slowk
-            # print(dataframe.iloc[:, 6:].keys())
-            x = dataframe.iloc[:, 6:].values  # returns a numpy array
-            min_max_scaler = preprocessing.MinMaxScaler()
-            x_scaled = min_max_scaler.fit_transform(x)
-            dataframe.iloc[:, 6:] = pd.DataFrame(x_scaled)
+            for column in ('wt1', 'wt2', 'slowk'):
+                dataframe[column] = NORMALIZER.normalize(
+                    (metadata['pair'], column), dataframe['date'], dataframe[column])
             # print('wt:\t', dataframe['wt'].min(), dataframe['wt'].max())
             # print('stoch:\t', dataframe['stoch'].min(), dataframe['stoch'].max())
             dataframe['def'] = dataframe['slowk']-dataframe['wt1']
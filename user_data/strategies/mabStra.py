@@ -5,11 +5,12 @@
 
 # --- Do not remove these libs ---
 from freqtrade.strategy import IntParameter, DecimalParameter, IStrategy
-from pandas import DataFrame
+from pandas import DataFrame, concat
 # --------------------------------
 
 # Add your lib to import here
-import talib.abstract as ta
+from helpers.ma_bank import MaBlock, sma_block
+from helpers.sweep import columns, on_points
 
 
 class mabStra(IStrategy):
@@ -48,50 +49,58 @@ class mabStra(IStrategy):
     sell_div_min = DecimalParameter(
         0, 2, decimals=4, default=2.81436, space='sell')
 
+    def ma_parameters(self):
+        return (self.buy_mojo_ma_timeframe, self.buy_fast_ma_timeframe, self.buy_slow_ma_timeframe,
+                self.sell_mojo_ma_timeframe, self.sell_fast_ma_timeframe, self.sell_slow_ma_timeframe)
+
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        # SMA - ex Moving Average
-        dataframe['buy-mojoMA'] = ta.SMA(dataframe,
-                                         timeperiod=self.buy_mojo_ma_timeframe.value)
-        dataframe['buy-fastMA'] = ta.SMA(dataframe,
-                                         timeperiod=self.buy_fast_ma_timeframe.value)
-        dataframe['buy-slowMA'] = ta.SMA(dataframe,
-                                         timeperiod=self.buy_slow_ma_timeframe.value)
-        dataframe['sell-mojoMA'] = ta.SMA(dataframe,
-                                          timeperiod=self.sell_mojo_ma_timeframe.value)
-        dataframe['sell-fastMA'] = ta.SMA(dataframe,
-                                          timeperiod=self.sell_fast_ma_timeframe.value)
-        dataframe['sell-slowMA'] = ta.SMA(dataframe,
-                                          timeperiod=self.sell_slow_ma_timeframe.value)
-        return dataframe
+        # SMA - ex Moving Average, one column per period any of the MAs may use
+        periods = sorted(set(period for parameter in self.ma_parameters() for period in parameter.range))
+        smas = MaBlock(sma_block, dataframe['close'], {f'sma_{period}': period for period in periods})
+        return concat([dataframe, smas.frame(dataframe)], axis=1)
 
     def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        dataframe['buy-mojoMA'] = dataframe[f'sma_{self.buy_mojo_ma_timeframe.value}']
+        dataframe['buy-fastMA'] = dataframe[f'sma_{self.buy_fast_ma_timeframe.value}']
+        dataframe['buy-slowMA'] = dataframe[f'sma_{self.buy_slow_ma_timeframe.value}']
 
         dataframe.loc[
-            (
-                (dataframe['buy-mojoMA'].div(dataframe['buy-fastMA'])
-                    > self.buy_div_min.value) &
-                (dataframe['buy-mojoMA'].div(dataframe['buy-fastMA'])
-                    < self.buy_div_max.value) &
-                (dataframe['buy-fastMA'].div(dataframe['buy-slowMA'])
-                    > self.buy_div_min.value) &
-                (dataframe['buy-fastMA'].div(dataframe['buy-slowMA'])
-                    < self.buy_div_max.value)
-            ),
+            self.sweep_entry(dataframe, self.buy_mojo_ma_timeframe.value, self.buy_fast_ma_timeframe.value,
+                             self.buy_slow_ma_timeframe.value, self.buy_div_min.value, self.buy_div_max.value),
             'enter_long'] = 1
 
         return dataframe
 
     def populate_exit_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        dataframe['sell-mojoMA'] = dataframe[f'sma_{self.sell_mojo_ma_timeframe.value}']
+        dataframe['sell-fastMA'] = dataframe[f'sma_{self.sell_fast_ma_timeframe.value}']
+        dataframe['sell-slowMA'] = dataframe[f'sma_{self.sell_slow_ma_timeframe.value}']
+
         dataframe.loc[
-            (
-                (dataframe['sell-fastMA'].div(dataframe['sell-mojoMA'])
-                    > self.sell_div_min.value) &
-                (dataframe['sell-fastMA'].div(dataframe['sell-mojoMA'])
-                    < self.sell_div_max.value) &
-                (dataframe['sell-slowMA'].div(dataframe['sell-fastMA'])
-                    > self.sell_div_min.value) &
-                (dataframe['sell-slowMA'].div(dataframe['sell-fastMA'])
-                    < self.sell_div_max.value)
-            ),
+            self.sweep_exit(dataframe, self.sell_mojo_ma_timeframe.value, self.sell_fast_ma_timeframe.value,
+                            self.sell_slow_ma_timeframe.value, self.sell_div_min.value, self.sell_div_max.value),
             'exit_long'] = 1
         return dataframe
+
+    # Parameters are single values or one value per grid point, see helpers/sweep.py
+    def sweep_entry(self, dataframe: DataFrame, buy_mojo_ma_timeframe, buy_fast_ma_timeframe,
+                    buy_slow_ma_timeframe, buy_div_min, buy_div_max):
+        mojo = columns(dataframe, buy_mojo_ma_timeframe, 'sma_{}')
+        fast = columns(dataframe, buy_fast_ma_timeframe, 'sma_{}')
+        slow = columns(dataframe, buy_slow_ma_timeframe, 'sma_{}')
+        div_min, div_max = on_points(buy_div_min), on_points(buy_div_max)
+        return (
+            (mojo / fast > div_min) & (mojo / fast < div_max) &
+            (fast / slow > div_min) & (fast / slow < div_max)
+        )
+
+    def sweep_exit(self, dataframe: DataFrame, sell_mojo_ma_timeframe, sell_fast_ma_timeframe,
+                   sell_slow_ma_timeframe, sell_div_min, sell_div_max):
+        mojo = columns(dataframe, sell_mojo_ma_timeframe, 'sma_{}')
+        fast = columns(dataframe, sell_fast_ma_timeframe, 'sma_{}')
+        slow = columns(dataframe, sell_slow_ma_timeframe, 'sma_{}')
+        div_min, div_max = on_points(sell_div_min), on_points(sell_div_max)
+        return (
+            (fast / mojo > div_min) & (fast / mojo < div_max) &
+            (slow / fast > div_min) & (slow / fast < div_max)
+        )